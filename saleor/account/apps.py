@@ -1,16 +1,35 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_delete
+from django.db.models.signals import m2m_changed, post_delete
 
 
 class AccountAppConfig(AppConfig):
     name = "saleor.account"
 
     def ready(self):
-        from .models import User
-        from .signals import delete_avatar
+        from .models import Group, User
+        from .signals import delete_avatar, invalidate_requestor_permissions
 
         post_delete.connect(
             delete_avatar,
             sender=User,
             dispatch_uid="delete_user_avatar",
         )
+        # permissions of the requestors are cached, see `core.requestor_cache`
+        for sender, dispatch_uid in [
+            (User.groups.through, "invalidate_permissions_on_user_groups_change"),
+            (
+                User.user_permissions.through,
+                "invalidate_permissions_on_user_permissions_change",
+            ),
+            (Group.permissions.through, "invalidate_permissions_on_group_change"),
+        ]:
+            m2m_changed.connect(
+                invalidate_requestor_permissions,
+                sender=sender,
+                dispatch_uid=dispatch_uid,
+            )
+        post_delete.connect(
+            invalidate_requestor_permissions,
+            sender=Group,
+            dispatch_uid="invalidate_permissions_on_group_delete",
+        )
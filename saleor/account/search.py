@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING
 
+from django.contrib.postgres.search import TrigramSimilarity
 from django.db.models import Q, Value, prefetch_related_objects
 
 from ..core.postgres import NoValidationSearchVector
@@ -113,3 +114,27 @@ def search_users(qs, value):
             lookup &= Q(search_document__ilike=val.lower())
         qs = qs.filter(lookup)
     return qs
+
+
+def autocomplete_users(qs, value: str, limit: int):
+    """Return users for as-you-type lookups by email or name prefixes.
+
+    Every word of the value has to be a prefix of the email, first name or last
+    name; the lookups are served by the `order_user_search_gin` trigram index.
+    Results are ordered by email similarity.
+    """
+    value = value.strip()
+    if not value:
+        return qs.none()
+    lookup = Q()
+    for val in value.split():
+        lookup &= (
+            Q(email__ilike_prefix=val)
+            | Q(first_name__ilike_prefix=val)
+            | Q(last_name__ilike_prefix=val)
+        )
+    return (
+        qs.filter(lookup)
+        .annotate(autocomplete_rank=TrigramSimilarity("email", value))
+        .order_by("-autocomplete_rank", "email")[:limit]
+    )
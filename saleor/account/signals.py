@@ -1,6 +1,17 @@
+from django.db import transaction
+
+from ..core.requestor_cache import bump_permissions_version
 from ..core.tasks import delete_from_storage_task
 
 
 def delete_avatar(sender, instance, **kwargs):
     if avatar := instance.avatar:
         delete_from_storage_task.delay(avatar.name)
+
+
+def invalidate_requestor_permissions(sender, **kwargs):
+    action = kwargs.get("action")
+    if action is None or action.startswith("post_"):
+        # bump after the commit, so the permissions read for the new version
+        # can't be the ones from before the change
+        transaction.on_commit(bump_permissions_version)
@@ -1,6 +1,20 @@
+import hashlib
+import hmac
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..core.utils.cache import ExpiringCacheDict
 from ..webhook.event_types import WebhookEventSyncType
 from ..webhook.utils import get_webhooks_for_event
 
+APP_TOKEN_CACHE_KEY = "verified_app_token:{digest}"
+# Per-process cache in front of the shared one, so steady traffic of an app
+# doesn't hit the cache backend either.
+_verified_app_tokens = ExpiringCacheDict(
+    capacity=1000, timeout=settings.APP_TOKEN_CACHE_TIMEOUT
+)
+
 
 def get_active_tax_apps(identifiers: list[str] | None = None):
     checkout_webhooks = get_webhooks_for_event(
@@ -16,3 +30,41 @@ def get_active_tax_apps(identifiers: list[str] | None = None):
     order_apps = {webhook.app for webhook in order_webhooks}
 
     return checkout_apps.union(order_apps)
+
+
+def get_app_token_digest(raw_token: str) -> str:
+    """Return a keyed hash of the raw app token.
+
+    The digest is cheap to compute, unlike the password hash stored in
+    `AppToken.auth_token`, and can't be used to authenticate on its own.
+    """
+    return hmac.new(
+        settings.SECRET_KEY.encode(), raw_token.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def get_verified_app_token_id(raw_token: str) -> int | None:
+    """Return the id of the `AppToken` previously verified for the raw token."""
+    digest = get_app_token_digest(raw_token)
+    token_id = _verified_app_tokens.get(digest)
+    if token_id is None:
+        token_id = cache.get(APP_TOKEN_CACHE_KEY.format(digest=digest))
+        if token_id is not None:
+            _verified_app_tokens.set(digest, token_id)
+    return token_id
+
+
+def set_verified_app_token_id(raw_token: str, token_id: int):
+    digest = get_app_token_digest(raw_token)
+    _verified_app_tokens.set(digest, token_id)
+    cache.set(
+        APP_TOKEN_CACHE_KEY.format(digest=digest),
+        token_id,
+        timeout=settings.APP_TOKEN_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_verified_app_token(raw_token: str):
+    digest = get_app_token_digest(raw_token)
+    _verified_app_tokens.delete(digest)
+    cache.delete(APP_TOKEN_CACHE_KEY.format(digest=digest))
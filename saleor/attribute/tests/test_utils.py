@@ -1,11 +1,12 @@
 import pytest
 
 from ...attribute.models import AssignedPageAttributeValue
-from ...product.models import ProductType
+from ...product.models import Product, ProductType, ProductVariant
 from .. import AttributeInputType, AttributeType
 from ..models import Attribute, AttributeValue
 from ..utils import (
     associate_attribute_values_to_instance,
+    associate_attribute_values_to_new_instances,
     validate_attribute_owns_values,
 )
 from .model_helpers import (
@@ -264,3 +265,87 @@ def test_validate_attribute_owns_values(attribute_1, attribute_2):
         attribute_1.id: [attribute_1.values.first()],
         attribute_2.id: [attribute_2.values.first()],
     }
+
+
+def test_associate_attribute_values_to_new_instances(
+    product_type, category, attribute_value_generator, django_assert_num_queries
+):
+    # given
+    attribute = product_type.product_attributes.first()
+    attribute_value_generator(attribute=attribute, slug="attr-value2")
+    values = list(attribute.values.all())
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"Product {i}",
+                slug=f"product-{i}",
+                product_type=product_type,
+                category=category,
+            )
+            for i in range(3)
+        ]
+    )
+
+    # when
+    with django_assert_num_queries(2):
+        associate_attribute_values_to_new_instances(
+            [
+                (products[0], {attribute.id: [values[1], values[0]]}),
+                (products[1], {attribute.id: [values[0]]}),
+                (products[2], {}),
+            ]
+        )
+
+    # then
+    assert list(products[0].attributevalues.values_list("value_id", "sort_order")) == [
+        (values[1].pk, 0),
+        (values[0].pk, 1),
+    ]
+    assert list(products[1].attributevalues.values_list("value_id", "sort_order")) == [
+        (values[0].pk, 0)
+    ]
+    assert not products[2].attributevalues.exists()
+
+
+def test_associate_attribute_values_to_new_variant_instances(
+    product, attribute_value_generator
+):
+    # given
+    attribute = product.product_type.variant_attributes.first()
+    attribute_value_generator(attribute=attribute, slug="attr-value2")
+    values = list(attribute.values.all())
+    variants = ProductVariant.objects.bulk_create(
+        [ProductVariant(product=product, sku=f"SKU_{i}") for i in range(2)]
+    )
+
+    # when
+    associate_attribute_values_to_new_instances(
+        [
+            (variants[0], {attribute.id: [values[0], values[1]]}),
+            (variants[1], {attribute.id: [values[1]]}),
+        ]
+    )
+
+    # then
+    first_assignment = variants[0].attributes.get()
+    assert list(
+        first_assignment.variantvalueassignment.values_list("value_id", "sort_order")
+    ) == [(values[0].pk, 0), (values[1].pk, 1)]
+    second_assignment = variants[1].attributes.get()
+    assert list(second_assignment.values.all()) == [values[1]]
+
+
+def test_associate_attribute_values_to_new_instances_from_different_attribute(
+    product, color_attribute, size_attribute
+):
+    # given
+    value = size_attribute.values.first()
+
+    # when
+    with pytest.raises(AssertionError) as exc:
+        associate_attribute_values_to_new_instances(
+            [(product, {color_attribute.id: [value]})]
+        )
+
+    # then
+    assert exc.value.args == ("Some values are not from the provided attribute.",)
@@ -50,6 +50,104 @@ def associate_attribute_values_to_instance(
     _associate_attribute_to_instance(instance, attr_val_map)
 
 
+def associate_attribute_values_to_new_instances(
+    instances_attr_val_maps: list[tuple[Product | ProductVariant, dict[int, list]]],
+):
+    """Assign given attribute values to multiple newly created products or variants.
+
+    The instances must not have any values assigned yet. The values are matched
+    with the database by attribute and slug with a single query for the whole batch,
+    and all assignments are inserted in bulk.
+    """
+    values_by_slug = _get_attribute_values_by_slug(
+        [attr_val_map for _, attr_val_map in instances_attr_val_maps]
+    )
+
+    variant_assignment_ids = _get_variant_attribute_assignment_ids(
+        [
+            instance
+            for instance, _ in instances_attr_val_maps
+            if isinstance(instance, ProductVariant)
+        ]
+    )
+    variant_attributes_to_create = []
+    values_to_assign = []
+    for instance, attr_val_map in instances_attr_val_maps:
+        for attribute_id, values in attr_val_map.items():
+            if isinstance(instance, ProductVariant):
+                assignment_id = variant_assignment_ids.get(
+                    (instance.product.product_type_id, attribute_id)
+                )
+                if assignment_id is None:
+                    continue
+                variant_attribute = AssignedVariantAttribute(
+                    variant=instance, assignment_id=assignment_id
+                )
+                variant_attributes_to_create.append(variant_attribute)
+            for sort_order, value in enumerate(values):
+                value = values_by_slug[attribute_id, value.slug]
+                if isinstance(instance, ProductVariant):
+                    values_to_assign.append(
+                        AssignedVariantAttributeValue(
+                            assignment=variant_attribute,
+                            value=value,
+                            sort_order=sort_order,
+                        )
+                    )
+                else:
+                    values_to_assign.append(
+                        AssignedProductAttributeValue(
+                            product=instance, value=value, sort_order=sort_order
+                        )
+                    )
+
+    AssignedVariantAttribute.objects.bulk_create(variant_attributes_to_create)
+    for model in [AssignedProductAttributeValue, AssignedVariantAttributeValue]:
+        model.objects.bulk_create(
+            [value for value in values_to_assign if isinstance(value, model)],
+            ignore_conflicts=True,
+        )
+
+
+def _get_attribute_values_by_slug(
+    attr_val_maps: list[dict[int, list]],
+) -> dict[tuple[int, str], AttributeValue]:
+    slugs_by_attribute = defaultdict(set)
+    for attr_val_map in attr_val_maps:
+        for attribute_id, values in attr_val_map.items():
+            slugs_by_attribute[attribute_id].update(value.slug for value in values)
+    if not slugs_by_attribute:
+        return {}
+
+    lookup = reduce(
+        lambda acc, item: acc | Q(attribute_id=item[0], slug__in=item[1]),
+        slugs_by_attribute.items(),
+        Q(),
+    )
+    values_by_slug = {
+        (value.attribute_id, value.slug): value
+        for value in AttributeValue.objects.filter(lookup)
+    }
+    for attribute_id, slugs in slugs_by_attribute.items():
+        if any((attribute_id, slug) not in values_by_slug for slug in slugs):
+            raise AssertionError("Some values are not from the provided attribute.")
+    return values_by_slug
+
+
+def _get_variant_attribute_assignment_ids(
+    variants: list[ProductVariant],
+) -> dict[tuple[int, int], int]:
+    product_type_ids = {variant.product.product_type_id for variant in variants}
+    if not product_type_ids:
+        return {}
+    return {
+        (product_type_id, attribute_id): pk
+        for pk, product_type_id, attribute_id in AttributeVariant.objects.filter(
+            product_type_id__in=product_type_ids
+        ).values_list("pk", "product_type_id", "attribute_id")
+    }
+
+
 def validate_attribute_owns_values(attr_val_map: dict[int, list]) -> None:
     if not attr_val_map:
         return
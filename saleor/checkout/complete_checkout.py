@@ -10,6 +10,7 @@ from django.conf import settings
 from django.contrib.sites.models import Site
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import prefetch_related_objects
 from django.forms.models import model_to_dict
 from django.utils import timezone
 from prices import Money, TaxedMoney
@@ -23,7 +24,7 @@ from ..checkout.error_codes import CheckoutErrorCode
 from ..core.exceptions import GiftCardNotApplicable, InsufficientStock
 from ..core.postgres import FlatConcatSearchVector
 from ..core.taxes import TaxDataError, TaxError, zero_taxed_money
-from ..core.tracing import traced_atomic_transaction
+from ..core.tracing import traced_atomic_transaction, traced_stage
 from ..core.transactions import transaction_with_commit_on_errors
 from ..core.utils.url import validate_storefront_url
 from ..discount import DiscountType, DiscountValueType, VoucherType
@@ -39,6 +40,7 @@ from ..order.fetch import OrderInfo, OrderLineInfo
 from ..order.models import Order, OrderLine
 from ..order.notifications import send_order_confirmation
 from ..order.search import prepare_order_search_vector_value
+from ..order.tasks import process_order_created_from_checkout_task
 from ..order.utils import (
     update_order_authorize_data,
     update_order_charge_data,
@@ -412,7 +414,8 @@ def _create_order_line_discounts(
     for discount in discounts:
         discount_data = model_to_dict(discount)
         discount_data.pop("line")
-        discount_data["promotion_rule_id"] = discount_data.pop("promotion_rule")
+        # reuse the prefetched rule, so resolving the sale id doesn't hit the database
+        discount_data["promotion_rule"] = discount.promotion_rule
         discount_data["line_id"] = order_line.pk
         line_discounts.append(OrderLineDiscount(**discount_data))
     return line_discounts
@@ -463,6 +466,11 @@ def _create_lines_for_order(
         for variant_translation in variants_translation
     }
 
+    # fetch the digital content of all digital variants in one query
+    prefetch_related_objects(
+        [variant for variant in variants if variant.is_digital()], "digital_content"
+    )
+
     additional_warehouse_lookup = (
         checkout_info.delivery_method_info.get_warehouse_filter_lookup()
     )
@@ -728,9 +736,7 @@ def _create_order(
 
     update_order_charge_data(order, with_save=False)
     update_order_authorize_data(order, with_save=False)
-    order.search_vector = FlatConcatSearchVector(
-        *prepare_order_search_vector_value(order)
-    )
+    _set_order_search_vector(order)
     order.save()
 
     order_info = OrderInfo(
@@ -740,6 +746,57 @@ def _create_order(
         payment=order.get_last_payment(),
         lines_data=order_lines_info,
     )
+    _call_order_created_actions(
+        order_info,
+        checkout.redirect_url,
+        user=user,
+        app=app,
+        manager=manager,
+        site_settings=site_settings,
+        is_automatic_completion=is_automatic_completion,
+    )
+
+    return order
+
+
+def _set_order_search_vector(order: "Order"):
+    # with deferred post-order actions the search vector is set in the background
+    if not settings.CHECKOUT_COMPLETE_DEFER_POST_ORDER_ACTIONS:
+        order.search_vector = FlatConcatSearchVector(
+            *prepare_order_search_vector_value(order)
+        )
+
+
+def _call_order_created_actions(
+    order_info: OrderInfo,
+    redirect_url: str | None,
+    *,
+    user: User | None,
+    app: Optional["App"],
+    manager: "PluginsManager",
+    site_settings: "SiteSettings",
+    is_automatic_completion: bool,
+):
+    """Run the actions of the created order once the transaction is committed.
+
+    When `CHECKOUT_COMPLETE_DEFER_POST_ORDER_ACTIONS` is enabled, the actions run
+    in a single background task instead, in the same order: the search vector
+    update, the order events and webhooks, and the order confirmation.
+    """
+    if settings.CHECKOUT_COMPLETE_DEFER_POST_ORDER_ACTIONS:
+        order_id = str(order_info.order.pk)
+        user_id = user.pk if user else None
+        app_id = app.pk if app else None
+        transaction.on_commit(
+            lambda: process_order_created_from_checkout_task.delay(
+                order_id=order_id,
+                user_id=user_id,
+                app_id=app_id,
+                redirect_url=redirect_url,
+                is_automatic_completion=is_automatic_completion,
+            )
+        )
+        return
 
     transaction.on_commit(
         lambda: order_created(
@@ -754,11 +811,9 @@ def _create_order(
 
     # Send the order confirmation email
     transaction.on_commit(
-        lambda: send_order_confirmation(order_info, checkout.redirect_url, manager)
+        lambda: send_order_confirmation(order_info, redirect_url, manager)
     )
 
-    return order
-
 
 def _prepare_checkout(
     manager: "PluginsManager",
@@ -1200,22 +1255,14 @@ def _post_create_order_actions(
         lines_data=order_lines_info,
     )
 
-    transaction.on_commit(
-        lambda: order_created(
-            order_info=order_info,
-            user=user,
-            app=app,
-            manager=manager,
-            site_settings=site_settings,
-            automatic=is_automatic_completion,
-        )
-    )
-
-    # Send the order confirmation email
-    transaction.on_commit(
-        lambda: send_order_confirmation(
-            order_info, checkout_info.checkout.redirect_url, manager
-        )
+    _call_order_created_actions(
+        order_info,
+        checkout_info.checkout.redirect_url,
+        user=user,
+        app=app,
+        manager=manager,
+        site_settings=site_settings,
+        is_automatic_completion=is_automatic_completion,
     )
 
 
@@ -1240,167 +1287,174 @@ def _create_order_from_checkout(
     tax_configuration = checkout_info.tax_configuration
     prices_entered_with_tax = tax_configuration.prices_entered_with_tax
 
-    # total
-    taxed_total = calculations.calculate_checkout_total_with_gift_cards(
-        manager=manager,
-        checkout_info=checkout_info,
-        lines=checkout_lines_info,
-        address=address,
-        force_update=force_update,
-    )
-
-    # voucher
-    voucher = checkout_info.voucher
-    voucher_code = (
-        checkout_info.voucher_code.code if checkout_info.voucher_code else None
-    )
+    with traced_stage("checkout_complete.prices", "checkout"):
+        # total
+        taxed_total = calculations.calculate_checkout_total_with_gift_cards(
+            manager=manager,
+            checkout_info=checkout_info,
+            lines=checkout_lines_info,
+            address=address,
+            force_update=force_update,
+        )
 
-    # shipping
-    undiscounted_base_shipping_price = base_checkout_undiscounted_delivery_price(
-        checkout_info, checkout_lines_info
-    )
-    base_shipping_price = base_checkout_delivery_price(
-        checkout_info, checkout_lines_info
-    )
-    shipping_total = calculations.checkout_shipping_price(
-        manager=manager,
-        checkout_info=checkout_info,
-        lines=checkout_lines_info,
-        address=address,
-    )
-    shipping_tax_rate = calculations.checkout_shipping_tax_rate(
-        manager=manager,
-        checkout_info=checkout_info,
-        lines=checkout_lines_info,
-        address=address,
-    )
+        # voucher
+        voucher = checkout_info.voucher
+        voucher_code = (
+            checkout_info.voucher_code.code if checkout_info.voucher_code else None
+        )
 
-    # status
-    status = (
-        OrderStatus.UNFULFILLED
-        if (
-            checkout_info.channel.automatically_confirm_all_new_orders
-            and checkout_info.checkout.payment_transactions.exists()
+        # shipping
+        undiscounted_base_shipping_price = base_checkout_undiscounted_delivery_price(
+            checkout_info, checkout_lines_info
+        )
+        base_shipping_price = base_checkout_delivery_price(
+            checkout_info, checkout_lines_info
+        )
+        shipping_total = calculations.checkout_shipping_price(
+            manager=manager,
+            checkout_info=checkout_info,
+            lines=checkout_lines_info,
+            address=address,
+        )
+        shipping_tax_rate = calculations.checkout_shipping_tax_rate(
+            manager=manager,
+            checkout_info=checkout_info,
+            lines=checkout_lines_info,
+            address=address,
         )
-        else OrderStatus.UNCONFIRMED
-    )
-    checkout_metadata = get_or_create_checkout_metadata(checkout_info.checkout)
 
-    # update metadata
-    if metadata_list:
-        checkout_metadata.store_value_in_metadata(
-            {data.key: data.value for data in metadata_list}
+    with traced_stage("checkout_complete.order", "checkout"):
+        # status
+        status = (
+            OrderStatus.UNFULFILLED
+            if (
+                checkout_info.channel.automatically_confirm_all_new_orders
+                and checkout_info.checkout.payment_transactions.exists()
+            )
+            else OrderStatus.UNCONFIRMED
         )
-    if private_metadata_list:
-        checkout_metadata.store_value_in_private_metadata(
-            {data.key: data.value for data in private_metadata_list}
+        checkout_metadata = get_or_create_checkout_metadata(checkout_info.checkout)
+
+        # update metadata
+        if metadata_list:
+            checkout_metadata.store_value_in_metadata(
+                {data.key: data.value for data in metadata_list}
+            )
+        if private_metadata_list:
+            checkout_metadata.store_value_in_private_metadata(
+                {data.key: data.value for data in private_metadata_list}
+            )
+
+        # order
+        order = Order.objects.create(  # type: ignore[misc] # see below:
+            status=status,
+            language_code=checkout_info.checkout.language_code,
+            total=taxed_total,  # money field not supported by mypy_django_plugin
+            shipping_tax_rate=shipping_tax_rate,
+            voucher=voucher,
+            voucher_code=voucher_code,
+            checkout_token=str(checkout_info.checkout.token),
+            origin=OrderOrigin.CHECKOUT,
+            channel=checkout_info.channel,
+            metadata=checkout_metadata.metadata,
+            private_metadata=checkout_metadata.private_metadata,
+            redirect_url=checkout_info.checkout.redirect_url,
+            should_refresh_prices=False,
+            tax_exemption=checkout_info.checkout.tax_exemption,
+            tax_error=checkout_info.checkout.tax_error,
+            **_process_shipping_data_for_order(
+                checkout_info,
+                undiscounted_base_shipping_price,
+                base_shipping_price,
+                shipping_total,
+                manager,
+                checkout_lines_info,
+            ),
+            **_process_user_data_for_order(checkout_info, manager),
         )
 
-    # order
-    order = Order.objects.create(  # type: ignore[misc] # see below:
-        status=status,
-        language_code=checkout_info.checkout.language_code,
-        total=taxed_total,  # money field not supported by mypy_django_plugin
-        shipping_tax_rate=shipping_tax_rate,
-        voucher=voucher,
-        voucher_code=voucher_code,
-        checkout_token=str(checkout_info.checkout.token),
-        origin=OrderOrigin.CHECKOUT,
-        channel=checkout_info.channel,
-        metadata=checkout_metadata.metadata,
-        private_metadata=checkout_metadata.private_metadata,
-        redirect_url=checkout_info.checkout.redirect_url,
-        should_refresh_prices=False,
-        tax_exemption=checkout_info.checkout.tax_exemption,
-        tax_error=checkout_info.checkout.tax_error,
-        **_process_shipping_data_for_order(
-            checkout_info,
-            undiscounted_base_shipping_price,
-            base_shipping_price,
-            shipping_total,
-            manager,
-            checkout_lines_info,
-        ),
-        **_process_user_data_for_order(checkout_info, manager),
-    )
+        # checkout discount
+        _create_order_discount(order, checkout_info)
 
-    # checkout discount
-    _create_order_discount(order, checkout_info)
+    with traced_stage("checkout_complete.lines", "checkout"):
+        order_lines_info = _create_order_lines_from_checkout_lines(
+            checkout_info=checkout_info,
+            lines=checkout_lines_info,
+            manager=manager,
+            order_pk=order.pk,
+            prices_entered_with_tax=prices_entered_with_tax,
+        )
 
-    # lines
-    order_lines_info = _create_order_lines_from_checkout_lines(
-        checkout_info=checkout_info,
-        lines=checkout_lines_info,
-        manager=manager,
-        order_pk=order.pk,
-        prices_entered_with_tax=prices_entered_with_tax,
-    )
+        # update undiscounted order total
+        undiscounted_total = (
+            sum(
+                [
+                    line_info.line.undiscounted_total_price
+                    for line_info in order_lines_info
+                ],
+                start=zero_taxed_money(taxed_total.currency),
+            )
+            + undiscounted_base_shipping_price
+        )
+        order.undiscounted_total = undiscounted_total
+        currency = checkout_info.checkout.currency
+        subtotal_list = [line.line.total_price for line in order_lines_info]
+        order.subtotal = sum(subtotal_list, zero_taxed_money(currency))
+        order.save(
+            update_fields=[
+                "undiscounted_total_net_amount",
+                "undiscounted_total_gross_amount",
+                "subtotal_net_amount",
+                "subtotal_gross_amount",
+            ]
+        )
 
-    # update undiscounted order total
-    undiscounted_total = (
-        sum(
-            [line_info.line.undiscounted_total_price for line_info in order_lines_info],
-            start=zero_taxed_money(taxed_total.currency),
+    with traced_stage("checkout_complete.allocations", "checkout"):
+        _handle_allocations_of_order_lines(
+            checkout_info=checkout_info,
+            checkout_lines=checkout_lines_info,
+            order_lines_info=order_lines_info,
+            manager=manager,
+            reservation_enabled=reservation_enabled,
         )
-        + undiscounted_base_shipping_price
-    )
-    order.undiscounted_total = undiscounted_total
-    currency = checkout_info.checkout.currency
-    subtotal_list = [line.line.total_price for line in order_lines_info]
-    order.subtotal = sum(subtotal_list, zero_taxed_money(currency))
-    order.save(
-        update_fields=[
-            "undiscounted_total_net_amount",
-            "undiscounted_total_gross_amount",
-            "subtotal_net_amount",
-            "subtotal_gross_amount",
-        ]
-    )
-    # allocations
-    _handle_allocations_of_order_lines(
-        checkout_info=checkout_info,
-        checkout_lines=checkout_lines_info,
-        order_lines_info=order_lines_info,
-        manager=manager,
-        reservation_enabled=reservation_enabled,
-    )
 
-    # giftcards
-    total_without_giftcard = (
-        order.subtotal
-        + undiscounted_base_shipping_price
-        - checkout_info.checkout.discount
-    )
-    add_gift_cards_to_order(
-        checkout_info, order, total_without_giftcard.gross, user, app
-    )
+    with traced_stage("checkout_complete.gift_cards", "checkout"):
+        total_without_giftcard = (
+            order.subtotal
+            + undiscounted_base_shipping_price
+            - checkout_info.checkout.discount
+        )
+        add_gift_cards_to_order(
+            checkout_info, order, total_without_giftcard.gross, user, app
+        )
 
-    # payments
-    checkout_info.checkout.payments.update(order=order, checkout_id=None)
-    checkout_info.checkout.payment_transactions.update(order=order, checkout_id=None)
-    update_order_charge_data(order, with_save=False)
-    update_order_authorize_data(order, with_save=False)
+    with traced_stage("checkout_complete.payments", "checkout"):
+        checkout_info.checkout.payments.update(order=order, checkout_id=None)
+        checkout_info.checkout.payment_transactions.update(
+            order=order, checkout_id=None
+        )
+        update_order_charge_data(order, with_save=False)
+        update_order_authorize_data(order, with_save=False)
 
-    # tax settings
-    update_order_display_gross_prices(order)
+        # tax settings
+        update_order_display_gross_prices(order)
 
-    # order search
-    order.search_vector = FlatConcatSearchVector(
-        *prepare_order_search_vector_value(order)
-    )
-    order.save()
+    with traced_stage("checkout_complete.search_vector", "checkout"):
+        _set_order_search_vector(order)
+        order.save()
+
+    with traced_stage("checkout_complete.post_create_actions", "checkout"):
+        _post_create_order_actions(
+            order=order,
+            checkout_info=checkout_info,
+            order_lines_info=order_lines_info,
+            manager=manager,
+            user=user,
+            app=app,
+            site_settings=site_settings,
+            is_automatic_completion=is_automatic_completion,
+        )
 
-    # post create actions
-    _post_create_order_actions(
-        order=order,
-        checkout_info=checkout_info,
-        order_lines_info=order_lines_info,
-        manager=manager,
-        user=user,
-        app=app,
-        site_settings=site_settings,
-        is_automatic_completion=is_automatic_completion,
-    )
     return order
 
 
@@ -0,0 +1,33 @@
+import django.contrib.postgres.indexes
+import django.db.models
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("checkout", "0074_checkoutline_prior_unit_price_amount"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="checkout",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                condition=django.db.models.Q(email__isnull=True, user__isnull=True),
+                fields=["last_change", "token"],
+                name="checkout_anonymous_change_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="checkout",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                condition=django.db.models.Q(
+                    ("email__isnull", False), ("user__isnull", False), _connector="OR"
+                ),
+                fields=["last_change", "token"],
+                name="checkout_user_change_idx",
+            ),
+        ),
+    ]
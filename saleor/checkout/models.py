@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Optional
 from uuid import uuid4
 
 from django.conf import settings
+from django.contrib.postgres.indexes import BTreeIndex
 from django.core.validators import MinValueValidator
 from django.db import models
 from django.utils import timezone
@@ -208,6 +209,19 @@ class Checkout(models.Model):
             (CheckoutPermissions.HANDLE_TAXES.codename, "Handle taxes"),
             (CheckoutPermissions.MANAGE_TAXES.codename, "Manage taxes"),
         )
+        indexes = [
+            # support the sweeps of expired anonymous and user checkouts
+            BTreeIndex(
+                fields=["last_change", "token"],
+                name="checkout_anonymous_change_idx",
+                condition=models.Q(email__isnull=True, user__isnull=True),
+            ),
+            BTreeIndex(
+                fields=["last_change", "token"],
+                name="checkout_user_change_idx",
+                condition=models.Q(email__isnull=False) | models.Q(user__isnull=False),
+            ),
+        ]
 
     def __iter__(self):
         return iter(self.lines.all())
@@ -1,11 +1,15 @@
+import datetime
 import logging
+import time
 from decimal import Decimal
+from uuid import UUID
 
 import graphene
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
-from django.db.models import Exists, OuterRef, Q, QuerySet, Subquery
+from django.db.models import Exists, OuterRef, Q
 from django.db.utils import DatabaseError, IntegrityError
 from django.utils import timezone
 
@@ -23,12 +27,107 @@ from .utils import delete_checkouts
 task_logger: logging.Logger = get_task_logger(__name__)
 
 
+EMPTY_CHECKOUTS_SWEEP_WATERMARK_CACHE_KEY = "expired_empty_checkouts_watermark"
+
+ANONYMOUS_CHECKOUTS = "anonymous"
+USER_CHECKOUTS = "user"
+EMPTY_CHECKOUTS = "empty"
+# the order in which the expiry classes are swept
+EXPIRED_CHECKOUT_CLASSES = [ANONYMOUS_CHECKOUTS, USER_CHECKOUTS, EMPTY_CHECKOUTS]
+
+
+def _get_empty_checkouts_sweep_watermark() -> datetime.datetime | None:
+    watermark = cache.get(EMPTY_CHECKOUTS_SWEEP_WATERMARK_CACHE_KEY)
+    return datetime.datetime.fromisoformat(watermark) if watermark else None
+
+
+def _set_empty_checkouts_sweep_watermark(watermark: datetime.datetime):
+    cache.set(
+        EMPTY_CHECKOUTS_SWEEP_WATERMARK_CACHE_KEY, watermark.isoformat(), timeout=None
+    )
+
+
+def _get_expired_checkouts_lookup(checkout_class: str, now: datetime.datetime) -> Q:
+    """Return the lookup of expired checkouts of the given class.
+
+    Anonymous and user checkouts are scanned with the partial indexes matching
+    their lookups. Empty checkouts can't be told apart by an index, so only the
+    checkouts that became idle for `EMPTY_CHECKOUTS_TIMEDELTA` since the last
+    finished sweep are checked; changing checkout lines updates `last_change`,
+    so a checkout emptied later on is checked again.
+    """
+    if checkout_class == ANONYMOUS_CHECKOUTS:
+        return Q(
+            last_change__lt=now - settings.ANONYMOUS_CHECKOUTS_TIMEDELTA,
+            email__isnull=True,
+            user__isnull=True,
+        )
+    if checkout_class == USER_CHECKOUTS:
+        return Q(last_change__lt=now - settings.USER_CHECKOUTS_TIMEDELTA) & (
+            Q(email__isnull=False) | Q(user__isnull=False)
+        )
+
+    lookup = Q(last_change__lt=now - settings.EMPTY_CHECKOUTS_TIMEDELTA) & ~Q(
+        Exists(CheckoutLine.objects.filter(checkout_id=OuterRef("pk")))
+    )
+    if watermark := _get_empty_checkouts_sweep_watermark():
+        lookup &= Q(last_change__gte=watermark)
+    return lookup
+
+
+def _get_expired_checkouts_batch(
+    checkout_class: str,
+    now: datetime.datetime,
+    batch_size: int,
+    cursor: tuple[datetime.datetime, UUID] | None,
+) -> tuple[list[UUID], tuple[datetime.datetime, UUID] | None]:
+    """Return the next batch of expired checkouts of the given class.
+
+    Checkouts are walked in the `last_change` order from the keyset cursor,
+    so each batch continues where the previous one stopped, skipping
+    the checkouts with active transactions.
+
+    Return the ids of checkouts to delete and the cursor pointing at the last one.
+    """
+    with_transactions = TransactionItem.objects.filter(
+        Q(checkout_id=OuterRef("pk"))
+        & (
+            Q(authorized_value__gt=Decimal(0))
+            | Q(authorize_pending_value__gt=Decimal(0))
+            | Q(charged_value__gt=Decimal(0))
+            | Q(charge_pending_value__gt=Decimal(0))
+            | Q(refund_pending_value__gt=Decimal(0))
+            | Q(cancel_pending_value__gt=Decimal(0))
+        )
+    )
+    qs = Checkout.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).filter(
+        _get_expired_checkouts_lookup(checkout_class, now)
+        & ~Q(Exists(with_transactions))
+    )
+    if cursor:
+        last_change, pk = cursor
+        qs = qs.filter(
+            Q(last_change__gt=last_change) | Q(last_change=last_change, pk__gt=pk)
+        )
+    rows = list(
+        qs.order_by("last_change", "pk").values_list("pk", "last_change")[:batch_size]
+    )
+    if not rows:
+        return [], None
+
+    last_pk, last_change = rows[-1]
+    return [pk for pk, _ in rows], (last_change, last_pk)
+
+
 @app.task
 def delete_expired_checkouts(
     batch_size: int = 2000,
     batch_count: int = 5,
     invocation_count: int = 1,
     invocation_limit: int = 500,
+    cursor: tuple[str, str] | None = None,
+    checkout_class: str = ANONYMOUS_CHECKOUTS,
+    now: str | None = None,
 ) -> tuple[int, bool]:
     """Delete inactive checkouts from the database.
 
@@ -42,8 +141,11 @@ def delete_expired_checkouts(
     - All anonymous and users checkouts after 6h of inactivity
       if there are no lines associated, refer to ``settings.EMPTY_CHECKOUTS_TIMEDELTA``.
 
-    :param batch_size: The maximum row count that can be deleted per ``DELETE FROM``
-        SQL statement. Around 13.5 KB of memory will be utilized by the Celery
+    Each class of expired checkouts is swept separately in ``last_change`` order;
+    each invocation continues from the ``cursor`` left by the previous one.
+
+    :param batch_size: The maximum row count that can be deleted per batch.
+        Around 13.5 KB of memory will be utilized by the Celery
         worker per row, thus 2000 will be using around 27 MB.
     :param batch_count: How many batches can be executed in a single task.
         This limits how long can the task run as there may be lots of checkouts
@@ -51,65 +153,54 @@ def delete_expired_checkouts(
     :param invocation_count: How many times the task re-triggered itself up.
     :param invocation_limit: The maximum times the task can re-trigger itself up
         in order to limit how long it may run.
+    :param cursor: The ``(last_change, pk)`` pair of the last deleted checkout,
+        serialized to strings.
+    :param checkout_class: The class of expired checkouts swept by the task.
+    :param now: The start time of the sweep, shared by the re-triggered tasks.
 
     :return: A tuple containing row count deleted (int)
              and whether there is more to delete (bool).
     """
-    now = timezone.now()
-
-    expired_anonymous_checkouts = (
-        Q(last_change__lt=now - settings.ANONYMOUS_CHECKOUTS_TIMEDELTA)
-        & Q(email__isnull=True)
-        & Q(user__isnull=True)
-    )
-    expired_user_checkout = Q(
-        last_change__lt=now - settings.USER_CHECKOUTS_TIMEDELTA
-    ) & (Q(email__isnull=False) | Q(user__isnull=False))
-    empty_checkouts = Q(last_change__lt=now - settings.EMPTY_CHECKOUTS_TIMEDELTA) & ~Q(
-        Exists(
-            # Type ignore reason: Subquery can be used inside Exists()
-            # https://github.com/typeddjango/django-stubs/issues/985
-            Subquery(  # type: ignore[arg-type]
-                CheckoutLine.objects.filter(checkout_id=OuterRef("pk"))
-            )
-        )
-    )
-
-    with_transactions = TransactionItem.objects.filter(
-        Q(checkout_id=OuterRef("pk"))
-        & (
-            Q(authorized_value__gt=Decimal(0))
-            | Q(authorize_pending_value__gt=Decimal(0))
-            | Q(charged_value__gt=Decimal(0))
-            | Q(charge_pending_value__gt=Decimal(0))
-            | Q(refund_pending_value__gt=Decimal(0))
-            | Q(cancel_pending_value__gt=Decimal(0))
-        )
-    )
-
-    qs: QuerySet[Checkout] = Checkout.objects.using(
-        settings.DATABASE_CONNECTION_REPLICA_NAME
-    ).filter(
-        (empty_checkouts | expired_anonymous_checkouts | expired_user_checkout)
-        & ~Q(Exists(with_transactions))
-    )
-    qs = qs.only("pk").order_by()[:batch_size]
+    sweep_started_at = datetime.datetime.fromisoformat(now) if now else timezone.now()
+    keyset: tuple[datetime.datetime, UUID] | None = None
+    if cursor:
+        keyset = (datetime.datetime.fromisoformat(cursor[0]), UUID(cursor[1]))
 
+    started_at = time.monotonic()
     total_deleted: int = 0
     has_more: bool = True
-    for _batch_number in range(batch_count):
-        checkout_ids = list(qs.values_list("pk", flat=True))
-        with allow_writer():
-            deleted_count = delete_checkouts(checkout_ids)
-        total_deleted += deleted_count
-
-        # Stop deleting inactive checkouts if there was no match.
-        if deleted_count < batch_size:
+    batch_number = 0
+    while batch_number < batch_count:
+        checkout_ids, next_keyset = _get_expired_checkouts_batch(
+            checkout_class, sweep_started_at, batch_size, keyset
+        )
+        if checkout_ids:
+            with allow_writer():
+                total_deleted += delete_checkouts(checkout_ids)
+            keyset = next_keyset
+            batch_number += 1
+
+        if len(checkout_ids) < batch_size:
+            # The class is swept, continue with the next one.
+            class_index = EXPIRED_CHECKOUT_CLASSES.index(checkout_class)
+            if class_index + 1 < len(EXPIRED_CHECKOUT_CLASSES):
+                checkout_class = EXPIRED_CHECKOUT_CLASSES[class_index + 1]
+                keyset = None
+                continue
+            _set_empty_checkouts_sweep_watermark(
+                sweep_started_at - settings.EMPTY_CHECKOUTS_TIMEDELTA
+            )
             has_more = False
             break
 
     if total_deleted:
-        task_logger.debug("Deleted %d checkouts.", total_deleted)
+        duration = time.monotonic() - started_at
+        task_logger.info(
+            "Deleted %d checkouts in %.2fs (%.0f checkouts/s).",
+            total_deleted,
+            duration,
+            total_deleted / duration if duration else total_deleted,
+        )
 
     if has_more:
         if invocation_count < invocation_limit:
@@ -119,6 +210,9 @@ def delete_expired_checkouts(
                 batch_count=batch_count,
                 invocation_count=invocation_count + 1,
                 invocation_limit=invocation_limit,
+                cursor=(keyset[0].isoformat(), str(keyset[1])) if keyset else None,
+                checkout_class=checkout_class,
+                now=sweep_started_at.isoformat(),
             )
         else:
             task_logger.warning("Invocation limit reached, aborting task")
@@ -1,10 +1,15 @@
+from decimal import Decimal
+
 import pytest
 
 from ....payment import ChargeStatus, TransactionKind
 from ....payment.models import Payment
 from ....plugins.manager import get_plugins_manager
+from ....product.models import ProductVariant, ProductVariantChannelListing
+from ....warehouse.models import Stock
 from ... import calculations
 from ...fetch import fetch_checkout_info, fetch_checkout_lines
+from ...models import CheckoutLine
 from ...utils import add_variant_to_checkout
 
 
@@ -23,9 +28,7 @@ def checkout_with_payments(checkout):
     return checkout
 
 
-@pytest.fixture
-def checkout_with_charged_payment(checkout_with_billing_address):
-    checkout = checkout_with_billing_address
+def _create_charged_payment(checkout):
     manager = get_plugins_manager(allow_replica=False)
     lines, _ = fetch_checkout_lines(checkout)
     checkout_info = fetch_checkout_info(checkout, lines, manager)
@@ -54,6 +57,59 @@ def checkout_with_charged_payment(checkout_with_billing_address):
         is_success=True,
     )
 
+
+@pytest.fixture
+def checkout_with_charged_payment(checkout_with_billing_address):
+    checkout = checkout_with_billing_address
+    _create_charged_payment(checkout)
+    return checkout
+
+
+@pytest.fixture
+def checkout_with_many_lines_and_charged_payment(
+    checkout_with_billing_address, warehouse
+):
+    """Return a charged checkout with 20 lines, each of a different variant."""
+    checkout = checkout_with_billing_address
+    product = checkout.lines.get().variant.product
+    variants = ProductVariant.objects.bulk_create(
+        [
+            ProductVariant(product=product, sku=f"MANY_LINES_{index}")
+            for index in range(19)
+        ]
+    )
+    ProductVariantChannelListing.objects.bulk_create(
+        [
+            ProductVariantChannelListing(
+                variant=variant,
+                channel=checkout.channel,
+                cost_price_amount=Decimal(1),
+                price_amount=Decimal(10),
+                discounted_price_amount=Decimal(10),
+                currency=checkout.currency,
+            )
+            for variant in variants
+        ]
+    )
+    Stock.objects.bulk_create(
+        [
+            Stock(warehouse=warehouse, product_variant=variant, quantity=10)
+            for variant in variants
+        ]
+    )
+    CheckoutLine.objects.bulk_create(
+        [
+            CheckoutLine(
+                checkout=checkout,
+                variant=variant,
+                quantity=1,
+                currency=checkout.currency,
+                undiscounted_unit_price_amount=Decimal(10),
+            )
+            for variant in variants
+        ]
+    )
+    _create_charged_payment(checkout)
     return checkout
 
 
@@ -25,7 +25,7 @@ from ...plugins.manager import get_plugins_manager
 from ...product.models import ProductTranslation, ProductVariantTranslation
 from ...tests import race_condition
 from .. import calculations
-from ..complete_checkout import create_order_from_checkout
+from ..complete_checkout import _create_lines_for_order, create_order_from_checkout
 from ..fetch import fetch_checkout_info, fetch_checkout_lines
 from ..utils import add_variant_to_checkout, add_voucher_to_checkout
 
@@ -971,6 +971,50 @@ def test_create_order_product_on_promotion(
     )
 
 
+def test_create_lines_for_order_reuses_prefetched_promotion_rules(
+    checkout_with_item_on_promotion, django_assert_num_queries
+):
+    # given
+    checkout = checkout_with_item_on_promotion
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    order_lines_info = _create_lines_for_order(
+        manager, checkout_info, lines, prices_entered_with_tax=True
+    )
+
+    # then
+    line_info = order_lines_info[0]
+    assert line_info.line.sale_id
+    with django_assert_num_queries(0):
+        promotions = [
+            discount.promotion_rule.promotion for discount in line_info.line_discounts
+        ]
+    assert promotions == [lines[0].discounts[0].promotion_rule.promotion]
+
+
+def test_create_lines_for_order_digital_content(
+    checkout_with_digital_item, digital_content
+):
+    # given
+    checkout = checkout_with_digital_item
+    manager = get_plugins_manager(allow_replica=False)
+    lines, _ = fetch_checkout_lines(checkout)
+    checkout_info = fetch_checkout_info(checkout, lines, manager)
+
+    # when
+    order_lines_info = _create_lines_for_order(
+        manager, checkout_info, lines, prices_entered_with_tax=True
+    )
+
+    # then
+    line_info = order_lines_info[0]
+    assert line_info.is_digital
+    assert line_info.digital_content == digital_content
+
+
 def test_create_order_with_voucher_0_total(
     checkout_with_item,
     customer_user,
@@ -1073,3 +1117,54 @@ def test_create_order_from_checkout_update_tax_error(
     assert not Order.objects.exists()
     assert "Tax app error for checkout" in caplog.text
     assert caplog.records[0].checkout_id == to_global_id_or_none(checkout)
+
+
+@override_settings(CHECKOUT_COMPLETE_DEFER_POST_ORDER_ACTIONS=True)
+@patch("saleor.checkout.complete_checkout.send_order_confirmation")
+@patch("saleor.checkout.complete_checkout.order_created")
+@patch(
+    "saleor.checkout.complete_checkout.process_order_created_from_checkout_task.delay"
+)
+def test_create_order_from_checkout_defers_post_order_actions(
+    mocked_process_order_created,
+    mocked_order_created,
+    mocked_send_order_confirmation,
+    checkout_with_item,
+    address,
+    customer_user,
+    shipping_method,
+    app,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    checkout_with_item.shipping_address = address
+    checkout_with_item.billing_address = address
+    checkout_with_item.shipping_method = shipping_method
+    checkout_with_item.redirect_url = "https://www.example.com"
+    checkout_with_item.save()
+    manager = get_plugins_manager(allow_replica=False)
+
+    checkout_lines, _ = fetch_checkout_lines(checkout_with_item)
+    checkout_info = fetch_checkout_info(checkout_with_item, checkout_lines, manager)
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        order = create_order_from_checkout(
+            checkout_info=checkout_info,
+            manager=manager,
+            user=customer_user,
+            app=app,
+        )
+
+    # then
+    order.refresh_from_db()
+    assert order.search_vector is None
+    mocked_process_order_created.assert_called_once_with(
+        order_id=str(order.pk),
+        user_id=customer_user.pk,
+        app_id=app.pk,
+        redirect_url="https://www.example.com",
+        is_automatic_completion=False,
+    )
+    mocked_order_created.assert_not_called()
+    mocked_send_order_confirmation.assert_not_called()
@@ -7,6 +7,7 @@ from uuid import UUID
 import graphene
 import pytest
 from celery.exceptions import Retry as CeleryTaskRetryError
+from django.core.cache import cache
 from django.db.utils import DatabaseError, IntegrityError
 from django.utils import timezone
 
@@ -20,12 +21,21 @@ from ..fetch import fetch_checkout_info, fetch_checkout_lines
 from ..models import Checkout, CheckoutLine
 from ..payment_utils import update_checkout_payment_statuses
 from ..tasks import (
+    EMPTY_CHECKOUTS,
+    EMPTY_CHECKOUTS_SWEEP_WATERMARK_CACHE_KEY,
     automatic_checkout_completion_task,
     delete_expired_checkouts,
     task_logger,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_empty_checkouts_sweep_watermark():
+    cache.delete(EMPTY_CHECKOUTS_SWEEP_WATERMARK_CACHE_KEY)
+    yield
+    cache.delete(EMPTY_CHECKOUTS_SWEEP_WATERMARK_CACHE_KEY)
+
+
 def test_delete_expired_anonymous_checkouts(checkouts_list, variant, customer_user):
     # given
     now = timezone.now()
@@ -344,6 +354,100 @@ def test_delete_expired_checkouts(checkouts_list, customer_user, variant):
             checkout.refresh_from_db()
 
 
+@mock.patch("saleor.checkout.tasks.delete_expired_checkouts.delay")
+def test_delete_expired_checkouts_skips_not_expired_rows_in_batch(
+    mocked_task: mock.MagicMock, channel_USD, variant
+):
+    """Ensure checkouts that cannot be deleted do not stop the sweep.
+
+    Checkouts with lines that are not expired yet don't fill the batches,
+    so the expired empty checkouts are reached.
+    """
+    # given
+    now = timezone.now()
+    checkouts = Checkout.objects.bulk_create(
+        [
+            Checkout(
+                currency=channel_USD.currency_code,
+                channel=channel_USD,
+                token=UUID(int=checkout_id),
+            )
+            for checkout_id in range(4)
+        ]
+    )
+    for index, checkout in enumerate(checkouts):
+        checkout.last_change = now - datetime.timedelta(hours=10 - index)
+    Checkout.objects.bulk_update(checkouts, ["last_change"])
+    not_expired_checkouts = checkouts[:2]
+    CheckoutLine.objects.bulk_create(
+        [
+            CheckoutLine(
+                checkout=checkout,
+                variant=variant,
+                quantity=1,
+                undiscounted_unit_price_amount=Decimal("10"),
+            )
+            for checkout in not_expired_checkouts
+        ]
+    )
+
+    # when
+    deleted_count, has_more = delete_expired_checkouts(batch_size=2, batch_count=3)
+
+    # then
+    assert deleted_count == 2
+    assert has_more is False
+    assert set(Checkout.objects.values_list("pk", flat=True)) == {
+        checkout.pk for checkout in not_expired_checkouts
+    }
+    mocked_task.assert_not_called()
+
+
+def test_delete_expired_checkouts_skips_empty_checkouts_checked_before(
+    channel_USD, variant
+):
+    # given
+    now = timezone.now()
+    checkouts = Checkout.objects.bulk_create(
+        [
+            Checkout(
+                currency=channel_USD.currency_code,
+                channel=channel_USD,
+                token=UUID(int=checkout_id),
+            )
+            for checkout_id in range(2)
+        ]
+    )
+    checked_checkout, new_empty_checkout = checkouts
+    line = CheckoutLine.objects.create(
+        checkout=checked_checkout,
+        variant=variant,
+        quantity=1,
+        undiscounted_unit_price_amount=Decimal("10"),
+    )
+    Checkout.objects.filter(pk=checked_checkout.pk).update(
+        last_change=now - datetime.timedelta(hours=7)
+    )
+    Checkout.objects.filter(pk=new_empty_checkout.pk).update(
+        last_change=now - datetime.timedelta(hours=5)
+    )
+    delete_expired_checkouts()
+    # lines removed without updating the checkout, e.g. by deleting the variant
+    line.delete()
+
+    # when
+    with mock.patch(
+        "saleor.checkout.tasks.timezone.now",
+        return_value=now + datetime.timedelta(hours=2),
+    ):
+        deleted_count, has_more = delete_expired_checkouts()
+
+    # then
+    assert deleted_count == 1
+    assert has_more is False
+    assert list(Checkout.objects.values_list("pk", flat=True)) == [checked_checkout.pk]
+
+
 @pytest.mark.parametrize(
     (
         "authorized",
@@ -532,12 +636,24 @@ def test_delete_checkouts_until_done(mocked_task: mock.MagicMock, channel_USD):
     )
 
     # Should have triggered a new task to delete more checkouts
-    mocked_task.assert_called_once_with(**task_params, invocation_count=2)
+    mocked_task.assert_called_once_with(
+        **task_params,
+        invocation_count=2,
+        cursor=mock.ANY,
+        checkout_class=EMPTY_CHECKOUTS,
+        now=mock.ANY,
+    )
+    cursor = mocked_task.call_args.kwargs["cursor"]
+    now = mocked_task.call_args.kwargs["now"]
     mocked_task.reset_mock()
 
     # Ensure we delete the remaining, and we do not trigger anymore task.
     deleted_count, has_more = delete_expired_checkouts(
-        **task_params, invocation_count=2
+        **task_params,
+        invocation_count=2,
+        cursor=cursor,
+        checkout_class=EMPTY_CHECKOUTS,
+        now=now,
     )
     assert deleted_count == 1
     assert has_more is False
@@ -583,13 +699,25 @@ def test_aborts_deleting_checkouts_when_invocation_count_exhausted(
     assert has_more is True
 
     # Should have triggered a new task to delete more checkouts
-    mocked_task.assert_called_once_with(**task_params, invocation_count=2)
+    mocked_task.assert_called_once_with(
+        **task_params,
+        invocation_count=2,
+        cursor=mock.ANY,
+        checkout_class=EMPTY_CHECKOUTS,
+        now=mock.ANY,
+    )
+    cursor = mocked_task.call_args.kwargs["cursor"]
+    now = mocked_task.call_args.kwargs["now"]
     mocked_task.reset_mock()
 
     # Invocation #2, should delete 1 checkout and should stop there (has_more=True
     # & no more task.delay()).
     deleted_count, has_more = delete_expired_checkouts(
-        **task_params, invocation_count=2
+        **task_params,
+        invocation_count=2,
+        cursor=cursor,
+        checkout_class=EMPTY_CHECKOUTS,
+        now=now,
     )
     assert deleted_count == 1
     assert has_more is True
@@ -5,7 +5,7 @@ from django.conf import settings
 from django.db.models import CharField, TextField
 from django.utils.module_loading import import_string
 
-from .db.filters import PostgresILike
+from .db.filters import PostgresILike, PostgresILikePrefix
 
 
 class CoreAppConfig(AppConfig):
@@ -14,6 +14,8 @@ class CoreAppConfig(AppConfig):
     def ready(self) -> None:
         CharField.register_lookup(PostgresILike)
         TextField.register_lookup(PostgresILike)
+        CharField.register_lookup(PostgresILikePrefix)
+        TextField.register_lookup(PostgresILikePrefix)
         if settings.SENTRY_DSN:
             settings.SENTRY_INIT(settings.SENTRY_DSN, settings.SENTRY_OPTS)
         self.validate_jwt_manager()
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import jwt
 from django.conf import settings
 
@@ -17,6 +19,12 @@ from .jwt import (
     is_saleor_token,
     jwt_decode,
 )
+from .requestor_cache import (
+    RequestorSnapshot,
+    get_permissions_version,
+    get_requestor_snapshot,
+    set_requestor_snapshot,
+)
 
 
 # Moved from `django.contrib.auth.backends.ModelBackend`
@@ -125,7 +133,10 @@ def load_user_from_request(request):
     jwt_token = get_token_from_request(request)
     if not jwt_token or not is_saleor_token(jwt_token):
         return None
-    payload = jwt_decode(jwt_token)
+    # Verified tokens are cached together with their user's permissions, so
+    # repeated requests skip the signature check and the permissions query.
+    cached_snapshot = get_requestor_snapshot(jwt_token)
+    payload = cached_snapshot.payload if cached_snapshot else jwt_decode(jwt_token)
 
     jwt_type = payload.get("type")
     if jwt_type not in [JWT_ACCESS_TYPE, JWT_THIRDPARTY_ACCESS_TYPE]:
@@ -149,6 +160,11 @@ def load_user_from_request(request):
             "Invalid token. Create new one by using tokenCreate mutation."
         )
 
+    permissions_version = get_permissions_version()
+    snapshot = cached_snapshot
+    if snapshot is None or not snapshot.matches(user, permissions_version):
+        snapshot = RequestorSnapshot.from_user(payload, user, permissions_version)
+
     if permissions is not None:
         token_permissions = get_permissions_from_names(permissions)
         token_codenames = [perm.codename for perm in token_permissions]
@@ -157,4 +173,12 @@ def load_user_from_request(request):
 
     if payload.get("is_staff"):
         user.is_staff = True
+
+    if snapshot.permissions is not None:
+        user._effective_permissions_cache = set(snapshot.permissions)
+    elif user.is_staff:
+        user_permissions = JSONWebTokenBackend().get_all_permissions(user)
+        snapshot = replace(snapshot, permissions=frozenset(user_permissions))
+    if snapshot is not cached_snapshot:
+        set_requestor_snapshot(jwt_token, snapshot)
     return user
@@ -1,4 +1,4 @@
-from django.db.models.lookups import IContains
+from django.db.models.lookups import IContains, IStartsWith
 
 
 class PostgresILike(IContains):
@@ -9,3 +9,19 @@ class PostgresILike(IContains):
         rhs, rhs_params = self.process_rhs(compiler, connection)
         params = lhs_params + rhs_params
         return f"{lhs} ILIKE {rhs}", params
+
+
+class PostgresILikePrefix(IStartsWith):
+    """Case-insensitive prefix match that can be served by trigram indexes.
+
+    Unlike `istartswith`, the column is not wrapped in `UPPER()`, so GIN indexes
+    with `gin_trgm_ops` on the raw column are used.
+    """
+
+    lookup_name = "ilike_prefix"
+
+    def as_postgresql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        params = lhs_params + rhs_params
+        return f"{lhs} ILIKE {rhs}", params
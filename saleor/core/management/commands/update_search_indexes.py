@@ -1,6 +1,10 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 
 from ...search_tasks import (
+    SEARCH_REINDEX_CONFIGS,
+    get_search_reindex_shards,
+    plan_search_reindex_shards,
+    reindex_search_shard_task,
     set_order_search_document_values,
     set_product_search_document_values,
     set_user_search_document_values,
@@ -10,7 +14,39 @@ from ...search_tasks import (
 class Command(BaseCommand):
     help = "Populate search indexes."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help=(
+                "Rebuild search indexes of all rows, not only the missing ones. "
+                "The id range of every model is split into shards processed "
+                "in parallel by the Celery workers."
+            ),
+        )
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=8,
+            help="Number of shards per model used with --all.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            choices=list(SEARCH_REINDEX_CONFIGS.keys()),
+            help="Limit --all reindexing to the given model, can be repeated.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Resume an interrupted --all reindex from the stored checkpoints.",
+        )
+
     def handle(self, *args, **options):
+        if options["all"] or options["resume"]:
+            self.reindex_all(options)
+            return
+
         # Update products
         self.stdout.write("Updating products")
         set_product_search_document_values.delay()
@@ -22,3 +58,28 @@ class Command(BaseCommand):
         # Update users
         self.stdout.write("Updating users")
         set_user_search_document_values.delay()
+
+    def reindex_all(self, options):
+        if options["shards"] < 1:
+            raise CommandError("The number of shards must be a positive integer.")
+
+        for model_name in options["model"] or SEARCH_REINDEX_CONFIGS.keys():
+            if options["resume"]:
+                shards = get_search_reindex_shards(model_name)
+                if not shards:
+                    raise CommandError(f"No reindex of {model_name} to resume.")
+            else:
+                shards = [
+                    (shard, None)
+                    for shard in plan_search_reindex_shards(
+                        model_name, options["shards"]
+                    )
+                ]
+
+            scheduled_count = 0
+            for (start, end), cursor in shards:
+                if cursor is not None and cursor >= end:
+                    continue
+                reindex_search_shard_task.delay(model_name, start, end, cursor)
+                scheduled_count += 1
+            self.stdout.write(f"Reindexing {model_name} in {scheduled_count} shards")
@@ -0,0 +1,94 @@
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .utils.cache import ExpiringCacheDict
+
+if TYPE_CHECKING:
+    from ..account.models import User
+
+PERMISSIONS_VERSION_CACHE_KEY = "requestor_permissions_version"
+REQUESTOR_CACHE_SIZE = 5000
+
+_requestor_snapshots = ExpiringCacheDict(
+    capacity=REQUESTOR_CACHE_SIZE, timeout=settings.JWT_CACHE_TIMEOUT
+)
+
+
+@dataclass(frozen=True)
+class RequestorSnapshot:
+    """Verified access token payload with the permissions of its user.
+
+    The snapshot is valid only for the same user state it was taken for; changing
+    the password, deactivating the user, rotating `jwt_token_key` or updating
+    any permission group makes it stale.
+    """
+
+    payload: dict[str, Any]
+    user_id: int
+    jwt_token_key: str
+    session_auth_hash: str
+    is_staff: bool
+    is_superuser: bool
+    permissions: frozenset[str] | None
+    permissions_version: int
+
+    @classmethod
+    def from_user(
+        cls, payload: dict[str, Any], user: "User", permissions_version: int
+    ) -> "RequestorSnapshot":
+        return cls(
+            payload=payload,
+            user_id=user.pk,
+            jwt_token_key=user.jwt_token_key,
+            session_auth_hash=user.get_session_auth_hash(),
+            is_staff=user.is_staff,
+            is_superuser=user.is_superuser,
+            permissions=None,
+            permissions_version=permissions_version,
+        )
+
+    def matches(self, user: "User", permissions_version: int) -> bool:
+        return (
+            self.user_id == user.pk
+            and self.jwt_token_key == user.jwt_token_key
+            and self.is_staff == user.is_staff
+            and self.is_superuser == user.is_superuser
+            and self.permissions_version == permissions_version
+            and self.session_auth_hash == user.get_session_auth_hash()
+        )
+
+
+def _get_token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_permissions_version() -> int:
+    return cache.get(PERMISSIONS_VERSION_CACHE_KEY, 0)
+
+
+def bump_permissions_version():
+    """Make all cached requestor permissions stale, in every process."""
+    try:
+        cache.incr(PERMISSIONS_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(PERMISSIONS_VERSION_CACHE_KEY, 1, timeout=None)
+
+
+def get_requestor_snapshot(token: str) -> RequestorSnapshot | None:
+    snapshot = _requestor_snapshots.get(_get_token_digest(token))
+    if snapshot is None:
+        return None
+    expires_at = snapshot.payload.get("exp")
+    if settings.JWT_EXPIRE and expires_at is not None and expires_at <= time.time():
+        # Let the full verification raise the expiration error.
+        return None
+    return snapshot
+
+
+def set_requestor_snapshot(token: str, snapshot: RequestorSnapshot):
+    _requestor_snapshots.set(_get_token_digest(token), snapshot)
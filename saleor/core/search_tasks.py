@@ -1,5 +1,14 @@
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Model, prefetch_related_objects
+from django.db.models.sql import Query
 
 from ..account.models import User
 from ..account.search import prepare_user_search_document_value
@@ -11,6 +20,7 @@ from ..product.models import Product
 from ..product.search import (
     PRODUCT_FIELDS_TO_PREFETCH,
     prepare_product_search_vector_value,
+    prepare_products_search_vector_values,
 )
 from .postgres import FlatConcatSearchVector
 
@@ -143,3 +153,245 @@ def set_search_vector_values(
     Model.objects.bulk_update(instances, ["search_vector"])
 
     return len(instances)
+
+
+SEARCH_REINDEX_SHARDS_CACHE_KEY = "search_reindex:{model_name}:shards"
+SEARCH_REINDEX_CHECKPOINT_CACHE_KEY = "search_reindex:{model_name}:{start}:{end}"
+
+ORDER_FIELDS_TO_PREFETCH = [
+    "user",
+    "billing_address",
+    "shipping_address",
+    "payments",
+    "discounts",
+    "lines",
+    "payment_transactions__events",
+]
+
+
+def _prepare_users_search_values(keys: list[int]) -> list[tuple[Any, Any]]:
+    users = list(
+        User.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(pk__in=keys)
+        .prefetch_related("addresses")
+    )
+    return [
+        (user.pk, prepare_user_search_document_value(user, already_prefetched=True))
+        for user in users
+    ]
+
+
+def _prepare_orders_search_values(keys: list[int]) -> list[tuple[Any, Any]]:
+    orders = list(
+        Order.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME).filter(
+            number__in=keys
+        )
+    )
+    prefetch_related_objects(orders, *ORDER_FIELDS_TO_PREFETCH)
+    return [
+        (
+            order.pk,
+            FlatConcatSearchVector(
+                *prepare_order_search_vector_value(order, already_prefetched=True)
+            ),
+        )
+        for order in orders
+    ]
+
+
+def _prepare_products_search_values(keys: list[int]) -> list[tuple[Any, Any]]:
+    search_vectors_map = prepare_products_search_vector_values(keys)
+    return [
+        (product_id, FlatConcatSearchVector(*search_vectors))
+        for product_id, search_vectors in search_vectors_map.items()
+    ]
+
+
+@dataclass(frozen=True)
+class SearchReindexConfig:
+    model: type[Model]
+    # Monotonic integer column used to split the table into shards.
+    shard_field: str
+    # Column holding the search value.
+    search_field: str
+    prepare_values: Callable[[list[int]], list[tuple[Any, Any]]]
+
+
+SEARCH_REINDEX_CONFIGS = {
+    "users": SearchReindexConfig(
+        User, "id", "search_document", _prepare_users_search_values
+    ),
+    "orders": SearchReindexConfig(
+        Order, "number", "search_vector", _prepare_orders_search_values
+    ),
+    "products": SearchReindexConfig(
+        Product, "id", "search_vector", _prepare_products_search_values
+    ),
+}
+
+
+def plan_search_reindex_shards(model_name: str, shard_count: int) -> list[list[int]]:
+    """Split the shard key range of the model into equal `[start, end)` ranges.
+
+    The plan is stored in the cache, so an interrupted reindex can be resumed
+    with the same shard boundaries.
+    """
+    config = SEARCH_REINDEX_CONFIGS[model_name]
+    qs = config.model.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+    first_key = (
+        qs.order_by(config.shard_field).values_list(config.shard_field, flat=True)
+    ).first()
+    last_key = (
+        qs.order_by(f"-{config.shard_field}").values_list(config.shard_field, flat=True)
+    ).first()
+    if first_key is None or last_key is None:
+        return []
+
+    shard_size = max((last_key - first_key + 1) // shard_count, 1)
+    shards = []
+    start = first_key
+    while start <= last_key:
+        end = start + shard_size
+        if len(shards) == shard_count - 1:
+            end = last_key + 1
+        shards.append([start, end])
+        start = end
+    cache.set(
+        SEARCH_REINDEX_SHARDS_CACHE_KEY.format(model_name=model_name),
+        shards,
+        timeout=None,
+    )
+    for start, end in shards:
+        cache.delete(
+            SEARCH_REINDEX_CHECKPOINT_CACHE_KEY.format(
+                model_name=model_name, start=start, end=end
+            )
+        )
+    return shards
+
+
+def get_search_reindex_shards(model_name: str) -> list[tuple[list[int], int | None]]:
+    """Return the stored shards of the model with their last checkpoints."""
+    shards = cache.get(SEARCH_REINDEX_SHARDS_CACHE_KEY.format(model_name=model_name))
+    return [
+        (
+            [start, end],
+            cache.get(
+                SEARCH_REINDEX_CHECKPOINT_CACHE_KEY.format(
+                    model_name=model_name, start=start, end=end
+                )
+            ),
+        )
+        for start, end in shards or []
+    ]
+
+
+def update_column_from_values(
+    model: type[Model], field_name: str, rows: list[tuple[Any, Any]]
+) -> int:
+    """Set a column of many rows with a single `UPDATE ... FROM (VALUES ...)`.
+
+    Values can be plain Python values or expressions, for example search vectors,
+    that are compiled into the statement. Unlike `bulk_update`, the statement does
+    not grow a `CASE WHEN` branch per row for every updated column.
+    """
+    if not rows:
+        return 0
+    connection = connections[settings.DATABASE_CONNECTION_DEFAULT_NAME]
+    query = Query(model)
+    compiler = query.get_compiler(connection=connection)
+    pk_field = model._meta.pk
+    pk_type = pk_field.db_type(connection)  # type: ignore[union-attr]
+    field = model._meta.get_field(field_name)
+
+    values_sql = []
+    params: list[Any] = []
+    for pk, value in rows:
+        if hasattr(value, "resolve_expression"):
+            value_sql, value_params = compiler.compile(value.resolve_expression(query))
+        else:
+            value_sql, value_params = "%s", [value]
+        values_sql.append(f"(%s::{pk_type}, {value_sql})")
+        params.extend(
+            [
+                pk_field.get_db_prep_value(pk, connection),  # type: ignore[union-attr]
+                *value_params,
+            ]
+        )
+
+    table = connection.ops.quote_name(model._meta.db_table)
+    column = connection.ops.quote_name(field.column)  # type: ignore[union-attr]
+    pk_column = connection.ops.quote_name(pk_field.column)  # type: ignore[union-attr]
+    sql = (
+        f"UPDATE {table} SET {column} = v.value "
+        f"FROM (VALUES {', '.join(values_sql)}) AS v(pk, value) "
+        f"WHERE {table}.{pk_column} = v.pk"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+@app.task
+def reindex_search_shard_task(
+    model_name: str,
+    start: int,
+    end: int,
+    cursor: int | None = None,
+    updated_count: int = 0,
+) -> None:
+    """Rebuild search values of the rows with the shard key in `[start, end)`.
+
+    Rows are processed in shard key order in batches of `BATCH_SIZE`; after each
+    batch the cursor is stored as the shard checkpoint and the task re-enqueues
+    itself, so shards run in parallel on all available workers and can be resumed
+    after an interruption.
+    """
+    config = SEARCH_REINDEX_CONFIGS[model_name]
+    checkpoint_key = SEARCH_REINDEX_CHECKPOINT_CACHE_KEY.format(
+        model_name=model_name, start=start, end=end
+    )
+    lookup = {f"{config.shard_field}__lt": end}
+    if cursor is None:
+        lookup[f"{config.shard_field}__gte"] = start
+    else:
+        lookup[f"{config.shard_field}__gt"] = cursor
+    keys = list(
+        config.model.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(**lookup)
+        .order_by(config.shard_field)
+        .values_list(config.shard_field, flat=True)[:BATCH_SIZE]
+    )
+    if keys:
+        batch_start = time.monotonic()
+        rows = config.prepare_values(keys)
+        with allow_writer():
+            updated_count += update_column_from_values(
+                config.model, config.search_field, rows
+            )
+        duration = time.monotonic() - batch_start
+        task_logger.info(
+            "Reindexed %d %s in %.2fs (%.0f rows/s), %d in shard [%d, %d).",
+            len(rows),
+            model_name,
+            duration,
+            len(rows) / duration if duration else len(rows),
+            updated_count,
+            start,
+            end,
+        )
+
+    if len(keys) < BATCH_SIZE:
+        # mark the shard as finished
+        cache.set(checkpoint_key, end, timeout=None)
+        task_logger.info(
+            "Reindexing %s shard [%d, %d) finished, updated %d.",
+            model_name,
+            start,
+            end,
+            updated_count,
+        )
+        return
+
+    cache.set(checkpoint_key, keys[-1], timeout=None)
+    reindex_search_shard_task.delay(model_name, start, end, keys[-1], updated_count)
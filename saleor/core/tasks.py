@@ -1,17 +1,20 @@
+import datetime
 import logging
+import time
 
 from celery import Task
 from celery.utils.log import get_task_logger
 from django.conf import settings
 from django.core.files.storage import default_storage
-from django.db import connections
+from django.db import connections, transaction
 from django.db.models import Exists, OuterRef
 from django.utils import timezone
+from storages.backends.s3boto3 import S3Boto3Storage
 
 from ..celeryconf import app
 from ..core.db.connection import allow_writer
 from . import private_storage
-from .models import EventDelivery, EventPayload
+from .models import EventDelivery, EventDeliveryAttempt, EventPayload
 
 task_logger: logging.Logger = get_task_logger(__name__)
 
@@ -55,6 +58,7 @@ class RestrictWriterDBTask(Task):
 # had multiple attempts. One task took less than 0,5 second, memory usage didn't raise
 # more than 100 MB.
 BATCH_SIZE = 1000
+S3_DELETE_OBJECTS_LIMIT = 1000
 
 
 @app.task
@@ -62,34 +66,104 @@ def delete_from_storage_task(path):
     default_storage.delete(path)
 
 
+def _get_expired_event_payloads_batch(
+    start_pk: int, delete_before: datetime.datetime
+) -> tuple[list[int], list[str], int | None, bool]:
+    """Return the next batch of expired payloads using a keyset cursor on the pk.
+
+    Payloads are inserted with a monotonic pk and `created_at`, so walking the pk
+    index from the cursor visits payloads in creation order and the scan can stop
+    at the first payload that is still within the retention period.
+
+    Returns ids and file names of the payloads to delete, the cursor for the next
+    batch and a flag informing whether the end of the expired range was reached.
+    """
+    rows = list(
+        EventPayload.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(pk__gt=start_pk)
+        .order_by("pk")
+        .values_list("pk", "created_at", "payload_file")[:BATCH_SIZE]
+    )
+    expired_rows = [row for row in rows if row[1] < delete_before]
+    finished = len(rows) < BATCH_SIZE or len(expired_rows) < len(rows)
+    if not expired_rows:
+        return [], [], None, True
+
+    cursor = expired_rows[-1][0]
+    ids = [pk for pk, _, _ in expired_rows]
+    # payloads reused by deliveries created within the retention period are kept
+    retained_ids = set(
+        EventDelivery.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
+        .filter(payload_id__in=ids, created_at__gt=delete_before)
+        .values_list("payload_id", flat=True)
+    )
+    ids_to_delete = []
+    files_to_delete = []
+    for pk, _, payload_file in expired_rows:
+        if pk in retained_ids:
+            continue
+        ids_to_delete.append(pk)
+        if payload_file:
+            files_to_delete.append(payload_file)
+    return ids_to_delete, files_to_delete, cursor, finished
+
+
+def _raw_delete_event_payloads(payload_ids: list[int]) -> int:
+    """Delete payloads with their deliveries and attempts without collecting them.
+
+    Rows are removed bottom-up with plain `DELETE ... WHERE ... IN` statements,
+    which skips Django's cascade collector that would load every related row.
+    """
+    deliveries = EventDelivery.objects.filter(payload_id__in=payload_ids)
+    attempts = EventDeliveryAttempt.objects.filter(
+        Exists(deliveries.filter(id=OuterRef("delivery_id")))
+    )
+    payloads = EventPayload.objects.filter(pk__in=payload_ids)
+    with allow_writer():
+        with transaction.atomic():
+            attempts._raw_delete(attempts.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+            deliveries._raw_delete(deliveries.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+            return payloads._raw_delete(payloads.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+
+
 @app.task
-def delete_event_payloads_task(expiration_date=None):
+def delete_event_payloads_task(expiration_date=None, start_pk=0, deleted_count=0):
+    """Purge event payloads, deliveries and attempts older than the retention period.
+
+    The task walks the payloads table in pk order, starting from `start_pk`, and
+    re-enqueues itself with the cursor of the last processed batch, so every
+    invocation reads only the next range of rows instead of re-running
+    the anti-join over the whole table.
+    """
     expiration_date = (
         expiration_date
         or timezone.now() + settings.EVENT_PAYLOAD_DELETE_TASK_TIME_LIMIT
     )
-    delete_period = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
-    valid_deliveries = EventDelivery.objects.filter(created_at__gt=delete_period)
-    payloads_to_delete = (
-        EventPayload.objects.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-        .filter(~Exists(valid_deliveries.filter(payload_id=OuterRef("id"))))
-        .order_by("-pk")
+    if expiration_date <= timezone.now():
+        task_logger.error("Task invocation time limit reached, aborting task")
+        return
+
+    delete_before = timezone.now() - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    batch_start = time.monotonic()
+    ids, files_to_delete, cursor, finished = _get_expired_event_payloads_batch(
+        start_pk, delete_before
     )
-    ids = list(payloads_to_delete.values_list("pk", flat=True)[:BATCH_SIZE])
     if ids:
-        if expiration_date > timezone.now():
-            qs = EventPayload.objects.filter(pk__in=ids)
-            files_to_delete = [
-                event_payload.payload_file.name
-                for event_payload in qs.using(settings.DATABASE_CONNECTION_REPLICA_NAME)
-                if event_payload.payload_file
-            ]
-            with allow_writer():
-                qs.delete()
+        deleted_count += _raw_delete_event_payloads(ids)
+        if files_to_delete:
             delete_files_from_private_storage_task.delay(files_to_delete)
-            delete_event_payloads_task.delay(expiration_date)
-        else:
-            task_logger.error("Task invocation time limit reached, aborting task")
+        duration = time.monotonic() - batch_start
+        task_logger.info(
+            "Deleted %s event payloads in %.2fs (%.0f payloads/s), %s in total.",
+            len(ids),
+            duration,
+            len(ids) / duration if duration else len(ids),
+            deleted_count,
+        )
+    if cursor is not None and not finished:
+        delete_event_payloads_task.delay(expiration_date, cursor, deleted_count)
+    elif deleted_count:
+        task_logger.info("Event payloads purge finished, deleted %s.", deleted_count)
 
 
 @app.task
@@ -98,7 +172,24 @@ def delete_files_from_storage_task(paths):
         default_storage.delete(path)
 
 
+def _bulk_delete_from_s3_storage(storage, paths) -> bool:
+    if not isinstance(storage, S3Boto3Storage):
+        return False
+    # S3 accepts up to 1000 keys in a single DeleteObjects request
+    for index in range(0, len(paths), S3_DELETE_OBJECTS_LIMIT):
+        chunk = paths[index : index + S3_DELETE_OBJECTS_LIMIT]
+        storage.bucket.delete_objects(
+            Delete={
+                "Objects": [{"Key": storage._normalize_name(path)} for path in chunk],
+                "Quiet": True,
+            }
+        )
+    return True
+
+
 @app.task
 def delete_files_from_private_storage_task(paths):
+    if paths and _bulk_delete_from_s3_storage(private_storage, paths):
+        return
     for path in paths:
         private_storage.delete(path)
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import jwt
 import pytest
 from freezegun import freeze_time
@@ -217,3 +219,62 @@ def test_user_payload_doesnt_have_user_token(prefix, rf, staff_user, settings):
     backend = JSONWebTokenBackend()
     with pytest.raises(InvalidTokenError):
         backend.authenticate(request)
+
+
+def test_user_authenticated_from_cached_token(
+    rf, staff_user, permission_manage_orders, django_assert_num_queries
+):
+    # given
+    staff_user.user_permissions.add(permission_manage_orders)
+    access_token = create_access_token(staff_user)
+    backend = JSONWebTokenBackend()
+    backend.authenticate(rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}"))
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+
+    # when
+    with patch("saleor.core.auth_backend.jwt_decode") as mocked_jwt_decode:
+        with django_assert_num_queries(1):
+            user = backend.authenticate(request)
+            has_perm = user.has_perm("order.manage_orders")
+
+    # then
+    assert user == staff_user
+    assert has_perm is True
+    mocked_jwt_decode.assert_not_called()
+
+
+def test_cached_token_permissions_invalidated_on_group_change(
+    rf,
+    staff_user,
+    permission_group_manage_users,
+    permission_manage_orders,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    staff_user.groups.add(permission_group_manage_users)
+    access_token = create_access_token(staff_user)
+    backend = JSONWebTokenBackend()
+    user = backend.authenticate(rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}"))
+    assert not user.has_perm("order.manage_orders")
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        permission_group_manage_users.permissions.add(permission_manage_orders)
+    user = backend.authenticate(rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}"))
+
+    # then
+    assert user.has_perm("order.manage_orders")
+
+
+def test_cached_token_invalidated_on_token_key_rotation(rf, staff_user):
+    # given
+    access_token = create_access_token(staff_user)
+    backend = JSONWebTokenBackend()
+    backend.authenticate(rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}"))
+    staff_user.jwt_token_key = "New key"
+    staff_user.save(update_fields=["jwt_token_key"])
+    request = rf.request(HTTP_AUTHORIZATION=f"JWT {access_token}")
+
+    # when & then
+    with pytest.raises(InvalidTokenError):
+        backend.authenticate(request)
@@ -1,8 +1,18 @@
+from unittest.mock import patch
+
+from django.core.management import call_command
+
+from ...account.models import User
 from ...core.postgres import FlatConcatSearchVector
 from ...core.search_tasks import (
+    get_search_reindex_shards,
+    plan_search_reindex_shards,
+    reindex_search_shard_task,
     set_order_search_document_values,
     set_user_search_document_values,
+    update_column_from_values,
 )
+from ...product.models import Product
 
 
 def test_set_user_search_document_values(customer_user, customer_user2):
@@ -48,3 +58,62 @@ def test_set_order_search_document_values_no_vector(order):
     # then
     order.refresh_from_db()
     assert order.user.email in order.search_vector
+
+
+def test_update_column_from_values(customer_user, customer_user2):
+    # given
+    rows = [(customer_user.pk, "first"), (customer_user2.pk, "second")]
+
+    # when
+    updated_count = update_column_from_values(User, "search_document", rows)
+
+    # then
+    assert updated_count == 2
+    customer_user.refresh_from_db()
+    customer_user2.refresh_from_db()
+    assert customer_user.search_document == "first"
+    assert customer_user2.search_document == "second"
+
+
+def test_plan_search_reindex_shards(product_list):
+    # given
+    product_ids = sorted(product.pk for product in product_list)
+
+    # when
+    shards = plan_search_reindex_shards("products", 2)
+
+    # then
+    assert shards[0][0] == product_ids[0]
+    assert shards[-1][1] == product_ids[-1] + 1
+    assert len(shards) == 2
+    assert get_search_reindex_shards("products") == [(shard, None) for shard in shards]
+
+
+@patch("saleor.core.search_tasks.BATCH_SIZE", 2)
+def test_reindex_search_shard_task(product_list):
+    # given
+    Product.objects.update(search_vector=None)
+    product_ids = sorted(product.pk for product in product_list)
+    start, end = product_ids[0], product_ids[-1] + 1
+
+    # when
+    reindex_search_shard_task("products", start, end)
+
+    # then
+    for product in Product.objects.all():
+        assert product.search_vector
+
+
+@patch("saleor.core.search_tasks.BATCH_SIZE", 2)
+def test_update_search_indexes_command_all_and_resume(product_list):
+    # given
+    call_command("update_search_indexes", "--all", "--model", "products")
+    shards = get_search_reindex_shards("products")
+    Product.objects.update(search_vector=None)
+
+    # when
+    call_command("update_search_indexes", "--resume", "--model", "products")
+
+    # then
+    assert all(cursor == end for (_, end), cursor in shards)
+    assert not Product.objects.filter(search_vector__isnull=False).exists()
@@ -1,14 +1,19 @@
 import datetime
+from unittest.mock import MagicMock, call, patch
 
 from django.core.files.storage import default_storage
 from django.utils import timezone
 from freezegun import freeze_time
+from storages.backends.gcloud import GoogleCloudStorage
+from storages.backends.s3boto3 import S3Boto3Storage
 
 from ...webhook.event_types import WebhookEventAsyncType
 from .. import private_storage
 from ..models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ..tasks import (
+    _bulk_delete_from_s3_storage,
     delete_event_payloads_task,
+    delete_files_from_private_storage_task,
     delete_files_from_storage_task,
     delete_from_storage_task,
 )
@@ -65,6 +70,113 @@ def test_delete_event_payloads_task(webhook, settings):
     assert not private_storage.exists(payload_files[before_delete_period])
 
 
+def test_delete_event_payloads_task_keeps_payload_used_by_recent_delivery(
+    webhook, settings
+):
+    # given
+    start_time = timezone.now()
+    expired_time = start_time - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    with freeze_time(expired_time - datetime.timedelta(seconds=1)):
+        payload = EventPayload.objects.create(payload="dummy")
+    EventDelivery.objects.create(
+        event_type=WebhookEventAsyncType.ANY,
+        payload=payload,
+        webhook=webhook,
+    )
+
+    # when
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert EventPayload.objects.filter(pk=payload.pk).exists()
+    assert EventDelivery.objects.count() == 1
+
+
+@patch("saleor.core.tasks.BATCH_SIZE", 2)
+def test_delete_event_payloads_task_continues_from_cursor(webhook, settings):
+    # given
+    start_time = timezone.now()
+    expired_time = start_time - settings.EVENT_PAYLOAD_DELETE_PERIOD
+    with freeze_time(expired_time - datetime.timedelta(seconds=1)):
+        expired_payloads = EventPayload.objects.bulk_create(
+            [EventPayload(payload="dummy") for _ in range(5)]
+        )
+    valid_payload = EventPayload.objects.create(payload="dummy")
+
+    # when
+    with freeze_time(start_time):
+        delete_event_payloads_task()
+
+    # then
+    assert not EventPayload.objects.filter(
+        pk__in=[payload.pk for payload in expired_payloads]
+    ).exists()
+    assert list(EventPayload.objects.values_list("pk", flat=True)) == [valid_payload.pk]
+
+
+@patch("saleor.core.tasks.delete_event_payloads_task.delay")
+def test_delete_event_payloads_task_time_limit_reached(mocked_delay, webhook):
+    # given
+    payload = EventPayload.objects.create(payload="dummy")
+    expiration_date = timezone.now() - datetime.timedelta(seconds=1)
+
+    # when
+    delete_event_payloads_task(expiration_date)
+
+    # then
+    assert EventPayload.objects.filter(pk=payload.pk).exists()
+    mocked_delay.assert_not_called()
+
+
+@patch("saleor.core.tasks.S3_DELETE_OBJECTS_LIMIT", 2)
+def test_bulk_delete_from_s3_storage():
+    # given
+    storage = MagicMock(spec=S3Boto3Storage)
+    storage.bucket = MagicMock()
+    storage._normalize_name.side_effect = lambda name: f"media/{name}"
+    paths = ["a.json", "b.json", "c.json"]
+
+    # when
+    result = _bulk_delete_from_s3_storage(storage, paths)
+
+    # then
+    assert result is True
+    assert storage.bucket.delete_objects.call_count == 2
+    first_call_keys = storage.bucket.delete_objects.call_args_list[0].kwargs["Delete"][
+        "Objects"
+    ]
+    assert first_call_keys == [{"Key": "media/a.json"}, {"Key": "media/b.json"}]
+
+
+def test_bulk_delete_from_storage_not_s3():
+    # given
+    storage = MagicMock(spec=GoogleCloudStorage)
+    storage.bucket = MagicMock()
+
+    # when
+    result = _bulk_delete_from_s3_storage(storage, ["a.json"])
+
+    # then
+    assert result is False
+    storage.bucket.delete_objects.assert_not_called()
+
+
+def test_delete_files_from_private_storage_task_not_s3_storage():
+    # given
+    storage = MagicMock(spec=GoogleCloudStorage)
+    storage.bucket = MagicMock()
+    paths = ["a.json", "b.json"]
+
+    # when
+    with patch("saleor.core.tasks.private_storage", storage):
+        delete_files_from_private_storage_task(paths)
+
+    # then
+    assert storage.delete.call_args_list == [call(path) for path in paths]
+    storage.bucket.delete_objects.assert_not_called()
+
+
 def test_delete_files_from_storage_task(
     product_with_image, variant_with_image, media_root
 ):
@@ -1,7 +1,11 @@
-from contextlib import contextmanager
+import logging
+import time
+from contextlib import ExitStack, contextmanager
 
 import opentracing
-from django.db import transaction
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
 
 
 @contextmanager
@@ -22,6 +26,41 @@ def opentracing_trace(span_name, component_name, service_name):
         yield
 
 
+@contextmanager
+def traced_stage(stage_name: str, component_name: str):
+    """Trace a stage of a larger operation with its duration and database queries.
+
+    Queries made on any database connection are counted; the count and the duration
+    are set as span tags and logged on the debug level.
+    """
+    query_count = 0
+
+    def count_queries(execute, sql, params, many, context):
+        nonlocal query_count
+        query_count += 1
+        return execute(sql, params, many, context)
+
+    with opentracing.global_tracer().start_active_span(stage_name) as scope:
+        span = scope.span
+        span.set_tag(opentracing.tags.COMPONENT, component_name)
+        start = time.monotonic()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_queries))
+                yield
+        finally:
+            duration_ms = (time.monotonic() - start) * 1000
+            span.set_tag("db.query_count", query_count)
+            span.set_tag("duration_ms", round(duration_ms, 2))
+            logger.debug(
+                "Stage %s made %d queries in %.2f ms",
+                stage_name,
+                query_count,
+                duration_ms,
+            )
+
+
 @contextmanager
 def webhooks_opentracing_trace(
     span_name,
@@ -1,4 +1,6 @@
 import collections
+import threading
+import time
 
 
 class CacheDict(collections.OrderedDict):
@@ -18,3 +20,35 @@ class CacheDict(collections.OrderedDict):
         while len(self) > self.capacity:
             surplus = next(iter(self))
             super().__delitem__(surplus)
+
+
+class ExpiringCacheDict(CacheDict):
+    """LRU cache with entries expiring after `timeout` seconds.
+
+    Values should be read and written with `get` and `set`, which are safe to use
+    from multiple threads.
+    """
+
+    def __init__(self, capacity: int, timeout: float):
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        super().__init__(capacity)
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expires_at, value = self[key]
+            except KeyError:
+                return default
+            if expires_at <= time.monotonic():
+                del self[key]
+                return default
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self[key] = (time.monotonic() + self.timeout, value)
+
+    def delete(self, key):
+        with self._lock:
+            self.pop(key, None)
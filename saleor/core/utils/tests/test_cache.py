@@ -1,4 +1,6 @@
-from ..cache import CacheDict
+from unittest.mock import patch
+
+from ..cache import CacheDict, ExpiringCacheDict
 
 
 def test_capacity():
@@ -42,3 +44,43 @@ def test_eviction_order():
     assert 1 in cache
     assert 2 not in cache
     assert 3 in cache
+
+
+def test_expiring_cache_returns_value_before_timeout():
+    # given
+    cache = ExpiringCacheDict(2, timeout=10)
+
+    # when
+    cache.set(1, "a")
+
+    # then
+    assert cache.get(1) == "a"
+
+
+@patch("saleor.core.utils.cache.time.monotonic")
+def test_expiring_cache_drops_expired_value(mocked_monotonic):
+    # given
+    mocked_monotonic.return_value = 100
+    cache = ExpiringCacheDict(2, timeout=10)
+    cache.set(1, "a")
+
+    # when
+    mocked_monotonic.return_value = 110
+    value = cache.get(1, "default")
+
+    # then
+    assert value == "default"
+    assert 1 not in cache
+
+
+def test_expiring_cache_delete():
+    # given
+    cache = ExpiringCacheDict(2, timeout=10)
+    cache.set(1, "a")
+
+    # when
+    cache.delete(1)
+    cache.delete(2)
+
+    # then
+    assert cache.get(1) is None
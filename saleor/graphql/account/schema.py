@@ -1,16 +1,21 @@
 import graphene
 
+from ...account.search import autocomplete_users
 from ...permission.auth_filters import AuthorizationFilters
 from ...permission.enums import AccountPermissions, OrderPermissions
 from ...permission.utils import message_one_of_permissions_required
 from ..app.dataloaders import app_promise_callback
 from ..core import ResolveInfo
 from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.descriptions import ADDED_IN_321, PREVIEW_FEATURE
 from ..core.doc_category import DOC_CATEGORY_USERS
 from ..core.fields import BaseField, FilterConnectionField, PermissionsField
-from ..core.types import FilterInputObjectType
+from ..core.types import FilterInputObjectType, NonNullList
 from ..core.utils import from_global_id_or_error
-from ..core.validators import validate_one_of_args_is_in_query
+from ..core.validators import (
+    validate_autocomplete_limit,
+    validate_one_of_args_is_in_query,
+)
 from .bulk_mutations import (
     CustomerBulkDelete,
     CustomerBulkUpdate,
@@ -141,6 +146,25 @@ class AccountQueries(graphene.ObjectType):
         permissions=[OrderPermissions.MANAGE_ORDERS, AccountPermissions.MANAGE_USERS],
         doc_category=DOC_CATEGORY_USERS,
     )
+    customers_autocomplete = PermissionsField(
+        NonNullList(User),
+        search=graphene.String(
+            description="Beginning of a customer email, first name or last name.",
+            required=True,
+        ),
+        first=graphene.Int(
+            description="Maximum number of returned customers.", default_value=10
+        ),
+        description=(
+            "Look up customers by the beginning of their email or name. Intended "
+            "for as-you-type search, returns a plain list without pagination."
+            + ADDED_IN_321
+            + PREVIEW_FEATURE
+        ),
+        required=True,
+        permissions=[OrderPermissions.MANAGE_ORDERS, AccountPermissions.MANAGE_USERS],
+        doc_category=DOC_CATEGORY_USERS,
+    )
     permission_groups = FilterConnectionField(
         GroupCountableConnection,
         filter=PermissionGroupFilterInput(
@@ -217,6 +241,11 @@ class AccountQueries(graphene.ObjectType):
         )
         return create_connection_slice(qs, info, kwargs, UserCountableConnection)
 
+    @staticmethod
+    def resolve_customers_autocomplete(_root, info: ResolveInfo, *, search, first):
+        limit = validate_autocomplete_limit(first)
+        return autocomplete_users(resolve_customers(info), search, limit)
+
     @staticmethod
     def resolve_permission_groups(_root, info: ResolveInfo, **kwargs):
         qs = resolve_permission_groups(info)
@@ -0,0 +1,57 @@
+import graphene
+
+from ....tests.utils import assert_no_permission, get_graphql_content
+
+QUERY_CUSTOMERS_AUTOCOMPLETE = """
+    query ($search: String!, $first: Int) {
+        customersAutocomplete(search: $search, first: $first) {
+            id
+            email
+        }
+    }
+"""
+
+
+def test_customers_autocomplete_by_email_prefix(
+    staff_api_client, permission_manage_users, customer_user, customer_user2
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+    variables = {"search": customer_user.email[:4]}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customersAutocomplete"]
+    assert data[0]["id"] == graphene.Node.to_global_id("User", customer_user.pk)
+
+
+def test_customers_autocomplete_by_name_prefixes(
+    staff_api_client, permission_manage_users, customer_user, customer_user2
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+    variables = {
+        "search": f"{customer_user.first_name[:3]} {customer_user.last_name[:3]}"
+    }
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["customersAutocomplete"]
+    assert [user["email"] for user in data] == [customer_user.email]
+
+
+def test_customers_autocomplete_no_permission(staff_api_client, customer_user):
+    # given
+    variables = {"search": customer_user.email[:4]}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_AUTOCOMPLETE, variables)
+
+    # then
+    assert_no_permission(response)
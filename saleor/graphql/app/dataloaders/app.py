@@ -3,6 +3,11 @@ from collections import defaultdict
 from django.contrib.auth.hashers import check_password
 
 from ....app.models import App, AppToken
+from ....app.utils import (
+    get_verified_app_token_id,
+    invalidate_verified_app_token,
+    set_verified_app_token_id,
+)
 from ...core.dataloaders import DataLoader
 
 
@@ -19,6 +24,14 @@ class AppByIdLoader(DataLoader[str, App]):
 
 
 class AppByTokenLoader(DataLoader[str, App]):
+    """Load active apps by their raw auth tokens.
+
+    Verifying a token against its password hash is expensive, so tokens that
+    were already verified are cached by their keyed hash and matched by
+    the `AppToken` id. The token rows are fetched on every call anyway, so a deleted
+    token or a deactivated app is never authenticated from the cache.
+    """
+
     context_key = "app_by_token"
 
     def batch_load(self, keys):
@@ -26,16 +39,29 @@ class AppByTokenLoader(DataLoader[str, App]):
         for raw_token in keys:
             last_4s_to_raw_token_map[raw_token[-4:]].append(raw_token)
 
-        tokens = (
+        tokens = list(
             AppToken.objects.using(self.database_connection_name)
             .filter(token_last_4__in=last_4s_to_raw_token_map.keys())
-            .values_list("auth_token", "token_last_4", "app_id")
+            .values_list("id", "auth_token", "token_last_4", "app_id")
         )
+        token_ids = {token_id for token_id, _, _, _ in tokens}
+        verified_token_ids = {}
+        for raw_token in keys:
+            cached_token_id = get_verified_app_token_id(raw_token)
+            if cached_token_id in token_ids:
+                verified_token_ids[raw_token] = cached_token_id
+            elif cached_token_id is not None:
+                invalidate_verified_app_token(raw_token)
+
         authed_apps = {}
-        for auth_token, token_last_4, app_id in tokens:
+        for token_id, auth_token, token_last_4, app_id in tokens:
             for raw_token in last_4s_to_raw_token_map[token_last_4]:
-                if check_password(raw_token, auth_token):
+                if raw_token in verified_token_ids:
+                    if verified_token_ids[raw_token] == token_id:
+                        authed_apps[raw_token] = app_id
+                elif check_password(raw_token, auth_token):
                     authed_apps[raw_token] = app_id
+                    set_verified_app_token_id(raw_token, token_id)
 
         apps = (
             App.objects.using(self.database_connection_name)
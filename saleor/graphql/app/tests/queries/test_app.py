@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import graphene
 import pytest
 from freezegun import freeze_time
@@ -246,6 +248,47 @@ def test_own_app_without_id_as_removed_app(
     assert_no_permission(response)
 
 
+def test_own_app_with_verified_token_skips_password_check(app_api_client, app):
+    # given
+    app_api_client.post_graphql(QUERY_APP)
+
+    # when
+    with patch(
+        "saleor.graphql.app.dataloaders.app.check_password"
+    ) as mocked_check_password:
+        response = app_api_client.post_graphql(QUERY_APP)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["app"]["id"] == graphene.Node.to_global_id("App", app.id)
+    mocked_check_password.assert_not_called()
+
+
+def test_own_app_with_verified_token_deleted(app_api_client, app):
+    # given
+    app_api_client.post_graphql(QUERY_APP)
+    app.tokens.all().delete()
+
+    # when
+    response = app_api_client.post_graphql(QUERY_APP)
+
+    # then
+    assert_no_permission(response)
+
+
+def test_own_app_with_verified_token_deactivated(app_api_client, app):
+    # given
+    app_api_client.post_graphql(QUERY_APP)
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # when
+    response = app_api_client.post_graphql(QUERY_APP)
+
+    # then
+    assert_no_permission(response)
+
+
 def test_app_query_without_permission(
     app_api_client,
     app,
@@ -7,11 +7,13 @@ from ....attribute import AttributeInputType
 from ....attribute.models import AttributeValue
 from ....page.error_codes import PageErrorCode
 from ....product.error_codes import ProductErrorCode
+from ....product.models import Product
 from ..enums import AttributeValueBulkActionEnum
 from ..utils import (
     AttributeAssignmentMixin,
     AttrValuesForSelectableFieldInput,
     AttrValuesInput,
+    ProductAttributeAssignmentMixin,
     prepare_attribute_values,
     validate_attributes_input,
 )
@@ -2197,3 +2199,64 @@ def test_attribute_assignment_mixin_pre_save_multiselect_external_reference_acti
         (AttributeValueBulkActionEnum.NONE, value)
         for value in color_attribute.values.all()
     ]
+
+
+def test_attribute_assignment_mixin_save_bulk(
+    product_type, category, color_attribute, numeric_attribute
+):
+    # given
+    product_type.product_attributes.add(numeric_attribute)
+    existing_value = color_attribute.values.first()
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name=f"Product {i}",
+                slug=f"product-{i}",
+                product_type=product_type,
+                category=category,
+            )
+            for i in range(3)
+        ]
+    )
+    color_id = graphene.Node.to_global_id("Attribute", color_attribute.pk)
+    numeric_id = graphene.Node.to_global_id("Attribute", numeric_attribute.pk)
+    instances_cleaned_input = [
+        (
+            product,
+            [
+                (
+                    color_attribute,
+                    AttrValuesInput(global_id=color_id, values=color_values),
+                ),
+                (
+                    numeric_attribute,
+                    AttrValuesInput(global_id=numeric_id, numeric=str(index)),
+                ),
+            ],
+        )
+        for index, (product, color_values) in enumerate(
+            zip(
+                products,
+                [["Pink"], [existing_value.name, "Pink"], ["Pink"]],
+                strict=True,
+            )
+        )
+    ]
+
+    # when
+    ProductAttributeAssignmentMixin.save_bulk(instances_cleaned_input)
+
+    # then
+    new_value = color_attribute.values.get(name="Pink")
+    assert [
+        list(
+            product.attributevalues.filter(
+                value__attribute=color_attribute
+            ).values_list("value_id", flat=True)
+        )
+        for product in products
+    ] == [[new_value.pk], [existing_value.pk, new_value.pk], [new_value.pk]]
+    assert [
+        product.attributevalues.get(value__attribute=numeric_attribute).value.name
+        for product in products
+    ] == ["0", "1", "2"]
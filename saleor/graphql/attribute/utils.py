@@ -17,7 +17,10 @@ from text_unidecode import unidecode
 from ...attribute import AttributeEntityType, AttributeInputType
 from ...attribute import models as attribute_models
 from ...attribute.models import AttributeValue
-from ...attribute.utils import associate_attribute_values_to_instance
+from ...attribute.utils import (
+    associate_attribute_values_to_instance,
+    associate_attribute_values_to_new_instances,
+)
 from ...core.utils import (
     generate_unique_slug,
     prepare_unique_attribute_value_slug,
@@ -450,6 +453,130 @@ class AttributeAssignmentMixin:
                 assignment__attribute_id__in=clean_assignment
             ).delete()
 
+    @classmethod
+    def save_bulk(
+        cls,
+        instances_cleaned_input: list[
+            tuple[product_models.Product | product_models.ProductVariant, T_INPUT_MAP]
+        ],
+    ):
+        """Save the cleaned input of multiple newly created instances at once.
+
+        Values given by name are matched and created with a single pass per
+        attribute for the whole batch, other values are created with a single bulk
+        operation per attribute, and all assignments are inserted in bulk.
+
+        Note: this should always be run inside a transaction, and only for instances
+        without any assigned values.
+
+        :param instances_cleaned_input: the products or variants with their cleaned
+        user input (refer to clean_attributes)
+        """
+        pre_save_methods_mapping = {
+            AttributeInputType.BOOLEAN: cls._pre_save_boolean_values,
+            AttributeInputType.DATE: cls._pre_save_date_time_values,
+            AttributeInputType.DATE_TIME: cls._pre_save_date_time_values,
+            AttributeInputType.DROPDOWN: cls._pre_save_dropdown_value,
+            AttributeInputType.SWATCH: cls._pre_save_swatch_value,
+            AttributeInputType.FILE: cls._pre_save_file_value,
+            AttributeInputType.NUMERIC: cls._pre_save_numeric_values,
+            AttributeInputType.MULTISELECT: cls._pre_save_multiselect_values,
+            AttributeInputType.PLAIN_TEXT: cls._pre_save_plain_text_values,
+            AttributeInputType.REFERENCE: cls._pre_save_reference_values,
+            AttributeInputType.RICH_TEXT: cls._pre_save_rich_text_values,
+        }
+        # values given by name, per attribute, for the whole batch
+        names_by_attribute: dict[attribute_models.Attribute, dict[str, None]] = (
+            defaultdict(dict)
+        )
+        # other values to save, per action and attribute, with their instance index
+        pre_save_bulk: dict = defaultdict(lambda: defaultdict(list))
+        instances_values: list[dict] = [
+            defaultdict(list) for _ in instances_cleaned_input
+        ]
+
+        for index, (instance, cleaned_input) in enumerate(instances_cleaned_input):
+            for attribute, attr_values in cleaned_input:
+                names = cls._get_value_names(attribute, attr_values)
+                if names is not None:
+                    for name in names:
+                        names_by_attribute[attribute][name] = None
+                    instances_values[index][attribute].extend(names)
+                    continue
+
+                pre_save_func = pre_save_methods_mapping[attribute.input_type]
+                for action, value in pre_save_func(instance, attribute, attr_values):
+                    pre_save_bulk[action][attribute].append((index, value))
+
+        for attribute, names in names_by_attribute.items():
+            values, values_to_create = prepare_attribute_values(attribute, list(names))
+            AttributeValue.objects.bulk_create(values_to_create)
+            name_to_value = dict(zip(names, values, strict=True))
+            for instance_values in instances_values:
+                if attribute in instance_values:
+                    instance_values[attribute] = [
+                        name_to_value[name] for name in instance_values[attribute]
+                    ]
+
+        for action, attribute_data in pre_save_bulk.items():
+            for attribute, indexed_values in attribute_data.items():
+                values = [value for _, value in indexed_values]
+                if action == AttributeValueBulkActionEnum.CREATE:
+                    values = AttributeValue.objects.bulk_create(values)
+                elif action == AttributeValueBulkActionEnum.UPDATE_OR_CREATE:
+                    values = AttributeValue.objects.bulk_update_or_create(values)
+                elif action == AttributeValueBulkActionEnum.GET_OR_CREATE:
+                    values = AttributeValue.objects.bulk_get_or_create(values)
+                for (index, _), value in zip(indexed_values, values, strict=True):
+                    instances_values[index][attribute].append(value)
+
+        associate_attribute_values_to_new_instances(
+            [
+                (
+                    instance,
+                    {
+                        attribute.pk: list({v.slug: v for v in values}.values())
+                        for attribute, values in instance_values.items()
+                        if values
+                    },
+                )
+                for (instance, _), instance_values in zip(
+                    instances_cleaned_input, instances_values, strict=True
+                )
+            ]
+        )
+
+    @classmethod
+    def _get_value_names(
+        cls, attribute: attribute_models.Attribute, attr_values: AttrValuesInput
+    ) -> list[str] | None:
+        """Return the names of values, if all values of the input are given by name.
+
+        Values given by name are matched with the existing ones by slug or name, and
+        created if they don't exist.
+        """
+        if attribute.input_type not in (
+            AttributeInputType.DROPDOWN,
+            AttributeInputType.MULTISELECT,
+            AttributeInputType.SWATCH,
+        ):
+            return None
+        if attr_values.values:
+            return attr_values.values
+
+        if attribute.input_type == AttributeInputType.MULTISELECT:
+            selectable_values = attr_values.multiselect or []
+        elif attribute.input_type == AttributeInputType.DROPDOWN:
+            selectable_values = [attr_values.dropdown] if attr_values.dropdown else []
+        else:
+            selectable_values = [attr_values.swatch] if attr_values.swatch else []
+        if selectable_values and all(
+            value.value and not value.id and not value.external_reference
+            for value in selectable_values
+        ):
+            return list(dict.fromkeys(value.value for value in selectable_values))
+        return None
+
     @classmethod
     def _pre_save_dropdown_value(
         cls,
@@ -1624,6 +1624,45 @@ def test_complete_checkout(api_client, checkout_with_charged_payment, count_quer
     assert not response["data"]["checkoutComplete"]["errors"]
 
 
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_complete_checkout_with_deferred_post_order_actions(
+    api_client, checkout_with_charged_payment, settings, count_queries
+):
+    settings.CHECKOUT_COMPLETE_DEFER_POST_ORDER_ACTIONS = True
+    query = COMPLETE_CHECKOUT_MUTATION
+
+    variables = {
+        "id": to_global_id_or_none(checkout_with_charged_payment),
+    }
+
+    response = get_graphql_content(api_client.post_graphql(query, variables))
+    assert not response["data"]["checkoutComplete"]["errors"]
+
+
+@pytest.mark.parametrize("defer_post_order_actions", [False, True])
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_complete_checkout_with_many_lines(
+    defer_post_order_actions,
+    api_client,
+    checkout_with_many_lines_and_charged_payment,
+    settings,
+    count_queries,
+):
+    settings.CHECKOUT_COMPLETE_DEFER_POST_ORDER_ACTIONS = defer_post_order_actions
+    query = COMPLETE_CHECKOUT_MUTATION
+    assert checkout_with_many_lines_and_charged_payment.lines.count() == 20
+
+    variables = {
+        "id": to_global_id_or_none(checkout_with_many_lines_and_charged_payment),
+    }
+
+    response = get_graphql_content(api_client.post_graphql(query, variables))
+    assert not response["data"]["checkoutComplete"]["errors"]
+    assert len(response["data"]["checkoutComplete"]["order"]["lines"]) == 20
+
+
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
 @patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
@@ -55,6 +55,16 @@ def validate_one_of_args_is_in_query(*args, **kwargs):
         raise GraphQLError(f"At least one of arguments is required: {required_args}.")
 
 
+def validate_autocomplete_limit(first: int) -> int:
+    """Validate the number of requested autocomplete results."""
+    if first < 1 or first > settings.AUTOCOMPLETE_MAX_RESULTS:
+        raise GraphQLError(
+            "Argument 'first' must be between 1 and "
+            f"{settings.AUTOCOMPLETE_MAX_RESULTS}."
+        )
+    return first
+
+
 def validate_price_precision(
     value: Optional["Decimal"],
     currency: str,
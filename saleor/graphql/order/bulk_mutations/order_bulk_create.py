@@ -9,6 +9,7 @@ from typing import Any
 from uuid import UUID
 
 import graphene
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 from django.db.models import Q
@@ -36,6 +37,7 @@ from ....order import (
     StockUpdatePolicy,
 )
 from ....order.error_codes import OrderBulkCreateErrorCode
+from ....order.list_projection import update_order_list_projections
 from ....order.models import Fulfillment, FulfillmentLine, Order, OrderEvent, OrderLine
 from ....order.search import update_order_search_vector
 from ....order.utils import update_order_display_gross_prices, updates_amounts_for_order
@@ -78,6 +80,19 @@ MINUTES_DIFF = 5
 MAX_ORDERS = 50
 MAX_NOTE_LENGTH = 255
 
+# Object storage key prefixes of the identifiers, which resolve to instances that
+# can be reused by subsequent batches of the same import. Only the few instances
+# shared by most orders are reused, so the storage doesn't grow with the number
+# of imported orders; users, variants, vouchers, orders and gift cards are always
+# fetched.
+REUSABLE_IDENTIFIER_KEYS = {
+    "channel_slugs": "Channel.slug",
+    "warehouse_ids": "Warehouse.id",
+    "shipping_method_ids": "ShippingMethod.id",
+    "tax_class_ids": "TaxClass.id",
+    "app_ids": "App.id",
+}
+
 
 @dataclass
 class OrderBulkError:
@@ -647,9 +662,17 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         support_private_meta_field = True
 
     @classmethod
-    def get_all_instances(cls, orders_input) -> dict[str, Any]:
+    def get_all_instances(
+        cls, orders_input, object_storage: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
         """Retrieve all required instances to process orders.
 
+        Args:
+            orders_input: list of orders input data
+            object_storage: instances resolved for the previous batches of orders;
+                            they are not fetched again and the storage is updated
+                            with the new instances
+
         Return:
             Dictionary with keys "{model_name}.{key_name}.{key_value}" and model
             instances as values.
@@ -726,6 +749,17 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                         pass
                 setattr(identifier, "keys", model_ids)
 
+        if object_storage is None:
+            object_storage = {}
+        else:
+            for field_name, key_prefix in REUSABLE_IDENTIFIER_KEYS.items():
+                identifier = getattr(identifiers, field_name)
+                identifier.keys = [
+                    key
+                    for key in identifier.keys
+                    if f"{key_prefix}.{key}" not in object_storage
+                ]
+
         # Make DB calls
         users = User.objects.filter(
             Q(pk__in=identifiers.user_ids.keys)
@@ -755,7 +789,6 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         )
 
         # Create dictionary
-        object_storage: dict[str, Any] = {}
         for user in users:
             object_storage[f"User.id.{user.id}"] = user
             object_storage[f"User.email.{user.email}"] = user
@@ -979,7 +1012,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         order_input: dict[str, Any],
         order_data: OrderBulkCreateData,
         object_storage: dict[str, Any],
-        info: ResolveInfo,
+        info: ResolveInfo | None,
     ):
         """Get all instances of objects needed to create an order."""
         user = cls.get_instance_with_errors(
@@ -1244,7 +1277,10 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                 )
             else:
                 assert order_data.channel
-                lookup_key = f"shipping_price.{delivery_method.shipping_method.id}"
+                lookup_key = (
+                    f"shipping_price.{delivery_method.shipping_method.id}"
+                    f".{order_data.channel.id}"
+                )
                 db_price_amount = object_storage.get(lookup_key) or (
                     ShippingMethodChannelListing.objects.values_list(
                         "price_amount", flat=True
@@ -1958,7 +1994,7 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
         cls,
         order_input,
         object_storage: dict[str, Any],
-        info: ResolveInfo,
+        info: ResolveInfo | None,
     ) -> OrderBulkCreateData:
         order_data = OrderBulkCreateData()
         cls.validate_order_input(order_input, order_data, object_storage)
@@ -2321,9 +2357,43 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
                 "search_vector",
             ],
         )
+        if settings.UPDATE_ORDER_LIST_PROJECTIONS:
+            update_order_list_projections([order.pk for order in orders])
 
         return orders_data
 
+    @classmethod
+    def create_orders(
+        cls,
+        orders_input,
+        *,
+        info: ResolveInfo | None,
+        error_policy: str,
+        stock_update_policy: str,
+        object_storage: dict[str, Any] | None = None,
+    ) -> list[OrderBulkCreateData]:
+        """Validate and save the orders; should be called in a transaction.
+
+        The `object_storage` can be shared between calls to avoid fetching
+        the same instances for every batch of orders.
+        """
+        # Create dictionary, which stores already resolved objects:
+        #   - key for instances: "{model_name}.{key_name}.{key_value}"
+        #   - key for shipping prices:
+        #     "shipping_price.{shipping_method_id}.{channel_id}"
+        object_storage = cls.get_all_instances(orders_input, object_storage)
+        orders_data = [
+            cls.create_single_order(order_input, object_storage, info)
+            for order_input in orders_input
+        ]
+
+        stocks: list[Stock] = []
+        cls.handle_error_policy(orders_data, error_policy)
+        if stock_update_policy != StockUpdatePolicy.SKIP:
+            stocks = cls.handle_stocks(orders_data, stock_update_policy)
+        cls.save_data(orders_data, stocks)
+        return orders_data
+
     @classmethod
     def perform_mutation(cls, _root, info: ResolveInfo, /, **data):
         orders_input = data["orders"]
@@ -2335,27 +2405,15 @@ class OrderBulkCreate(BaseMutation, I18nMixin):
             result = OrderBulkCreateResult(order=None, error=error)
             return OrderBulkCreate(count=0, results=result)
 
-        orders_data: list[OrderBulkCreateData] = []
         with traced_atomic_transaction():
-            # Create dictionary, which stores already resolved objects:
-            #   - key for instances: "{model_name}.{key_name}.{key_value}"
-            #   - key for shipping prices: "shipping_price.{shipping_method_id}"
-            object_storage: dict[str, Any] = cls.get_all_instances(orders_input)
-            for order_input in orders_input:
-                orders_data.append(
-                    cls.create_single_order(order_input, object_storage, info)
-                )
-
-            error_policy = data.get("error_policy") or ErrorPolicy.REJECT_EVERYTHING
-            stock_update_policy = (
-                data.get("stock_update_policy") or StockUpdatePolicy.UPDATE
+            orders_data = cls.create_orders(
+                orders_input,
+                info=info,
+                error_policy=data.get("error_policy") or ErrorPolicy.REJECT_EVERYTHING,
+                stock_update_policy=(
+                    data.get("stock_update_policy") or StockUpdatePolicy.UPDATE
+                ),
             )
-            stocks: list[Stock] = []
-
-            cls.handle_error_policy(orders_data, error_policy)
-            if stock_update_policy != StockUpdatePolicy.SKIP:
-                stocks = cls.handle_stocks(orders_data, stock_update_policy)
-            cls.save_data(orders_data, stocks)
 
             manager = get_plugin_manager_promise(info.context).get()
             if created_orders := [
@@ -4,12 +4,13 @@ from graphql import GraphQLError
 
 from ...core.exceptions import PermissionDenied
 from ...order import models
+from ...order.search import autocomplete_orders
 from ...permission.enums import OrderPermissions
 from ...permission.utils import has_one_of_permissions
 from ..core import ResolveInfo
 from ..core.connection import create_connection_slice, filter_connection_queryset
 from ..core.context import get_database_connection_name
-from ..core.descriptions import DEPRECATED_IN_3X_FIELD
+from ..core.descriptions import ADDED_IN_321, DEPRECATED_IN_3X_FIELD, PREVIEW_FEATURE
 from ..core.doc_category import DOC_CATEGORY_ORDERS
 from ..core.enums import ReportingPeriod
 from ..core.fields import (
@@ -19,9 +20,12 @@ from ..core.fields import (
     PermissionsField,
 )
 from ..core.scalars import UUID
-from ..core.types import FilterInputObjectType, TaxedMoney
+from ..core.types import FilterInputObjectType, NonNullList, TaxedMoney
 from ..core.utils import ext_ref_to_global_id_or_error, from_global_id_or_error
-from ..core.validators import validate_one_of_args_is_in_query
+from ..core.validators import (
+    validate_autocomplete_limit,
+    validate_one_of_args_is_in_query,
+)
 from ..utils import get_user_or_app_from_context
 from .bulk_mutations.draft_orders import DraftOrderBulkDelete, DraftOrderLinesBulkDelete
 from .bulk_mutations.order_bulk_cancel import OrderBulkCancel
@@ -128,6 +132,29 @@ class OrderQueries(graphene.ObjectType):
         ],
         doc_category=DOC_CATEGORY_ORDERS,
     )
+    orders_autocomplete = PermissionsField(
+        NonNullList(Order),
+        search=graphene.String(
+            description="Order number or the beginning of a customer email.",
+            required=True,
+        ),
+        first=graphene.Int(
+            description="Maximum number of returned orders.", default_value=10
+        ),
+        channel=graphene.String(
+            description="Slug of a channel for which the data should be returned."
+        ),
+        description=(
+            "Look up orders by number or the beginning of a customer email. "
+            "Intended for as-you-type search, returns a plain list without "
+            "pagination." + ADDED_IN_321 + PREVIEW_FEATURE
+        ),
+        required=True,
+        permissions=[
+            OrderPermissions.MANAGE_ORDERS,
+        ],
+        doc_category=DOC_CATEGORY_ORDERS,
+    )
     draft_orders = FilterConnectionField(
         OrderCountableConnection,
         sort_by=OrderSortingInput(description="Sort draft orders."),
@@ -206,6 +233,14 @@ class OrderQueries(graphene.ObjectType):
         )
         return create_connection_slice(qs, info, kwargs, OrderCountableConnection)
 
+    @staticmethod
+    def resolve_orders_autocomplete(
+        _root, info: ResolveInfo, *, search, first, channel=None
+    ):
+        limit = validate_autocomplete_limit(first)
+        qs = resolve_orders(info, channel)
+        return autocomplete_orders(qs, search, limit)
+
     @staticmethod
     def resolve_draft_orders(_root, info: ResolveInfo, **kwargs):
         if sort_field_from_kwargs(kwargs) == OrderSortField.RANK:
@@ -1,4 +1,12 @@
-from django.db.models import CharField, ExpressionWrapper, OuterRef, QuerySet, Subquery
+from django.conf import settings
+from django.db.models import (
+    CharField,
+    ExpressionWrapper,
+    F,
+    OuterRef,
+    QuerySet,
+    Subquery,
+)
 
 from ...payment.models import Payment
 from ..core.descriptions import DEPRECATED_IN_3X_INPUT
@@ -12,8 +20,8 @@ class OrderSortField(BaseEnum):
     CREATION_DATE = ["created_at", "status", "pk"]
     CREATED_AT = ["created_at", "status", "pk"]
     LAST_MODIFIED_AT = ["updated_at", "status", "pk"]
-    CUSTOMER = ["billing_address__last_name", "billing_address__first_name", "pk"]
-    PAYMENT = ["last_charge_status", "status", "pk"]
+    CUSTOMER = ["customer_last_name", "customer_first_name", "pk"]
+    PAYMENT = ["last_charge_status", "list_status", "pk"]
     FULFILLMENT_STATUS = ["status", "user_email", "pk"]
 
     class Meta:
@@ -39,15 +47,35 @@ class OrderSortField(BaseEnum):
 
         raise ValueError(f"Unsupported enum value: {self.value}")
 
+    @staticmethod
+    def qs_with_customer(queryset: QuerySet, **_kwargs) -> QuerySet:
+        if settings.ORDER_LIST_SORT_BY_PROJECTION:
+            # the inner join lets the projection index drive the scan
+            return queryset.filter(list_projection__isnull=False).annotate(
+                customer_last_name=F("list_projection__customer_last_name"),
+                customer_first_name=F("list_projection__customer_first_name"),
+            )
+        return queryset.annotate(
+            customer_last_name=F("billing_address__last_name"),
+            customer_first_name=F("billing_address__first_name"),
+        )
+
     @staticmethod
     def qs_with_payment(queryset: QuerySet, **_kwargs) -> QuerySet:
+        if settings.ORDER_LIST_SORT_BY_PROJECTION:
+            # the inner join lets the projection index drive the scan
+            return queryset.filter(list_projection__isnull=False).annotate(
+                last_charge_status=F("list_projection__last_charge_status"),
+                list_status=F("list_projection__status"),
+            )
         subquery = Subquery(
             Payment.objects.filter(order_id=OuterRef("pk"))
             .order_by("-pk")
             .values_list("charge_status")[:1]
         )
         return queryset.annotate(
-            last_charge_status=ExpressionWrapper(subquery, output_field=CharField())
+            last_charge_status=ExpressionWrapper(subquery, output_field=CharField()),
+            list_status=F("status"),
         )
 
 
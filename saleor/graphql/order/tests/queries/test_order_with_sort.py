@@ -3,8 +3,10 @@ from freezegun import freeze_time
 from prices import Money, TaxedMoney
 
 from .....order import OrderStatus
+from .....order.list_projection import update_order_list_projections
 from .....order.models import Order
 from ....tests.utils import get_graphql_content
+from ...sorters import OrderSortField
 
 QUERY_ORDER_WITH_SORT = """
     query ($sort_by: OrderSortingInput!) {
@@ -19,6 +21,21 @@ QUERY_ORDER_WITH_SORT = """
 """
 
 
+@pytest.mark.parametrize(
+    "qs_with_sort_field",
+    [OrderSortField.qs_with_customer, OrderSortField.qs_with_payment],
+)
+def test_sort_orders_by_projection_uses_inner_join(qs_with_sort_field, settings):
+    # given
+    settings.ORDER_LIST_SORT_BY_PROJECTION = True
+
+    # when
+    queryset = qs_with_sort_field(Order.objects.all())
+
+    # then
+    assert 'INNER JOIN "order_orderlistprojection"' in str(queryset.query)
+
+
 @pytest.mark.parametrize(
     ("order_sort", "result_order"),
     [
@@ -30,16 +47,22 @@ QUERY_ORDER_WITH_SORT = """
         ({"field": "CUSTOMER", "direction": "DESC"}, [3, 1, 0, 2]),
         ({"field": "FULFILLMENT_STATUS", "direction": "ASC"}, [2, 1, 0, 3]),
         ({"field": "FULFILLMENT_STATUS", "direction": "DESC"}, [3, 0, 1, 2]),
+        ({"field": "PAYMENT", "direction": "ASC"}, [2, 1, 0, 3]),
+        ({"field": "PAYMENT", "direction": "DESC"}, [3, 0, 1, 2]),
     ],
 )
+@pytest.mark.parametrize("sort_by_projection", [False, True])
 def test_query_orders_with_sort(
+    sort_by_projection,
     order_sort,
     result_order,
     staff_api_client,
     permission_group_manage_orders,
     address,
     channel_USD,
+    settings,
 ):
+    settings.ORDER_LIST_SORT_BY_PROJECTION = sort_by_projection
     created_orders = []
     with freeze_time("2017-01-14"):
         created_orders.append(
@@ -81,6 +104,7 @@ def test_query_orders_with_sort(
             channel=channel_USD,
         )
     )
+    update_order_list_projections([order.pk for order in created_orders])
     variables = {"sort_by": order_sort}
     permission_group_manage_orders.user_set.add(staff_api_client.user)
     response = staff_api_client.post_graphql(QUERY_ORDER_WITH_SORT, variables)
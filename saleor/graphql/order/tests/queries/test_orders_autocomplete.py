@@ -0,0 +1,59 @@
+import graphene
+
+from ....tests.utils import assert_no_permission, get_graphql_content
+
+QUERY_ORDERS_AUTOCOMPLETE = """
+    query ($search: String!, $first: Int) {
+        ordersAutocomplete(search: $search, first: $first) {
+            id
+            number
+        }
+    }
+"""
+
+
+def test_orders_autocomplete_by_number(
+    staff_api_client, permission_group_manage_orders, order_list
+):
+    # given
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+    order = order_list[1]
+    variables = {"search": str(order.number)}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_ORDERS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["ordersAutocomplete"]
+    assert data[0]["id"] == graphene.Node.to_global_id("Order", order.pk)
+
+
+def test_orders_autocomplete_by_email_prefix(
+    staff_api_client, permission_group_manage_orders, order_list
+):
+    # given
+    permission_group_manage_orders.user_set.add(staff_api_client.user)
+    variables = {"search": order_list[0].user_email[:4]}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_ORDERS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["ordersAutocomplete"]
+    assert [order["number"] for order in data] == [
+        str(order.number)
+        for order in sorted(order_list, key=lambda order: order.number, reverse=True)
+    ]
+
+
+def test_orders_autocomplete_no_permission(staff_api_client, order_list):
+    # given
+    variables = {"search": str(order_list[0].number)}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_ORDERS_AUTOCOMPLETE, variables)
+
+    # then
+    assert_no_permission(response)
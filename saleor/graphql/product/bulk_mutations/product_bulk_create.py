@@ -19,6 +19,7 @@ from ....permission.enums import ProductPermissions
 from ....product import ProductMediaTypes, models
 from ....product.error_codes import ProductBulkCreateErrorCode
 from ....product.models import CollectionProduct
+from ....thumbnail.tasks import pregenerate_product_media_thumbnails
 from ....thumbnail.utils import get_filename_from_url
 from ....warehouse.models import Warehouse
 from ....webhook.event_types import WebhookEventAsyncType
@@ -766,10 +767,13 @@ class ProductBulkCreate(BaseMutation):
 
         models.Product.objects.bulk_create(products_to_create)
         models.ProductMedia.objects.bulk_create(media_to_create)
+        cls.call_event(
+            pregenerate_product_media_thumbnails,
+            [media.pk for media in media_to_create if media.image],
+        )
         models.ProductChannelListing.objects.bulk_create(listings_to_create)
 
-        for product, attributes in attributes_to_save:
-            ProductAttributeAssignmentMixin.save(product, attributes)
+        ProductAttributeAssignmentMixin.save_bulk(attributes_to_save)
 
         if variants_input_data:
             variants = cls.save_variants(info, variants_input_data)
@@ -868,15 +872,15 @@ class ProductBulkCreate(BaseMutation):
     @classmethod
     def post_save_actions(cls, info, products, variants, channels):
         manager = get_plugin_manager_promise(info.context).get()
-        product_ids = []
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_CREATED)
-        for product in products:
-            cls.call_event(manager.product_created, product.node, webhooks=webhooks)
-            product_ids.append(product.node.id)
+        cls.call_event(
+            manager.products_created,
+            [product.node for product in products],
+            webhooks=webhooks,
+        )
 
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_CREATED)
-        for variant in variants:
-            cls.call_event(manager.product_variant_created, variant, webhooks=webhooks)
+        cls.call_event(manager.product_variants_created, variants, webhooks=webhooks)
 
         if products:
             channel_ids = {channel.id for channel in channels}
@@ -889,8 +889,7 @@ class ProductVariantBulkCreate(BaseMutation):
                 cls.set_variant_name(variant, cleaned_input)
         models.ProductVariant.objects.bulk_create(variants_to_create)
 
-        for variant, attributes in attributes_to_save:
-            AttributeAssignmentMixin.save(variant, attributes)
+        AttributeAssignmentMixin.save_bulk(attributes_to_save)
 
         warehouse_models.Stock.objects.bulk_create(stocks_to_create)
         models.ProductVariantChannelListing.objects.bulk_create(listings_to_create)
@@ -928,10 +927,11 @@ class ProductVariantBulkCreate(BaseMutation):
 
         webhooks = get_webhooks_for_event(WebhookEventAsyncType.PRODUCT_VARIANT_CREATED)
         manager = get_plugin_manager_promise(info.context).get()
-        for instance in instances:
-            cls.call_event(
-                manager.product_variant_created, instance.node, webhooks=webhooks
-            )
+        cls.call_event(
+            manager.product_variants_created,
+            [instance.node for instance in instances],
+            webhooks=webhooks,
+        )
 
     @classmethod
     @traced_atomic_transaction()
@@ -126,13 +126,14 @@ class ProductVariantBulkDelete(ModelBulkDeleteMutation):
 
             app = get_app_promise(info.context).get()
             # run order event for deleted lines
-            for (
-                order,
-                order_lines,
-            ) in draft_order_lines_data.order_to_lines_mapping.items():
-                order_events.order_line_variant_removed_event(
-                    order, info.context.user, app, order_lines
-                )
+            with order_events.buffered_order_events():
+                for (
+                    order,
+                    order_lines,
+                ) in draft_order_lines_data.order_to_lines_mapping.items():
+                    order_events.order_line_variant_removed_event(
+                        order, info.context.user, app, order_lines
+                    )
 
         order_pks = draft_order_lines_data.order_pks
         if order_pks:
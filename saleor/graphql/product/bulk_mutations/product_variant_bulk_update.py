@@ -1,7 +1,9 @@
+import copy
 from collections import defaultdict
 from typing import cast
 
 import graphene
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db.models import F, Subquery
 from django.utils import timezone
@@ -38,6 +40,25 @@ from .product_variant_bulk_create import (
     get_results,
 )
 
+VARIANT_FIELDS_TO_UPDATE = [
+    "name",
+    "sku",
+    "track_inventory",
+    "weight",
+    "quantity_limit_per_customer",
+    "metadata",
+    "private_metadata",
+    "external_reference",
+]
+
+# Maps the channel listing update input fields to the channel listing fields.
+CHANNEL_LISTING_INPUT_FIELDS = {
+    "price": "price_amount",
+    "cost_price": "cost_price_amount",
+    "prior_price": "prior_price_amount",
+    "preorder_threshold": "preorder_quantity_threshold",
+}
+
 
 class ProductVariantStocksUpdateInput(BaseInputObjectType):
     create = NonNullList(
@@ -275,6 +296,9 @@ class ProductVariantBulkUpdate(BaseMutation):
                 if len(index_error_map[variant_index]) > errors_count_before_prices:
                     continue
 
+                if not cls.is_channel_listing_changed(channel_listing, listing_data):
+                    continue
+
                 listing_data["channel_listings"] = channel_listing
                 listings_to_update.append(listing_data)
             cleaned_input["channel_listings"]["update"] = listings_to_update
@@ -353,6 +377,8 @@ class ProductVariantBulkUpdate(BaseMutation):
                     continue
 
                 stock_data["stock"] = stock_global_id_to_instance_map[stock_id]
+                if stock_data["stock"].quantity == stock_data["quantity"]:
+                    continue
                 stock_data["stock"].quantity = stock_data["quantity"]
                 stocks_to_update.append(stock_data)
 
@@ -570,16 +596,28 @@ class ProductVariantBulkUpdate(BaseMutation):
                 metadata_list = cleaned_input.pop("metadata", None)
                 private_metadata_list = cleaned_input.pop("private_metadata", None)
                 instance = cleaned_input.pop("id")
+                original_values = {
+                    field: copy.copy(getattr(instance, field))
+                    for field in VARIANT_FIELDS_TO_UPDATE
+                }
                 instance = cls.construct_instance(instance, cleaned_input)
                 cls.validate_and_update_metadata(
                     instance, metadata_list, private_metadata_list
                 )
                 cls.clean_instance(info, instance)
+                changed_fields = [
+                    field
+                    for field in VARIANT_FIELDS_TO_UPDATE
+                    if getattr(instance, field) != original_values[field]
+                ]
                 instances_data_and_errors_list.append(
                     {
                         "instance": instance,
                         "errors": index_error_map[index],
                         "cleaned_input": cleaned_input,
+                        "changed_fields": changed_fields,
+                        "changed": bool(changed_fields)
+                        or cls.has_related_changes(cleaned_input),
                     }
                 )
             except ValidationError as exc:
@@ -597,6 +635,29 @@ class ProductVariantBulkUpdate(BaseMutation):
                 )
         return instances_data_and_errors_list
 
+    @classmethod
+    def is_channel_listing_changed(cls, channel_listing, listing_data) -> bool:
+        return any(
+            getattr(channel_listing, field) != listing_data[input_field]
+            for input_field, field in CHANNEL_LISTING_INPUT_FIELDS.items()
+            if input_field in listing_data
+        )
+
+    @classmethod
+    def has_related_changes(cls, cleaned_input) -> bool:
+        """Return whether the input changes attributes, stocks or channel listings.
+
+        Updates of stocks and channel listings that don't change any value are
+        dropped while cleaning the input.
+        """
+        if cleaned_input.get("attributes"):
+            return True
+        for related_input in ["stocks", "channel_listings"]:
+            related_data = cleaned_input.get(related_input) or {}
+            if any(related_data.get(key) for key in ["create", "update", "remove"]):
+                return True
+        return False
+
     @classmethod
     def prepare_stocks(cls, variant, stocks_input, stocks_to_create, stocks_to_update):
         if stocks_data := stocks_input.get("create"):
@@ -653,7 +714,7 @@ class ProductVariantBulkUpdate(BaseMutation):
     @classmethod
     @traced_atomic_transaction()
     def save_variants(cls, variants_data_with_errors_list, error_policy):
-        variants_to_update: list = []
+        variants_to_update: dict[tuple[str, ...], list] = defaultdict(list)
         stocks_to_create: list = []
         stocks_to_update: list = []
         stocks_to_remove: list = []
@@ -669,7 +730,8 @@ class ProductVariantBulkUpdate(BaseMutation):
                 continue
 
             cleaned_input = variant_data.pop("cleaned_input")
-            variants_to_update.append(variant)
+            if changed_fields := variant_data.pop("changed_fields"):
+                variants_to_update[tuple(changed_fields)].append(variant)
 
             if stocks_input := cleaned_input.get("stocks"):
                 cls.prepare_stocks(
@@ -688,20 +750,9 @@ class ProductVariantBulkUpdate(BaseMutation):
             if attributes := cleaned_input.get("attributes"):
                 AttributeAssignmentMixin.save(variant, attributes)
 
-        # perform db queries
-        models.ProductVariant.objects.bulk_update(
-            variants_to_update,
-            [
-                "name",
-                "sku",
-                "track_inventory",
-                "weight",
-                "quantity_limit_per_customer",
-                "metadata",
-                "private_metadata",
-                "external_reference",
-            ],
-        )
+        # perform db queries, updating only the changed columns of changed variants
+        for fields, variants in variants_to_update.items():
+            models.ProductVariant.objects.bulk_update(variants, fields)
         if error_policy == ErrorPolicyEnum.REJECT_EVERYTHING.value:
             warehouse_models.Stock.objects.bulk_create(stocks_to_create)
         else:
@@ -751,18 +802,19 @@ class ProductVariantBulkUpdate(BaseMutation):
             cls.call_event(
                 mark_active_catalogue_promotion_rules_as_dirty, impacted_channel_ids
             )
+        if not instances:
+            return
         manager = get_plugin_manager_promise(info.context).get()
         product.search_index_dirty = True
         product.save(update_fields=["search_index_dirty"])
 
-        for instance in instances:
-            cls.call_event(
-                manager.product_variant_updated,
-                instance.node,
-                webhooks=webhooks,
-                pre_save_payloads=pre_save_payloads,
-                request_time=request_time,
-            )
+        cls.call_event(
+            manager.product_variants_updated,
+            [instance.node for instance in instances],
+            webhooks=webhooks,
+            pre_save_payloads=pre_save_payloads,
+            request_time=request_time,
+        )
 
     @classmethod
     def _get_impacted_channels(cls, cleaned_inputs_map):
@@ -854,9 +906,21 @@ class ProductVariantBulkUpdate(BaseMutation):
         instances = [
             result.product_variant for result in results if result.product_variant
         ]
+        changed_instances = instances
+        if settings.PRODUCT_VARIANT_BULK_UPDATE_SKIP_UNCHANGED:
+            changed_variant_ids = {
+                data["instance"].pk
+                for data in instances_data_with_errors_list
+                if data["instance"] and data.get("changed", True)
+            }
+            changed_instances = [
+                instance
+                for instance in instances
+                if instance.node.pk in changed_variant_ids
+            ]
         cls.post_save_actions(
             info,
-            instances,
+            changed_instances,
             product,
             webhooks,
             pre_save_payloads,
@@ -7,6 +7,7 @@ from .....core.utils.validators import get_oembed_data
 from .....permission.enums import ProductPermissions
 from .....product import ProductMediaTypes, models
 from .....product.error_codes import ProductErrorCode
+from .....thumbnail.tasks import pregenerate_product_media_thumbnails
 from .....thumbnail.utils import get_filename_from_url
 from ....channel import ChannelContext
 from ....core import ResolveInfo
@@ -139,6 +140,8 @@ class ProductMediaCreate(BaseMutation):
                     type=media_type,
                     oembed_data=oembed_data,
                 )
+        if media and media.image:
+            cls.call_event(pregenerate_product_media_thumbnails, [media.pk])
         manager = get_plugin_manager_promise(info.context).get()
         cls.call_event(manager.product_updated, product)
         cls.call_event(manager.product_media_created, media)
@@ -121,13 +121,14 @@ class ProductVariantDelete(ModelDeleteMutation, ModelWithExtRefMutation):
 
             # run order event for deleted lines
             app = get_app_promise(info.context).get()
-            for (
-                order,
-                order_lines,
-            ) in draft_order_lines_data.order_to_lines_mapping.items():
-                order_events.order_line_variant_removed_event(
-                    order, info.context.user, app, order_lines
-                )
+            with order_events.buffered_order_events():
+                for (
+                    order,
+                    order_lines,
+                ) in draft_order_lines_data.order_to_lines_mapping.items():
+                    order_events.order_line_variant_removed_event(
+                        order, info.context.user, app, order_lines
+                    )
             manager = get_plugin_manager_promise(info.context).get()
 
             order_pks = draft_order_lines_data.order_pks
@@ -4,7 +4,7 @@ from promise import Promise
 from ...permission.enums import ProductPermissions
 from ...permission.utils import has_one_of_permissions
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
-from ...product.search import search_products
+from ...product.search import autocomplete_products, search_products
 from ..channel import ChannelContext, ChannelQsContext
 from ..channel.dataloaders import ChannelBySlugLoader
 from ..channel.utils import get_default_channel_slug_or_graphql_error
@@ -13,6 +13,7 @@ from ..core.connection import create_connection_slice, filter_connection_queryse
 from ..core.descriptions import (
     ADDED_IN_321,
     DEPRECATED_IN_3X_FIELD,
+    PREVIEW_FEATURE,
 )
 from ..core.doc_category import DOC_CATEGORY_PRODUCTS
 from ..core.enums import LanguageCodeEnum, ReportingPeriod
@@ -25,7 +26,10 @@ from ..core.fields import (
 from ..core.tracing import traced_resolver
 from ..core.types import NonNullList
 from ..core.utils import from_global_id_or_error
-from ..core.validators import validate_one_of_args_is_in_query
+from ..core.validators import (
+    validate_autocomplete_limit,
+    validate_one_of_args_is_in_query,
+)
 from ..translations.mutations import (
     CategoryTranslate,
     CollectionTranslate,
@@ -273,6 +277,31 @@ class ProductQueries(graphene.ObjectType):
         ),
         doc_category=DOC_CATEGORY_PRODUCTS,
     )
+    products_autocomplete = BaseField(
+        NonNullList(Product),
+        search=graphene.String(
+            description="Part of a product name or beginning of a variant SKU.",
+            required=True,
+        ),
+        first=graphene.Int(
+            description="Maximum number of returned products.", default_value=10
+        ),
+        channel=graphene.String(
+            description="Slug of a channel for which the data should be returned."
+        ),
+        description=(
+            "Look up products by a part of their name or the beginning of a variant "
+            "SKU; products with the name or SKU starting with the searched value "
+            "are returned first. Intended for as-you-type search, returns a plain "
+            "list without pagination. Requires one of the following permissions "
+            "to include the unpublished items: "
+            f"{', '.join([p.name for p in ALL_PRODUCTS_PERMISSIONS])}."
+            + ADDED_IN_321
+            + PREVIEW_FEATURE
+        ),
+        required=True,
+        doc_category=DOC_CATEGORY_PRODUCTS,
+    )
     product_type = BaseField(
         ProductType,
         id=graphene.Argument(
@@ -542,6 +571,37 @@ class ProductQueries(graphene.ObjectType):
             )
         return _resolve_products(None)
 
+    @staticmethod
+    @traced_resolver
+    def resolve_products_autocomplete(
+        _root, info: ResolveInfo, *, search, first, channel=None
+    ):
+        limit = validate_autocomplete_limit(first)
+        requestor = get_user_or_app_from_context(info.context)
+        has_required_permissions = has_one_of_permissions(
+            requestor, ALL_PRODUCTS_PERMISSIONS
+        )
+        limited_channel_access = False if channel is None else True
+        if channel is None and not has_required_permissions:
+            channel = get_default_channel_slug_or_graphql_error(
+                allow_replica=info.context.allow_replica
+            )
+
+        def _resolve_products(channel_obj):
+            qs = resolve_products(info, requestor, channel_obj, limited_channel_access)
+            return [
+                ChannelContext(node=product, channel_slug=channel)
+                for product in autocomplete_products(qs.qs, search, limit)
+            ]
+
+        if channel:
+            return (
+                ChannelBySlugLoader(info.context)
+                .load(str(channel))
+                .then(_resolve_products)
+            )
+        return _resolve_products(None)
+
     @staticmethod
     def resolve_product_type(_root, info: ResolveInfo, *, id):
         _, id = from_global_id_or_error(id, ProductType)
@@ -92,7 +92,7 @@ PRODUCT_VARIANT_BULK_UPDATE_MUTATION = """
     "saleor.graphql.product.bulk_mutations."
     "product_variant_bulk_update.get_webhooks_for_event"
 )
-@patch("saleor.plugins.manager.PluginsManager.product_variant_updated")
+@patch("saleor.plugins.manager.PluginsManager.product_variants_updated")
 def test_product_variant_bulk_update(
     product_variant_created_webhook_mock,
     mocked_get_webhooks_for_event,
@@ -144,11 +144,131 @@ def test_product_variant_bulk_update(
     assert variant_data["metadata"][0]["value"] == metadata_value
     assert product_with_single_variant.variants.count() == 1
     assert old_name != new_name
-    assert product_variant_created_webhook_mock.call_count == data["count"]
+    product_variant_created_webhook_mock.assert_called_once()
+    assert len(product_variant_created_webhook_mock.call_args.args[0]) == data["count"]
     for rule in get_active_catalogue_promotion_rules():
         assert rule.variants_dirty
 
 
+@patch(
+    "saleor.graphql.product.bulk_mutations."
+    "product_variant_bulk_update.get_webhooks_for_event"
+)
+@patch("saleor.plugins.manager.PluginsManager.product_variants_updated")
+def test_product_variant_bulk_update_skip_unchanged_variants(
+    product_variants_updated_mock,
+    mocked_get_webhooks_for_event,
+    staff_api_client,
+    product_with_two_variants,
+    permission_manage_products,
+    any_webhook,
+    settings,
+):
+    # given
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    settings.PRODUCT_VARIANT_BULK_UPDATE_SKIP_UNCHANGED = True
+    product = product_with_two_variants
+    unchanged_variant, changed_variant = product.variants.all()
+    stock = unchanged_variant.stocks.first()
+    new_name = "new-random-name"
+    assert changed_variant.name != new_name
+
+    variants = [
+        {
+            "id": graphene.Node.to_global_id("ProductVariant", unchanged_variant.pk),
+            "name": unchanged_variant.name,
+            "stocks": {
+                "update": [
+                    {
+                        "quantity": stock.quantity,
+                        "stock": graphene.Node.to_global_id("Stock", stock.pk),
+                    }
+                ]
+            },
+        },
+        {
+            "id": graphene.Node.to_global_id("ProductVariant", changed_variant.pk),
+            "name": new_name,
+        },
+    ]
+    variables = {
+        "productId": graphene.Node.to_global_id("Product", product.pk),
+        "variants": variants,
+    }
+
+    # when
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    with patch(
+        "saleor.graphql.product.bulk_mutations."
+        "product_variant_bulk_update.stock_bulk_update"
+    ) as stock_bulk_update_mock:
+        response = staff_api_client.post_graphql(
+            PRODUCT_VARIANT_BULK_UPDATE_MUTATION, variables
+        )
+    content = get_graphql_content(response)
+    data = content["data"]["productVariantBulkUpdate"]
+
+    # then
+    assert data["count"] == 2
+    changed_variant.refresh_from_db(fields=["name"])
+    assert changed_variant.name == new_name
+    stock_bulk_update_mock.assert_not_called()
+    product_variants_updated_mock.assert_called_once()
+    [updated_variant] = product_variants_updated_mock.call_args.args[0]
+    assert updated_variant.pk == changed_variant.pk
+
+
+@patch(
+    "saleor.graphql.product.bulk_mutations."
+    "product_variant_bulk_update.get_webhooks_for_event"
+)
+@patch("saleor.plugins.manager.PluginsManager.product_variants_updated")
+def test_product_variant_bulk_update_without_changes(
+    product_variants_updated_mock,
+    mocked_get_webhooks_for_event,
+    staff_api_client,
+    product_with_single_variant,
+    permission_manage_products,
+    any_webhook,
+    settings,
+):
+    # given
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    settings.PRODUCT_VARIANT_BULK_UPDATE_SKIP_UNCHANGED = True
+    product = product_with_single_variant
+    product.search_index_dirty = False
+    product.save(update_fields=["search_index_dirty"])
+    variant = product.variants.get()
+
+    variants = [
+        {
+            "id": graphene.Node.to_global_id("ProductVariant", variant.pk),
+            "name": variant.name,
+        }
+    ]
+    variables = {
+        "productId": graphene.Node.to_global_id("Product", product.pk),
+        "variants": variants,
+    }
+
+    # when
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_BULK_UPDATE_MUTATION, variables
+    )
+    content = get_graphql_content(response)
+    data = content["data"]["productVariantBulkUpdate"]
+
+    # then
+    assert data["count"] == 1
+    assert not data["results"][0]["errors"]
+    product_variants_updated_mock.assert_not_called()
+    product.refresh_from_db(fields=["search_index_dirty"])
+    assert product.search_index_dirty is False
+
+
 @pytest.mark.parametrize(
     "error_policy",
     [ErrorPolicyEnum.REJECT_FAILED_ROWS.name, ErrorPolicyEnum.IGNORE_FAILED.name],
@@ -0,0 +1,85 @@
+import graphene
+import pytest
+
+from ....tests.utils import get_graphql_content, get_graphql_content_from_response
+
+QUERY_PRODUCTS_AUTOCOMPLETE = """
+    query ($search: String!, $first: Int, $channel: String) {
+        productsAutocomplete(search: $search, first: $first, channel: $channel) {
+            id
+            name
+        }
+    }
+"""
+
+
+def test_products_autocomplete_by_name(
+    staff_api_client, permission_manage_products, product_list, channel_USD
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    variables = {"search": "test prod", "channel": channel_USD.slug}
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_PRODUCTS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productsAutocomplete"]
+    assert {product["name"] for product in data} == {
+        product.name for product in product_list
+    }
+
+
+def test_products_autocomplete_by_sku_prefix(api_client, product_list, channel_USD):
+    # given
+    product = product_list[0]
+    sku = product.variants.first().sku
+    variables = {"search": sku[:8], "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["productsAutocomplete"]
+    assert data[0]["id"] == graphene.Node.to_global_id("Product", product.pk)
+
+
+def test_products_autocomplete_limits_results(api_client, product_list, channel_USD):
+    # given
+    variables = {"search": "product", "first": 1, "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert len(content["data"]["productsAutocomplete"]) == 1
+
+
+def test_products_autocomplete_empty_search(api_client, product_list, channel_USD):
+    # given
+    variables = {"search": "  ", "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert content["data"]["productsAutocomplete"] == []
+
+
+@pytest.mark.parametrize("first", [0, 1000])
+def test_products_autocomplete_invalid_limit(
+    first, api_client, product_list, channel_USD
+):
+    # given
+    variables = {"search": "product", "first": first, "channel": channel_USD.slug}
+
+    # when
+    response = api_client.post_graphql(QUERY_PRODUCTS_AUTOCOMPLETE, variables)
+
+    # then
+    content = get_graphql_content_from_response(response)
+    assert content["errors"][0]["message"].startswith("Argument 'first' must be")
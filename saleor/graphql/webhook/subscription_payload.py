@@ -15,6 +15,7 @@ from ...account.models import User
 from ...app.models import App
 from ...core.exceptions import PermissionDenied
 from ...core.utils import get_domain
+from ...webhook.event_types import WebhookEventSyncType
 from ...webhook.models import Webhook
 from ..core import SaleorContext
 from ..core.dataloaders import DataLoader
@@ -129,7 +130,12 @@ def generate_payload_promise_from_subscription(
             return None
 
         payload_instance = payload[0]
-        event_payload = payload_instance.data.get("event") or {}
+        if "event" in payload_instance.data or not payload_instance.data:
+            event_payload = payload_instance.data.get("event") or {}
+        else:
+            event_payload = Promise.for_dict(payload_instance.data).then(
+                lambda data: {"data": data}
+            )
 
         def check_errors(event_payload, payload_instance=payload_instance):
             if payload_instance.errors:
@@ -225,6 +231,57 @@ def generate_payload_from_subscription(
     return event_payload
 
 
+def generate_payloads_from_subscription(
+    event_type: str,
+    subscribable_objects: Iterable,
+    webhooks: Iterable[Webhook],
+    requestor=None,
+    allow_replica=False,
+    request_time: datetime.datetime | None = None,
+) -> list[tuple[Any, Webhook, dict[str, Any] | None]]:
+    """Generate webhook payloads for multiple objects and webhooks in one batch.
+
+    All payloads share a single request, so dataloaders are bound to one context
+    and their cache is reused between webhooks. Webhooks are processed one by one,
+    as the request holds the app the payload is generated for. For each webhook,
+    subscription queries are executed for all objects before any payload is
+    resolved, so dataloaders load the keys of all objects at once.
+
+    return: A list of (subscribable object, webhook, payload) tuples, ordered by the
+    objects and then by the webhooks. The payload is None if the function was not
+    able to generate it.
+    """
+    subscribable_objects = list(subscribable_objects)
+    webhooks = list(webhooks)
+    request = initialize_request(
+        requestor,
+        event_type in WebhookEventSyncType.ALL,
+        event_type=event_type,
+        allow_replica=allow_replica,
+        request_time=request_time,
+    )
+
+    payloads_per_webhook = []
+    for webhook in webhooks:
+        promises = [
+            generate_payload_promise_from_subscription(
+                event_type=event_type,
+                subscribable_object=subscribable_object,
+                subscription_query=webhook.subscription_query,
+                request=request,
+                app=webhook.app,
+            )
+            for subscribable_object in subscribable_objects
+        ]
+        payloads_per_webhook.append(Promise.all(promises).get())
+
+    return [
+        (subscribable_object, webhook, payloads[object_index])
+        for object_index, subscribable_object in enumerate(subscribable_objects)
+        for webhook, payloads in zip(webhooks, payloads_per_webhook, strict=True)
+    ]
+
+
 def get_pre_save_payload_key(webhook, instance):
     return f"{webhook.pk}_{instance.pk}"
 
@@ -1,12 +1,16 @@
 import graphene
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
+from ....product.models import Category
 from ....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ....webhook.models import Webhook
 from ..subscription_payload import (
     generate_payload_from_subscription,
     generate_payload_promise_from_subscription,
+    generate_payloads_from_subscription,
     generate_pre_save_payloads,
     get_pre_save_payload_key,
     initialize_request,
@@ -444,3 +448,121 @@ def test_generate_payload_promise_from_subscription_unable_to_build_payload(
     # then
     payload = payload.get()
     assert payload is None
+
+
+def test_generate_payloads_from_subscription(
+    product_list, subscription_product_updated_webhook, webhook_app
+):
+    # given
+    second_webhook = Webhook.objects.create(
+        name="Second webhook",
+        app=webhook_app,
+        subscription_query=subscription_product_updated_webhook.subscription_query,
+    )
+    webhooks = [subscription_product_updated_webhook, second_webhook]
+
+    # when
+    payloads = generate_payloads_from_subscription(
+        event_type=WebhookEventAsyncType.PRODUCT_UPDATED,
+        subscribable_objects=product_list,
+        webhooks=webhooks,
+    )
+
+    # then
+    assert [(product, webhook) for product, webhook, _ in payloads] == [
+        (product, webhook) for product in product_list for webhook in webhooks
+    ]
+    for product, _, payload in payloads:
+        assert payload == {
+            "product": {"id": graphene.Node.to_global_id("Product", product.pk)}
+        }
+
+
+PRODUCT_UPDATED_WITH_RELATIONS_SUBSCRIPTION_QUERY = """
+    subscription {
+        event {
+            ... on ProductUpdated {
+                product {
+                    id
+                    category {
+                        name
+                    }
+                    productType {
+                        name
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+def test_generate_payloads_from_subscription_with_dataloaders(
+    product_list, subscription_webhook
+):
+    # given
+    for index, product in enumerate(product_list):
+        product.category = Category.objects.create(
+            name=f"Category {index}", slug=f"category-{index}"
+        )
+        product.save(update_fields=["category"])
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    webhooks = [
+        subscription_webhook(
+            PRODUCT_UPDATED_WITH_RELATIONS_SUBSCRIPTION_QUERY, event_type, name=name
+        )
+        for name in ["Webhook 1", "Webhook 2"]
+    ]
+
+    # when
+    payloads = generate_payloads_from_subscription(
+        event_type=event_type,
+        subscribable_objects=product_list,
+        webhooks=webhooks,
+    )
+
+    # then
+    assert [(product, webhook) for product, webhook, _ in payloads] == [
+        (product, webhook) for product in product_list for webhook in webhooks
+    ]
+    for product, _, payload in payloads:
+        assert payload == {
+            "product": {
+                "id": graphene.Node.to_global_id("Product", product.pk),
+                "category": {"name": product.category.name},
+                "productType": {"name": product.product_type.name},
+            }
+        }
+
+
+def test_generate_payloads_from_subscription_queries_do_not_grow_with_objects(
+    product_list, subscription_webhook
+):
+    # given
+    for index, product in enumerate(product_list):
+        product.category = Category.objects.create(
+            name=f"Category {index}", slug=f"category-{index}"
+        )
+        product.save(update_fields=["category"])
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+    for name in ["Webhook 1", "Webhook 2"]:
+        subscription_webhook(
+            PRODUCT_UPDATED_WITH_RELATIONS_SUBSCRIPTION_QUERY, event_type, name=name
+        )
+
+    def count_queries(products):
+        webhooks = list(Webhook.objects.select_related("app"))
+        with CaptureQueriesContext(connection) as queries:
+            generate_payloads_from_subscription(
+                event_type=event_type,
+                subscribable_objects=products,
+                webhooks=webhooks,
+            )
+        return len(queries)
+
+    # when
+    single_object_query_count = count_queries(product_list[:1])
+    multiple_objects_query_count = count_queries(product_list)
+
+    # then
+    assert multiple_objects_query_count == single_object_query_count
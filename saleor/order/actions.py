@@ -62,6 +62,7 @@ from .events import (
     order_returned_event,
 )
 from .fetch import OrderLineInfo
+from .list_projection import update_order_list_projections
 from .models import Fulfillment, FulfillmentLine, Order, OrderLine
 from .notifications import (
     send_fulfillment_confirmation_to_customer,
@@ -227,6 +228,12 @@ def call_order_events(
             webhook_event_map=webhook_event_map,
         )
 
+    if (
+        settings.UPDATE_ORDER_LIST_PROJECTIONS
+        and WebhookEventAsyncType.DRAFT_ORDER_DELETED not in event_names
+    ):
+        update_order_list_projections([order.pk])
+
     for event_name in event_names:
         plugin_manager_method_name = ORDER_WEBHOOK_EVENT_MAP[event_name]
         webhooks = webhook_event_map.get(event_name, set())
@@ -254,10 +261,14 @@ def call_order_event(
 
     webhooks = webhook_event_map.get(event_name, set())
 
-    if order.status not in ORDER_EDITABLE_STATUS:
+    if event_name == WebhookEventAsyncType.DRAFT_ORDER_DELETED:
         call_event_including_protected_events(event_func, order, webhooks=webhooks)
         return
-    if event_name == WebhookEventAsyncType.DRAFT_ORDER_DELETED:
+
+    if settings.UPDATE_ORDER_LIST_PROJECTIONS:
+        update_order_list_projections([order.pk])
+
+    if order.status not in ORDER_EDITABLE_STATUS:
         call_event_including_protected_events(event_func, order, webhooks=webhooks)
         return
 
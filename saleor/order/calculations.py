@@ -4,7 +4,7 @@ from decimal import Decimal
 
 from django.conf import settings
 from django.db import transaction
-from django.db.models import prefetch_related_objects
+from django.db.models import Prefetch, prefetch_related_objects
 from prices import Money, TaxedMoney
 
 from ..core.db.connection import allow_writer
@@ -32,13 +32,49 @@ from ..tax.utils import (
 )
 from . import ORDER_EDITABLE_STATUS
 from .base_calculations import apply_order_discounts, base_order_line_total
-from .fetch import EditableOrderLineInfo, fetch_draft_order_lines_info
+from .fetch import (
+    DRAFT_ORDER_LINES_PREFETCH_FIELDS,
+    EditableOrderLineInfo,
+    fetch_draft_order_lines_info,
+)
 from .interface import OrderTaxedPricesData
 from .models import Order, OrderLine
 from .utils import log_address_if_validation_skipped_for_order, order_info_for_logs
 
 logger = logging.getLogger(__name__)
 
+ORDER_PRICE_FIELDS = [
+    "subtotal_net_amount",
+    "subtotal_gross_amount",
+    "total_net_amount",
+    "total_gross_amount",
+    "undiscounted_total_net_amount",
+    "undiscounted_total_gross_amount",
+    "shipping_price_net_amount",
+    "shipping_price_gross_amount",
+    "base_shipping_price_amount",
+    "shipping_tax_rate",
+    "should_refresh_prices",
+    "tax_error",
+]
+
+ORDER_LINE_PRICE_FIELDS = [
+    "unit_price_net_amount",
+    "unit_price_gross_amount",
+    "undiscounted_unit_price_net_amount",
+    "undiscounted_unit_price_gross_amount",
+    "total_price_net_amount",
+    "total_price_gross_amount",
+    "undiscounted_total_price_net_amount",
+    "undiscounted_total_price_gross_amount",
+    "tax_rate",
+    "unit_discount_amount",
+    "unit_discount_reason",
+    "unit_discount_type",
+    "unit_discount_value",
+    "base_unit_price_amount",
+]
+
 
 def fetch_order_prices_if_expired(
     order: Order,
@@ -60,6 +96,80 @@ def fetch_order_prices_if_expired(
     if not force_update and not order.should_refresh_prices:
         return order, lines
 
+    lines = _calculate_order_prices(
+        order, manager, lines, database_connection_name=database_connection_name
+    )
+    with transaction.atomic(savepoint=False):
+        with allow_writer():
+            order.save(update_fields=ORDER_PRICE_FIELDS)
+            order.lines.bulk_update(lines, ORDER_LINE_PRICE_FIELDS)
+
+        return order, lines
+
+
+def fetch_orders_prices_if_expired(
+    orders: Iterable[Order],
+    manager: PluginsManager,
+    force_update: bool = False,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[Order]:
+    """Fetch prices with taxes of multiple orders.
+
+    Works like `fetch_order_prices_if_expired`, but lines, channels, tax
+    configurations and promotion rules of all orders are loaded at once and
+    the prices are saved with a single update of orders and of their lines.
+
+    Return the orders whose prices were recalculated.
+    """
+    orders = [
+        order
+        for order in orders
+        if order.status in ORDER_EDITABLE_STATUS
+        and (force_update or order.should_refresh_prices)
+    ]
+    if not orders:
+        return []
+
+    with allow_writer():
+        prefetch_related_objects(
+            orders,
+            "channel__tax_configuration__country_exceptions",
+            "shipping_address",
+            "billing_address",
+            "shipping_method__tax_class__country_rates",
+            "voucher",
+            Prefetch(
+                "lines",
+                queryset=OrderLine.objects.prefetch_related(
+                    *DRAFT_ORDER_LINES_PREFETCH_FIELDS, "tax_class__country_rates"
+                ),
+            ),
+        )
+
+    all_lines: list[OrderLine] = []
+    for order in orders:
+        lines = _calculate_order_prices(
+            order,
+            manager,
+            list(order.lines.all()),
+            database_connection_name=database_connection_name,
+        )
+        all_lines.extend(lines)
+
+    with transaction.atomic(savepoint=False):
+        with allow_writer():
+            Order.objects.bulk_update(orders, ORDER_PRICE_FIELDS)
+            OrderLine.objects.bulk_update(all_lines, ORDER_LINE_PRICE_FIELDS)
+
+    return orders
+
+
+def _calculate_order_prices(
+    order: Order,
+    manager: PluginsManager,
+    lines: Iterable[OrderLine] | None,
+    database_connection_name: str = settings.DATABASE_CONNECTION_DEFAULT_NAME,
+) -> list[OrderLine]:
     # handle promotions
     lines_info: list[EditableOrderLineInfo] = fetch_draft_order_lines_info(order, lines)
     create_or_update_discount_objects_for_order(
@@ -81,45 +191,7 @@ def fetch_order_prices_if_expired(
     )
 
     order.should_refresh_prices = False
-    with transaction.atomic(savepoint=False):
-        with allow_writer():
-            order.save(
-                update_fields=[
-                    "subtotal_net_amount",
-                    "subtotal_gross_amount",
-                    "total_net_amount",
-                    "total_gross_amount",
-                    "undiscounted_total_net_amount",
-                    "undiscounted_total_gross_amount",
-                    "shipping_price_net_amount",
-                    "shipping_price_gross_amount",
-                    "base_shipping_price_amount",
-                    "shipping_tax_rate",
-                    "should_refresh_prices",
-                    "tax_error",
-                ]
-            )
-            order.lines.bulk_update(
-                lines,
-                [
-                    "unit_price_net_amount",
-                    "unit_price_gross_amount",
-                    "undiscounted_unit_price_net_amount",
-                    "undiscounted_unit_price_gross_amount",
-                    "total_price_net_amount",
-                    "total_price_gross_amount",
-                    "undiscounted_total_price_net_amount",
-                    "undiscounted_total_price_gross_amount",
-                    "tax_rate",
-                    "unit_discount_amount",
-                    "unit_discount_reason",
-                    "unit_discount_type",
-                    "unit_discount_value",
-                    "base_unit_price_amount",
-                ],
-            )
-
-        return order, lines
+    return lines
 
 
 def _clear_prefetched_discounts(order, lines):
@@ -1,5 +1,10 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+from django.conf import settings
 
 from ..account import events as account_events
 from ..account.models import User
@@ -13,6 +18,60 @@ from .models import OrderEvent
 if TYPE_CHECKING:
     from uuid import UUID
 
+_buffered_events: ContextVar[list[OrderEvent] | None] = ContextVar(
+    "buffered_order_events", default=None
+)
+
+
+@contextmanager
+def buffered_order_events() -> Iterator[None]:
+    """Save all order events created within the block with a single query.
+
+    The events are saved when the block exits without an error, so they don't have
+    a primary key before that. Nested blocks share the outermost buffer.
+
+    Buffering is explicit and limited to the block, not tied to the transaction:
+    the events are inserted within the transaction that is open when the block
+    exits, so they're rolled back with it. Use it around code creating events in
+    a loop, whose callers don't need the saved events.
+    """
+    if _buffered_events.get() is not None:
+        yield
+        return
+
+    events: list[OrderEvent] = []
+    token = _buffered_events.set(events)
+    try:
+        yield
+    finally:
+        _buffered_events.reset(token)
+    OrderEvent.objects.bulk_create(events)
+
+
+def _compact_parameters(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _compact_parameters(item)
+            for key, item in value.items()
+            if item is not None
+        }
+    if isinstance(value, list):
+        return [_compact_parameters(item) for item in value]
+    return value
+
+
+def _create_event(**kwargs) -> OrderEvent:
+    event = OrderEvent(**kwargs)
+    if settings.ORDER_EVENTS_COMPACT_PARAMETERS:
+        event.parameters = _compact_parameters(event.parameters)
+
+    events = _buffered_events.get()
+    if events is None:
+        event.save(force_insert=True)
+    else:
+        events.append(event)
+    return event
+
 
 def _line_per_quantity_to_line_object(quantity, line):
     return {"quantity": quantity, "line_pk": line.pk, "item": str(line)}
@@ -41,7 +100,7 @@ def event_transaction_charge_requested(
     user: User | None,
     app: App | None,
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.TRANSACTION_CHARGE_REQUESTED,
         user=user,
@@ -60,7 +119,7 @@ def event_transaction_refund_requested(
     user: User | None,
     app: App | None,
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.TRANSACTION_REFUND_REQUESTED,
         user=user,
@@ -75,7 +134,7 @@ def event_transaction_refund_requested(
 def event_transaction_cancel_requested(
     order_id: "UUID", reference: str, user: User | None, app: App | None
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.TRANSACTION_CANCEL_REQUESTED,
         user=user,
@@ -89,7 +148,7 @@ def event_transaction_cancel_requested(
 def event_order_refunded_notification(
     order_id: "UUID", user_id: int | None, app_id: int | None, customer_email: str
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.EMAIL_SENT,
         parameters={
@@ -104,7 +163,7 @@ def event_order_refunded_notification(
 def event_order_confirmed_notification(
     order_id: "UUID", user_id: int | None, app_id: int | None, customer_email: str
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.EMAIL_SENT,
         parameters={
@@ -119,7 +178,7 @@ def event_order_confirmed_notification(
 def event_order_cancelled_notification(
     order_id: "UUID", user_id: int | None, app_id: int | None, customer_email: str
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.EMAIL_SENT,
         parameters={
@@ -134,7 +193,7 @@ def event_order_cancelled_notification(
 def event_order_confirmation_notification(
     order_id: "UUID", user_id: int | None, customer_email: str
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.EMAIL_SENT,
         parameters={
@@ -148,7 +207,7 @@ def event_order_confirmation_notification(
 def event_fulfillment_confirmed_notification(
     order_id: "UUID", user_id: int | None, app_id: int | None, customer_email: str
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.EMAIL_SENT,
         parameters={
@@ -163,7 +222,7 @@ def event_fulfillment_confirmed_notification(
 def event_fulfillment_digital_links_notification(
     order_id: "UUID", user_id: int | None, app_id: int | None, customer_email: str
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.EMAIL_SENT,
         parameters={
@@ -178,7 +237,7 @@ def event_fulfillment_digital_links_notification(
 def event_payment_confirmed_notification(
     order_id: "UUID", user_id: int | None, customer_email: str
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.EMAIL_SENT,
         parameters={"email": customer_email, "email_type": OrderEventsEmails.PAYMENT},
@@ -192,7 +251,7 @@ def invoice_requested_event(
     user: User | None,
     app: App | None,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order, app=app, type=OrderEvents.INVOICE_REQUESTED, user=user
     )
 
@@ -204,7 +263,7 @@ def invoice_generated_event(
     app: App | None,
     invoice_number: str,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.INVOICE_GENERATED,
         user=user,
@@ -222,7 +281,7 @@ def invoice_updated_event(
     url: str,
     status: str,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.INVOICE_UPDATED,
         user=user,
@@ -234,7 +293,7 @@ def invoice_updated_event(
 def event_invoice_sent_notification(
     *, order_id: "UUID", user_id: int | None, app_id: int | None, email: str
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order_id=order_id,
         type=OrderEvents.INVOICE_SENT,
         user_id=user_id,
@@ -252,7 +311,7 @@ def email_resent_event(
 def draft_order_created_event(
     *, order: Order, user: User | None, app: App | None
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order, type=OrderEvents.DRAFT_CREATED, user=user, app=app
     )
 
@@ -270,7 +329,7 @@ def order_added_products_event(
     else:
         lines = _lines_per_quantity_to_line_object_list(order_lines)
 
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.ADDED_PRODUCTS,
         user=user,
@@ -292,7 +351,7 @@ def order_removed_products_event(
     else:
         lines = _lines_per_quantity_to_line_object_list(order_lines)
 
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.REMOVED_PRODUCTS,
         user=user,
@@ -313,7 +372,7 @@ def draft_order_created_from_replace_event(
         "related_order_pk": original_order.pk,
         "lines": _lines_per_quantity_to_line_object_list(lines),
     }
-    return OrderEvent.objects.create(
+    return _create_event(
         order=draft_order,
         type=OrderEvents.DRAFT_CREATED_FROM_REPLACE,
         user=user,
@@ -342,23 +401,19 @@ def order_created_event(
                 order=order,
             )
 
-    return OrderEvent.objects.create(order=order, type=event_type, user=user, app=app)
+    return _create_event(order=order, type=event_type, user=user, app=app)
 
 
 def order_confirmed_event(
     *, order: Order, user: User | None, app: App | None
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
-        order=order, type=OrderEvents.CONFIRMED, user=user, app=app
-    )
+    return _create_event(order=order, type=OrderEvents.CONFIRMED, user=user, app=app)
 
 
 def order_canceled_event(
     *, order: Order, user: User | None, app: App | None
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
-        order=order, type=OrderEvents.CANCELED, user=user, app=app
-    )
+    return _create_event(order=order, type=OrderEvents.CANCELED, user=user, app=app)
 
 
 def order_manually_marked_as_paid_event(
@@ -371,7 +426,7 @@ def order_manually_marked_as_paid_event(
     parameters = {}
     if transaction_reference:
         parameters = {"transaction_reference": transaction_reference}
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.ORDER_MARKED_AS_PAID,
         user=user,
@@ -390,7 +445,7 @@ def order_fully_paid_event(
     parameters = {}
     if gateway:
         parameters = {"payment_gateway": gateway}
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.ORDER_FULLY_PAID,
         user=user,
@@ -407,7 +462,7 @@ def order_replacement_created(
     app: App | None,
 ) -> OrderEvent:
     parameters = {"related_order_pk": replace_order.pk}
-    return OrderEvent.objects.create(
+    return _create_event(
         order=original_order,
         type=OrderEvents.ORDER_REPLACEMENT_CREATED,
         user=user,
@@ -424,7 +479,7 @@ def payment_authorized_event(
     amount: Decimal,
     payment: Payment,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.PAYMENT_AUTHORIZED,
         user=user,
@@ -441,7 +496,7 @@ def payment_captured_event(
     amount: Decimal,
     payment: Payment,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.PAYMENT_CAPTURED,
         user=user,
@@ -458,7 +513,7 @@ def payment_refunded_event(
     amount: Decimal,
     payment: Payment,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.PAYMENT_REFUNDED,
         user=user,
@@ -470,7 +525,7 @@ def payment_refunded_event(
 def payment_voided_event(
     *, order: Order, user: User | None, app: App | None, payment: Payment
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.PAYMENT_VOIDED,
         user=user,
@@ -492,7 +547,7 @@ def payment_failed_event(
     if payment:
         parameters.update({"gateway": payment.gateway, "payment_id": payment.token})
 
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.PAYMENT_FAILED,
         user=user,
@@ -506,7 +561,7 @@ def transaction_mark_order_as_paid_failed_event(
 ):
     parameters = {"message": message}
 
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.TRANSACTION_MARK_AS_PAID_FAILED,
         user=user,
@@ -524,7 +579,7 @@ def transaction_event(
     message: str,
 ) -> OrderEvent:
     parameters = {"message": message, "reference": reference}
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.TRANSACTION_EVENT,
         user=user,
@@ -544,7 +599,7 @@ def external_notification_event(
     parameters = parameters or {}
     parameters["message"] = message
 
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.EXTERNAL_SERVICE_NOTIFICATION,
         user=user,
@@ -560,7 +615,7 @@ def fulfillment_canceled_event(
     app: App | None,
     fulfillment: Fulfillment | None,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.FULFILLMENT_CANCELED,
         user=user,
@@ -577,7 +632,7 @@ def fulfillment_restocked_items_event(
     fulfillment: Order | Fulfillment,
     warehouse_pk: Optional["UUID"] = None,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.FULFILLMENT_RESTOCKED_ITEMS,
         user=user,
@@ -596,7 +651,7 @@ def fulfillment_fulfilled_items_event(
     app: App | None,
     fulfillment_lines: list[FulfillmentLine],
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.FULFILLMENT_FULFILLED_ITEMS,
         user=user,
@@ -612,7 +667,7 @@ def fulfillment_awaits_approval_event(
     app: App | None,
     fulfillment_lines: list[FulfillmentLine],
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.FULFILLMENT_AWAITS_APPROVAL,
         user=user,
@@ -628,7 +683,7 @@ def order_returned_event(
     app: App | None,
     returned_lines: list[tuple[int, OrderLine]],
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.FULFILLMENT_RETURNED,
         user=user,
@@ -649,7 +704,7 @@ def fulfillment_replaced_event(
     app: App | None,
     replaced_lines: list[OrderLine],
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.FULFILLMENT_REPLACED,
         user=user,
@@ -667,7 +722,7 @@ def fulfillment_refunded_event(
     amount: Decimal,
     shipping_costs_included: bool,
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.FULFILLMENT_REFUNDED,
         user=user,
@@ -691,7 +746,7 @@ def fulfillment_tracking_updated_event(
     tracking_number: str,
     fulfillment: Fulfillment,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.TRACKING_UPDATED,
         user=user,
@@ -714,7 +769,7 @@ def order_note_added_event(
             )
         kwargs["user"] = user
 
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.NOTE_ADDED,
         parameters={"message": message},
@@ -730,7 +785,7 @@ def order_note_updated_event(
     message: str,
     related_event: OrderEvent,
 ) -> OrderEvent:
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=OrderEvents.NOTE_UPDATED,
         parameters={"message": message},
@@ -769,7 +824,7 @@ def order_discount_event(
 ) -> OrderEvent:
     discount_parameters = _prepare_discount_object(order_discount, old_order_discount)
 
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=event_type,
         user=user,
@@ -781,12 +836,13 @@ def order_discount_event(
 def order_discounts_automatically_updated_event(
     order: Order, changed_order_discounts: list[tuple["OrderDiscount", "OrderDiscount"]]
 ):
-    for previous_order_discount, current_order_discount in changed_order_discounts:
-        order_discount_automatically_updated_event(
-            order=order,
-            order_discount=current_order_discount,
-            old_order_discount=previous_order_discount,
-        )
+    with buffered_order_events():
+        for previous_order_discount, current_order_discount in changed_order_discounts:
+            order_discount_automatically_updated_event(
+                order=order,
+                order_discount=current_order_discount,
+                old_order_discount=previous_order_discount,
+            )
 
 
 def order_discount_automatically_updated_event(
@@ -874,7 +930,7 @@ def order_line_discount_event(
 
     line_data = _line_per_quantity_to_line_object(line.quantity, line)
     line_data["discount"] = discount_parameters
-    return OrderEvent.objects.create(
+    return _create_event(
         order=order,
         type=event_type,
         user=user,
@@ -921,7 +977,7 @@ def order_line_product_removed_event(
     app: App | None,
     order_lines: list[tuple[int, OrderLine]],
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         type=OrderEvents.ORDER_LINE_PRODUCT_DELETED,
         order=order,
         user=user,
@@ -936,7 +992,7 @@ def order_line_variant_removed_event(
     app: App | None,
     order_lines: list[tuple[int, OrderLine]],
 ):
-    return OrderEvent.objects.create(
+    return _create_event(
         type=OrderEvents.ORDER_LINE_VARIANT_DELETED,
         order=order,
         user=user,
@@ -114,22 +114,26 @@ class EditableOrderLineInfo(LineInfo):
         return None
 
 
+DRAFT_ORDER_LINES_PREFETCH_FIELDS = [
+    "discounts__promotion_rule__promotion",
+    "variant__channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
+    "variant__channel_listings__variantlistingpromotionrule__promotion_rule__translations",
+    "variant__product__collections",
+    "variant__product__product_type",
+]
+
+
 def fetch_draft_order_lines_info(
     order: "Order", lines: Iterable["OrderLine"] | None = None
 ) -> list[EditableOrderLineInfo]:
-    prefetch_related_fields = [
-        "discounts__promotion_rule__promotion",
-        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__promotion__translations",
-        "variant__channel_listings__variantlistingpromotionrule__promotion_rule__translations",
-        "variant__product__collections",
-        "variant__product__product_type",
-    ]
     if lines is None:
         with allow_writer():
             # TODO: load lines with dataloader and pass as an argument
-            lines = list(order.lines.prefetch_related(*prefetch_related_fields))
+            lines = list(
+                order.lines.prefetch_related(*DRAFT_ORDER_LINES_PREFETCH_FIELDS)
+            )
     else:
-        prefetch_related_objects(lines, *prefetch_related_fields)
+        prefetch_related_objects(lines, *DRAFT_ORDER_LINES_PREFETCH_FIELDS)
 
     lines_info = []
 
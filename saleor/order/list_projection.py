@@ -0,0 +1,51 @@
+from collections.abc import Iterable
+from uuid import UUID
+
+from django.db.models import OuterRef, Subquery
+
+from ..payment.models import Payment
+from .models import Order, OrderListProjection
+
+PROJECTION_FIELDS = [
+    "status",
+    "customer_first_name",
+    "customer_last_name",
+    "last_charge_status",
+    "updated_at",
+]
+
+
+def update_order_list_projections(order_ids: Iterable[UUID | str]):
+    """Create or refresh the list projections of the given orders."""
+    last_charge_status = Subquery(
+        Payment.objects.filter(order_id=OuterRef("pk"))
+        .order_by("-pk")
+        .values_list("charge_status")[:1]
+    )
+    orders = (
+        Order.objects.filter(pk__in=order_ids)
+        .annotate(last_charge_status=last_charge_status)
+        .values_list(
+            "pk",
+            "status",
+            "billing_address__first_name",
+            "billing_address__last_name",
+            "last_charge_status",
+        )
+    )
+    projections = [
+        OrderListProjection(
+            order_id=order_id,
+            status=status,
+            customer_first_name=first_name,
+            customer_last_name=last_name,
+            last_charge_status=charge_status,
+        )
+        for order_id, status, first_name, last_name, charge_status in orders
+    ]
+    OrderListProjection.objects.bulk_create(
+        projections,
+        update_conflicts=True,
+        unique_fields=["order"],
+        update_fields=PROJECTION_FIELDS,
+    )
@@ -0,0 +1,187 @@
+import json
+import os
+import time
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from graphql.execution.values import coerce_value
+from graphql.utils.is_valid_value import is_valid_value
+
+from ....core.tracing import traced_atomic_transaction
+from ....core.utils.events import call_event
+from ....graphql.core.enums import ErrorPolicy
+from ....plugins.manager import get_plugins_manager
+from ... import StockUpdatePolicy
+
+ORDER_INPUT_TYPE_NAME = "OrderBulkCreateInput"
+
+
+class Command(BaseCommand):
+    help = (
+        "Import orders from a newline-delimited JSON file. Every line holds a single "
+        "order in the format of the `OrderBulkCreateInput` of the `orderBulkCreate` "
+        "mutation. Orders are created in batches, each in its own transaction, and "
+        "the number of processed lines is stored in a checkpoint file after every "
+        "batch, so an interrupted import can be resumed with --resume. Provide "
+        "external references of the orders to make resuming safe; orders with an "
+        "already existing external reference are rejected."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Path to the NDJSON file with orders.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of orders created in a single transaction.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help="Path to the checkpoint file. Default: <path>.checkpoint",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Skip the lines already processed according to the checkpoint.",
+        )
+        parser.add_argument(
+            "--stock-update-policy",
+            choices=[choice for choice, _ in StockUpdatePolicy.CHOICES],
+            default=StockUpdatePolicy.SKIP,
+            help="Determine how stocks are updated while importing the orders.",
+        )
+        parser.add_argument(
+            "--skip-webhooks",
+            action="store_true",
+            help="Do not trigger the ORDER_BULK_CREATED webhooks.",
+        )
+
+    def handle(self, *args, **options):
+        # The schema is imported here as building it takes a while.
+        from ....graphql.api import schema
+        from ....graphql.order.bulk_mutations.order_bulk_create import (
+            REUSABLE_IDENTIFIER_KEYS,
+            OrderBulkCreate,
+        )
+
+        if options["batch_size"] < 1:
+            raise CommandError("The batch size must be a positive integer.")
+
+        path = options["path"]
+        checkpoint_path = options["checkpoint"] or f"{path}.checkpoint"
+        checkpoint = {"line": 0, "created": 0, "failed": 0}
+        if options["resume"]:
+            checkpoint = self.read_checkpoint(checkpoint_path)
+
+        order_input_type = schema.get_type(ORDER_INPUT_TYPE_NAME)
+        manager = get_plugins_manager(allow_replica=False)
+        # Instances resolved for the previous batches, shared to not fetch the same
+        # channels, warehouses, etc. for every batch.
+        object_storage: dict = {}
+        reusable_key_prefixes = tuple(
+            f"{key_prefix}." for key_prefix in REUSABLE_IDENTIFIER_KEYS.values()
+        )
+        created_count = 0
+        start = time.monotonic()
+
+        with open(path) as source:
+            line_number = checkpoint["line"]
+            lines = islice(source, line_number, None)
+            while batch := list(islice(lines, options["batch_size"])):
+                orders_input = []
+                failed_count = 0
+                for line in batch:
+                    line_number += 1
+                    if not line.strip():
+                        continue
+                    order_input = self.parse_order(order_input_type, line, line_number)
+                    if order_input is None:
+                        failed_count += 1
+                    else:
+                        orders_input.append((line_number, order_input))
+
+                created_orders = []
+                if orders_input:
+                    with traced_atomic_transaction():
+                        orders_data = OrderBulkCreate.create_orders(
+                            [order_input for _, order_input in orders_input],
+                            info=None,
+                            error_policy=ErrorPolicy.REJECT_FAILED_ROWS,
+                            stock_update_policy=options["stock_update_policy"],
+                            object_storage=object_storage,
+                        )
+                        created_orders = [
+                            order_data.order
+                            for order_data in orders_data
+                            if order_data.order
+                        ]
+                        if created_orders and not options["skip_webhooks"]:
+                            call_event(manager.order_bulk_created, created_orders)
+
+                    for (order_line_number, _), order_data in zip(
+                        orders_input, orders_data, strict=True
+                    ):
+                        if order_data.order is None:
+                            failed_count += 1
+                            self.report_errors(order_line_number, order_data.errors)
+
+                # drop the instances that can't be reused to bound the memory usage
+                object_storage = {
+                    key: instance
+                    for key, instance in object_storage.items()
+                    if key.startswith(reusable_key_prefixes)
+                }
+                created_count += len(created_orders)
+                checkpoint = {
+                    "line": line_number,
+                    "created": checkpoint["created"] + len(created_orders),
+                    "failed": checkpoint["failed"] + failed_count,
+                }
+                self.write_checkpoint(checkpoint_path, checkpoint)
+
+                elapsed = time.monotonic() - start
+                self.stdout.write(
+                    f"Processed {line_number} lines: {checkpoint['created']} orders "
+                    f"created, {checkpoint['failed']} failed "
+                    f"({created_count / elapsed:.1f} orders/s)."
+                )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Import finished: {checkpoint['created']} orders created, "
+                f"{checkpoint['failed']} failed."
+            )
+        )
+
+    def parse_order(self, order_input_type, line: str, line_number: int):
+        try:
+            value = json.loads(line)
+        except json.JSONDecodeError as e:
+            self.stderr.write(f"Line {line_number}: invalid JSON: {e}.")
+            return None
+        if errors := is_valid_value(value, order_input_type):
+            for error in errors:
+                self.stderr.write(f"Line {line_number}: {error}")
+            return None
+        return coerce_value(order_input_type, value)
+
+    def report_errors(self, line_number: int, errors):
+        for error in errors:
+            path = f" ({error.path})" if error.path else ""
+            self.stderr.write(f"Line {line_number}{path}: {error.message}")
+
+    @staticmethod
+    def read_checkpoint(checkpoint_path: str) -> dict:
+        try:
+            with open(checkpoint_path) as checkpoint_file:
+                return json.load(checkpoint_file)
+        except FileNotFoundError as e:
+            raise CommandError(f"No checkpoint to resume: {checkpoint_path}.") from e
+
+    @staticmethod
+    def write_checkpoint(checkpoint_path: str, checkpoint: dict):
+        # Replace the file atomically, so an interruption never leaves it broken.
+        tmp_path = f"{checkpoint_path}.tmp"
+        with open(tmp_path, "w") as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        os.replace(tmp_path, checkpoint_path)
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from ...tasks import update_order_list_projections_task
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the list projections of all orders used for sorting order lists. "
+        "The orders are processed in batches by the Celery workers."
+    )
+
+    def handle(self, *args, **options):
+        update_order_list_projections_task.delay()
+        self.stdout.write("Scheduled the rebuild of order list projections.")
@@ -0,0 +1,53 @@
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("order", "0196_merge_20241014_0631"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderListProjection",
+            fields=[
+                (
+                    "order",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="list_projection",
+                        serialize=False,
+                        to="order.order",
+                    ),
+                ),
+                ("status", models.CharField(max_length=32)),
+                (
+                    "customer_first_name",
+                    models.CharField(blank=True, max_length=256, null=True),
+                ),
+                (
+                    "customer_last_name",
+                    models.CharField(blank=True, max_length=256, null=True),
+                ),
+                (
+                    "last_charge_status",
+                    models.CharField(blank=True, max_length=20, null=True),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    django.contrib.postgres.indexes.BTreeIndex(
+                        fields=["customer_last_name", "customer_first_name", "order"],
+                        name="order_list_customer_idx",
+                    ),
+                    django.contrib.postgres.indexes.BTreeIndex(
+                        fields=["last_charge_status", "status", "order"],
+                        name="order_list_payment_idx",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -925,3 +925,37 @@ class OrderGrantedRefundLine(models.Model):
     )
 
     reason = models.TextField(blank=True, null=True, default="")
+
+
+class OrderListProjection(models.Model):
+    """Denormalized order fields used to sort order lists.
+
+    Sorting orders by the billing address or by the last payment requires joins
+    or subqueries for every order; the projection keeps these values in a single
+    indexed row per order. It only holds the sort keys, the listed fields are
+    still resolved from the orders of the page.
+    """
+
+    order = models.OneToOneField(
+        Order,
+        primary_key=True,
+        related_name="list_projection",
+        on_delete=models.CASCADE,
+    )
+    status = models.CharField(max_length=32)
+    customer_first_name = models.CharField(max_length=256, null=True, blank=True)
+    customer_last_name = models.CharField(max_length=256, null=True, blank=True)
+    last_charge_status = models.CharField(max_length=20, null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            BTreeIndex(
+                fields=["customer_last_name", "customer_first_name", "order"],
+                name="order_list_customer_idx",
+            ),
+            BTreeIndex(
+                fields=["last_charge_status", "status", "order"],
+                name="order_list_payment_idx",
+            ),
+        ]
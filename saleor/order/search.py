@@ -3,7 +3,15 @@ from typing import TYPE_CHECKING
 import graphene
 from django.conf import settings
 from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Q, Value, prefetch_related_objects
+from django.db.models import (
+    BooleanField,
+    Case,
+    F,
+    Q,
+    Value,
+    When,
+    prefetch_related_objects,
+)
 
 from ..account.search import generate_address_search_vector_value
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
@@ -221,3 +229,36 @@ def search_orders(qs: "QuerySet[Order]", value) -> "QuerySet[Order]":
             search_rank=SearchRank(F("search_vector"), query)
         )
     return qs
+
+
+# Order numbers are stored in a 32-bit integer column.
+MAX_ORDER_NUMBER = 2**31 - 1
+
+
+def autocomplete_orders(qs: "QuerySet[Order]", value: str, limit: int):
+    """Return orders for as-you-type lookups by order number or customer email.
+
+    A numeric value is matched exactly against the unique order number, the value
+    is also matched as a prefix of the customer email, served by
+    the `order_email_search_gin` trigram index. The exact number match is ranked
+    first, then the most recent orders.
+    """
+    value = value.strip()
+    if not value:
+        return qs.none()
+    lookup = Q(user_email__ilike_prefix=value)
+    if not value.isdigit() or int(value) > MAX_ORDER_NUMBER:
+        return qs.filter(lookup).order_by("-number")[:limit]
+
+    number_match = Q(number=int(value))
+    return (
+        qs.filter(lookup | number_match)
+        .annotate(
+            autocomplete_number_match=Case(
+                When(number_match, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            )
+        )
+        .order_by("-autocomplete_number_match", "-number")[:limit]
+    )
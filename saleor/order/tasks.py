@@ -2,10 +2,13 @@ import datetime
 import logging
 
 from django.conf import settings
+from django.contrib.sites.models import Site
 from django.db.models import Exists, F, Func, OuterRef, Subquery, Value
 from django.db.models.functions import Greatest
 from django.utils import timezone
 
+from ..account.models import User
+from ..app.models import App
 from ..celeryconf import app
 from ..channel.models import Channel
 from ..core.db.connection import allow_writer
@@ -16,9 +19,14 @@ from ..plugins.manager import get_plugins_manager
 from ..warehouse.management import deallocate_stock_for_orders
 from ..webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ..webhook.utils import get_webhooks_for_multiple_events
-from . import OrderEvents, OrderStatus
-from .actions import call_order_event, call_order_events
+from . import ORDER_EDITABLE_STATUS, OrderEvents, OrderStatus
+from .actions import call_order_event, call_order_events, order_created
+from .calculations import fetch_orders_prices_if_expired
+from .fetch import fetch_order_info
+from .list_projection import update_order_list_projections
 from .models import Order, OrderEvent
+from .notifications import send_order_confirmation
+from .search import update_order_search_vector
 from .utils import invalidate_order_prices
 
 logger = logging.getLogger(__name__)
@@ -30,6 +38,11 @@ EXPIRE_ORDER_BATCH_SIZE = 100
 # It takes +/- 8 secs to delete 5000 orders
 DELETE_EXPIRED_ORDER_BATCH_SIZE = 5000
 
+# Number of orders which prices are recalculated in a single task
+RECALCULATE_ORDER_PRICES_BATCH_SIZE = 100
+
+ORDER_LIST_PROJECTION_BATCH_SIZE = 1000
+
 
 @app.task
 @allow_writer()
@@ -41,6 +54,34 @@ def recalculate_orders_task(order_ids: list[int]):
 
     Order.objects.bulk_update(orders, ["should_refresh_prices"])
 
+    if settings.RECALCULATE_ORDER_PRICES_IN_BACKGROUND:
+        # spread the recalculation across the workers
+        invalidated_order_ids = [
+            str(order.pk) for order in orders if order.should_refresh_prices
+        ]
+        for index in range(
+            0, len(invalidated_order_ids), RECALCULATE_ORDER_PRICES_BATCH_SIZE
+        ):
+            recalculate_order_prices_task.delay(
+                invalidated_order_ids[
+                    index : index + RECALCULATE_ORDER_PRICES_BATCH_SIZE
+                ]
+            )
+
+
+@app.task
+@allow_writer()
+def recalculate_order_prices_task(order_ids: list[str]):
+    """Recalculate prices of the orders that are marked for the recalculation."""
+    orders = Order.objects.filter(
+        id__in=order_ids,
+        status__in=ORDER_EDITABLE_STATUS,
+        should_refresh_prices=True,
+    )
+    manager = get_plugins_manager(allow_replica=False)
+    recalculated_orders = fetch_orders_prices_if_expired(orders, manager)
+    logger.info("Recalculated prices of %d orders.", len(recalculated_orders))
+
 
 @app.task
 @allow_writer()
@@ -61,6 +102,67 @@ def send_order_updated(order_ids):
         )
 
 
+@app.task
+@allow_writer()
+def process_order_created_from_checkout_task(
+    order_id: str,
+    user_id: int | None,
+    app_id: int | None,
+    redirect_url: str | None,
+    is_automatic_completion: bool = False,
+):
+    """Run the actions of an order created from a checkout.
+
+    The actions run one after another: the search vector update, the order
+    events and webhooks, and the order confirmation notifications.
+    """
+    order = Order.objects.select_related("channel").filter(pk=order_id).first()
+    if order is None:
+        logger.warning("Order %s to process does not exist.", order_id)
+        return
+
+    update_order_search_vector(order)
+
+    user = User.objects.filter(pk=user_id).first() if user_id else None
+    requestor_app = App.objects.filter(pk=app_id).first() if app_id else None
+    manager = get_plugins_manager(
+        allow_replica=False, requestor_getter=lambda: requestor_app or user
+    )
+    order_info = fetch_order_info(order)
+    order_created(
+        order_info=order_info,
+        user=user,
+        app=requestor_app,
+        manager=manager,
+        site_settings=Site.objects.get_current().settings,
+        automatic=is_automatic_completion,
+    )
+    send_order_confirmation(order_info, redirect_url, manager)
+
+
+@app.task
+@allow_writer()
+def update_order_list_projections_task(from_number: int | None = None):
+    """Rebuild the list projections of all orders, batch by batch.
+
+    Each batch schedules the next one, starting after its last order number.
+    """
+    order_numbers = Order.objects.order_by("number")
+    if from_number is not None:
+        order_numbers = order_numbers.filter(number__gt=from_number)
+    batch = list(
+        order_numbers.values_list("pk", "number")[:ORDER_LIST_PROJECTION_BATCH_SIZE]
+    )
+    if not batch:
+        logger.info("Order list projections are up to date.")
+        return
+
+    update_order_list_projections([pk for pk, _ in batch])
+    if len(batch) == ORDER_LIST_PROJECTION_BATCH_SIZE:
+        _, last_number = batch[-1]
+        update_order_list_projections_task.delay(from_number=last_number)
+
+
 def _bulk_release_voucher_usage(order_ids):
     voucher_orders = Order.objects.filter(
         voucher_code=OuterRef("code"),
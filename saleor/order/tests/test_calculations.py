@@ -25,6 +25,7 @@ from ...tax import TaxCalculationStrategy
 from ...tax.calculations.order import update_order_prices_with_flat_rates
 from .. import OrderStatus, calculations
 from ..interface import OrderTaxedPricesData
+from ..models import Order
 
 
 @pytest.fixture
@@ -948,6 +949,62 @@ def test_fetch_order_prices_if_expired_flat_rates(
     assert order.shipping_tax_rate == Decimal("0.2300")
 
 
+def test_fetch_orders_prices_if_expired_flat_rates(
+    order_with_lines, order, plugins_manager
+):
+    # given
+    order_with_lines.should_refresh_prices = True
+    order_with_lines.save(update_fields=["status", "should_refresh_prices"])
+    order.status = OrderStatus.UNCONFIRMED
+    order.should_refresh_prices = False
+    order.save(update_fields=["status", "should_refresh_prices"])
+    tc = order_with_lines.channel.tax_configuration
+    tc.country_exceptions.all().delete()
+    tc.tax_calculation_strategy = TaxCalculationStrategy.FLAT_RATES
+    tc.save()
+
+    # when
+    recalculated_orders = calculations.fetch_orders_prices_if_expired(
+        Order.objects.filter(pk__in=[order_with_lines.pk, order.pk]), plugins_manager
+    )
+
+    # then
+    assert recalculated_orders == [order_with_lines]
+    order_with_lines.refresh_from_db()
+    assert not order_with_lines.should_refresh_prices
+    assert order_with_lines.shipping_tax_rate == Decimal("0.2300")
+    for line in order_with_lines.lines.all():
+        assert line.tax_rate == Decimal("0.2300")
+
+
+def test_fetch_orders_prices_if_expired_matches_single_order_recalculation(
+    order_with_lines, plugins_manager
+):
+    # given
+    tc = order_with_lines.channel.tax_configuration
+    tc.country_exceptions.all().delete()
+    tc.tax_calculation_strategy = TaxCalculationStrategy.FLAT_RATES
+    tc.save()
+    calculations.fetch_order_prices_if_expired(
+        order_with_lines, plugins_manager, force_update=True
+    )
+    order_with_lines.refresh_from_db()
+    expected_total = order_with_lines.total
+    expected_line_totals = [line.total_price for line in order_with_lines.lines.all()]
+
+    # when
+    calculations.fetch_orders_prices_if_expired(
+        [order_with_lines], plugins_manager, force_update=True
+    )
+
+    # then
+    order_with_lines.refresh_from_db()
+    assert order_with_lines.total == expected_total
+    assert [
+        line.total_price for line in order_with_lines.lines.all()
+    ] == expected_line_totals
+
+
 def test_fetch_order_prices_if_expired_webhooks_success(
     plugins_manager,
     fetch_kwargs,
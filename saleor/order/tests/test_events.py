@@ -0,0 +1,80 @@
+import pytest
+
+from .. import OrderEvents
+from ..events import (
+    buffered_order_events,
+    order_line_discount_updated_event,
+    order_line_product_removed_event,
+    order_note_added_event,
+)
+from ..models import OrderEvent
+
+
+def test_buffered_order_events_saved_in_single_query(
+    order_with_lines, staff_user, django_assert_num_queries
+):
+    # given
+    lines = list(order_with_lines.lines.all())
+
+    # when
+    with django_assert_num_queries(1):
+        with buffered_order_events():
+            for line in lines:
+                order_line_product_removed_event(
+                    order_with_lines, staff_user, None, [(line.quantity, line)]
+                )
+
+    # then
+    events = OrderEvent.objects.filter(
+        order=order_with_lines, type=OrderEvents.ORDER_LINE_PRODUCT_DELETED
+    )
+    assert events.count() == len(lines)
+
+
+def test_buffered_order_events_not_saved_on_error(order, staff_user):
+    # given
+    def add_note_and_fail():
+        with buffered_order_events():
+            order_note_added_event(
+                order=order, user=staff_user, app=None, message="Note"
+            )
+            raise ValueError("Failed")
+
+    # when
+    with pytest.raises(ValueError, match="Failed"):
+        add_note_and_fail()
+
+    # then
+    assert not OrderEvent.objects.filter(order=order).exists()
+
+
+def test_nested_buffered_order_events_saved_by_outer_block(order, staff_user):
+    # when
+    with buffered_order_events():
+        with buffered_order_events():
+            order_note_added_event(
+                order=order, user=staff_user, app=None, message="Note"
+            )
+        assert not OrderEvent.objects.filter(order=order).exists()
+
+    # then
+    assert OrderEvent.objects.filter(order=order).count() == 1
+
+
+def test_order_event_compact_parameters(order_with_lines, staff_user, settings):
+    # given
+    settings.ORDER_EVENTS_COMPACT_PARAMETERS = True
+    line = order_with_lines.lines.first()
+    line.unit_discount_reason = None
+
+    # when
+    event = order_line_discount_updated_event(
+        order=order_with_lines, user=staff_user, app=None, line=line
+    )
+
+    # then
+    event.refresh_from_db()
+    line_data = event.parameters["lines"][0]
+    assert line_data["line_pk"] == str(line.pk)
+    assert "reason" not in line_data["discount"]
+    assert line_data["discount"]["currency"] == line.currency
@@ -0,0 +1,70 @@
+from ...payment import ChargeStatus
+from ...plugins.manager import get_plugins_manager
+from ...webhook.event_types import WebhookEventAsyncType
+from .. import OrderStatus
+from ..actions import call_order_event
+from ..list_projection import update_order_list_projections
+from ..models import OrderListProjection
+
+
+def test_update_order_list_projections_creates_projection(order, payment_dummy):
+    # given
+    OrderListProjection.objects.all().delete()
+    payment_dummy.charge_status = ChargeStatus.FULLY_CHARGED
+    payment_dummy.save(update_fields=["charge_status"])
+
+    # when
+    update_order_list_projections([order.pk])
+
+    # then
+    projection = OrderListProjection.objects.get(order=order)
+    assert projection.status == order.status
+    assert projection.customer_first_name == order.billing_address.first_name
+    assert projection.customer_last_name == order.billing_address.last_name
+    assert projection.last_charge_status == ChargeStatus.FULLY_CHARGED
+
+
+def test_update_order_list_projections_refreshes_projection(order):
+    # given
+    update_order_list_projections([order.pk])
+    order.status = OrderStatus.CANCELED
+    order.billing_address = None
+    order.save(update_fields=["status", "billing_address"])
+
+    # when
+    update_order_list_projections([order.pk])
+
+    # then
+    projection = OrderListProjection.objects.get(order=order)
+    assert projection.status == OrderStatus.CANCELED
+    assert projection.customer_first_name is None
+    assert projection.customer_last_name is None
+    assert projection.last_charge_status is None
+
+
+def test_call_order_event_updates_order_list_projection(order, settings):
+    # given
+    settings.UPDATE_ORDER_LIST_PROJECTIONS = True
+    OrderListProjection.objects.all().delete()
+
+    # when
+    call_order_event(
+        get_plugins_manager(False), WebhookEventAsyncType.ORDER_UPDATED, order
+    )
+
+    # then
+    assert OrderListProjection.objects.get(order=order).status == order.status
+
+
+def test_call_order_event_skips_order_list_projection_when_disabled(order, settings):
+    # given
+    settings.UPDATE_ORDER_LIST_PROJECTIONS = False
+    OrderListProjection.objects.all().delete()
+
+    # when
+    call_order_event(
+        get_plugins_manager(False), WebhookEventAsyncType.ORDER_UPDATED, order
+    )
+
+    # then
+    assert not OrderListProjection.objects.exists()
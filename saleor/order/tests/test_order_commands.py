@@ -0,0 +1,173 @@
+import json
+from io import StringIO
+from unittest.mock import patch
+
+import graphene
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from ...graphql.order.bulk_mutations.order_bulk_create import OrderBulkCreate
+from ..models import Order
+
+
+@pytest.fixture
+def order_import_input(
+    channel_PLN, customer_user, graphql_address_data, variant, warehouse
+):
+    def _order_import_input(external_reference):
+        created_at = timezone.now().isoformat()
+        return {
+            "externalReference": external_reference,
+            "channel": channel_PLN.slug,
+            "createdAt": created_at,
+            "user": {"id": graphene.Node.to_global_id("User", customer_user.id)},
+            "billingAddress": graphql_address_data,
+            "currency": "PLN",
+            "languageCode": "PL",
+            "lines": [
+                {
+                    "variantId": graphene.Node.to_global_id(
+                        "ProductVariant", variant.id
+                    ),
+                    "createdAt": created_at,
+                    "productName": "Product Name",
+                    "variantName": "Variant Name",
+                    "isShippingRequired": False,
+                    "isGiftCard": False,
+                    "quantity": 2,
+                    "totalPrice": {"gross": 24, "net": 20},
+                    "undiscountedTotalPrice": {"gross": 24, "net": 20},
+                    "warehouse": graphene.Node.to_global_id("Warehouse", warehouse.id),
+                    "taxRate": 0.2,
+                }
+            ],
+        }
+
+    return _order_import_input
+
+
+def _write_orders(path, orders):
+    path.write_text("\n".join(json.dumps(order) for order in orders) + "\n")
+
+
+@patch("saleor.plugins.manager.PluginsManager.order_bulk_created")
+def test_import_orders_command(order_bulk_created_mock, order_import_input, tmp_path):
+    # given
+    orders_path = tmp_path / "orders.ndjson"
+    _write_orders(
+        orders_path,
+        [order_import_input("order-1"), order_import_input("order-2")],
+    )
+    with orders_path.open("a") as orders_file:
+        orders_file.write("not a json\n")
+    out, err = StringIO(), StringIO()
+
+    # when
+    call_command(
+        "import_orders", str(orders_path), batch_size=2, stdout=out, stderr=err
+    )
+
+    # then
+    assert set(Order.objects.values_list("external_reference", flat=True)) == {
+        "order-1",
+        "order-2",
+    }
+    order_bulk_created_mock.assert_called_once()
+    assert "Line 3: invalid JSON" in err.getvalue()
+    assert "orders/s" in out.getvalue()
+    checkpoint = json.loads((tmp_path / "orders.ndjson.checkpoint").read_text())
+    assert checkpoint == {"line": 3, "created": 2, "failed": 1}
+
+
+def test_import_orders_command_reuses_only_low_cardinality_instances(
+    order_import_input, tmp_path, channel_PLN, customer_user, warehouse
+):
+    # given
+    orders_path = tmp_path / "orders.ndjson"
+    _write_orders(
+        orders_path,
+        [order_import_input("order-1"), order_import_input("order-2")],
+    )
+    get_all_instances = OrderBulkCreate.get_all_instances
+    storage_keys_per_batch = []
+
+    def get_all_instances_spy(orders_input, object_storage=None):
+        storage_keys_per_batch.append(set(object_storage))
+        return get_all_instances(orders_input, object_storage)
+
+    # when
+    with patch.object(
+        OrderBulkCreate, "get_all_instances", side_effect=get_all_instances_spy
+    ):
+        call_command("import_orders", str(orders_path), batch_size=1, stdout=StringIO())
+
+    # then
+    assert Order.objects.count() == 2
+    assert storage_keys_per_batch == [
+        set(),
+        {f"Channel.slug.{channel_PLN.slug}", f"Warehouse.id.{warehouse.id}"},
+    ]
+    assert f"User.id.{customer_user.id}" not in storage_keys_per_batch[1]
+
+
+def test_import_orders_command_rejects_existing_order(order_import_input, tmp_path):
+    # given
+    orders_path = tmp_path / "orders.ndjson"
+    _write_orders(
+        orders_path,
+        [order_import_input("order-1"), order_import_input("order-1")],
+    )
+    err = StringIO()
+
+    # when
+    call_command(
+        "import_orders",
+        str(orders_path),
+        batch_size=1,
+        skip_webhooks=True,
+        stdout=StringIO(),
+        stderr=err,
+    )
+
+    # then
+    assert Order.objects.filter(external_reference="order-1").count() == 1
+    assert "Line 2" in err.getvalue()
+
+
+def test_import_orders_command_resume(order_import_input, tmp_path):
+    # given
+    orders_path = tmp_path / "orders.ndjson"
+    _write_orders(
+        orders_path,
+        [order_import_input("order-1"), order_import_input("order-2")],
+    )
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text(json.dumps({"line": 1, "created": 1, "failed": 0}))
+
+    # when
+    call_command(
+        "import_orders",
+        str(orders_path),
+        checkpoint=str(checkpoint_path),
+        resume=True,
+        skip_webhooks=True,
+        stdout=StringIO(),
+    )
+
+    # then
+    assert list(Order.objects.values_list("external_reference", flat=True)) == [
+        "order-2"
+    ]
+    checkpoint = json.loads(checkpoint_path.read_text())
+    assert checkpoint == {"line": 2, "created": 2, "failed": 0}
+
+
+def test_import_orders_command_resume_without_checkpoint(db, tmp_path):
+    # given
+    orders_path = tmp_path / "orders.ndjson"
+    orders_path.write_text("")
+
+    # when & then
+    with pytest.raises(CommandError):
+        call_command("import_orders", str(orders_path), resume=True)
@@ -14,12 +14,16 @@ from ...warehouse.models import Allocation
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from .. import OrderEvents, OrderStatus
 from ..actions import call_order_event, call_order_events
-from ..models import Order, OrderEvent, get_order_number
+from ..models import Order, OrderEvent, OrderListProjection, get_order_number
 from ..tasks import (
     _bulk_release_voucher_usage,
     delete_expired_orders_task,
     expire_orders_task,
+    process_order_created_from_checkout_task,
+    recalculate_order_prices_task,
+    recalculate_orders_task,
     send_order_updated,
+    update_order_list_projections_task,
 )
 
 
@@ -852,3 +856,149 @@ def test_send_order_updated(
     )
 
     assert wrapped_call_order_event.called
+
+
+@patch("saleor.order.tasks.send_order_confirmation")
+@patch("saleor.order.tasks.order_created")
+def test_process_order_created_from_checkout_task(
+    mocked_order_created, mocked_send_order_confirmation, order_with_lines, app
+):
+    # given
+    order = order_with_lines
+    Order.objects.filter(pk=order.pk).update(search_vector=None)
+    redirect_url = "https://www.example.com"
+
+    # when
+    process_order_created_from_checkout_task(
+        order_id=str(order.pk),
+        user_id=order.user_id,
+        app_id=app.pk,
+        redirect_url=redirect_url,
+    )
+
+    # then
+    order.refresh_from_db()
+    assert order.search_vector
+    mocked_order_created.assert_called_once()
+    call_kwargs = mocked_order_created.call_args.kwargs
+    assert call_kwargs["order_info"].order == order
+    assert call_kwargs["user"] == order.user
+    assert call_kwargs["app"] == app
+    assert call_kwargs["automatic"] is False
+    mocked_send_order_confirmation.assert_called_once()
+    assert mocked_send_order_confirmation.call_args.args[1] == redirect_url
+
+
+@patch("saleor.order.tasks.order_created")
+def test_process_order_created_from_checkout_task_missing_order(
+    mocked_order_created, caplog
+):
+    # when
+    process_order_created_from_checkout_task(
+        order_id="8b3b0d2c-7c5c-4c36-9c4d-f8e4e1c2a9b1",
+        user_id=None,
+        app_id=None,
+        redirect_url=None,
+    )
+
+    # then
+    mocked_order_created.assert_not_called()
+    assert "does not exist" in caplog.text
+
+
+@patch("saleor.order.tasks.recalculate_order_prices_task.delay")
+def test_recalculate_orders_task(mocked_recalculate_prices, order_list, settings):
+    # given
+    settings.RECALCULATE_ORDER_PRICES_IN_BACKGROUND = True
+    draft_order, unconfirmed_order, unfulfilled_order = order_list
+    draft_order.status = OrderStatus.DRAFT
+    unconfirmed_order.status = OrderStatus.UNCONFIRMED
+    unfulfilled_order.status = OrderStatus.UNFULFILLED
+    for order in order_list:
+        order.should_refresh_prices = False
+    Order.objects.bulk_update(order_list, ["status", "should_refresh_prices"])
+
+    # when
+    recalculate_orders_task([order.pk for order in order_list])
+
+    # then
+    assert set(
+        Order.objects.filter(should_refresh_prices=True).values_list("pk", flat=True)
+    ) == {draft_order.pk, unconfirmed_order.pk}
+    mocked_recalculate_prices.assert_called_once()
+    (order_ids,) = mocked_recalculate_prices.call_args.args
+    assert set(order_ids) == {str(draft_order.pk), str(unconfirmed_order.pk)}
+
+
+@patch("saleor.order.tasks.recalculate_order_prices_task.delay")
+def test_recalculate_orders_task_without_background_recalculation(
+    mocked_recalculate_prices, order_list, settings
+):
+    # given
+    settings.RECALCULATE_ORDER_PRICES_IN_BACKGROUND = False
+    Order.objects.update(status=OrderStatus.DRAFT, should_refresh_prices=False)
+
+    # when
+    recalculate_orders_task([order.pk for order in order_list])
+
+    # then
+    assert Order.objects.filter(should_refresh_prices=True).count() == len(order_list)
+    mocked_recalculate_prices.assert_not_called()
+
+
+@patch("saleor.order.tasks.fetch_orders_prices_if_expired")
+def test_recalculate_order_prices_task(mocked_fetch_prices, order_list):
+    # given
+    draft_order, unfulfilled_order, refreshed_draft_order = order_list
+    draft_order.status = OrderStatus.DRAFT
+    draft_order.should_refresh_prices = True
+    unfulfilled_order.status = OrderStatus.UNFULFILLED
+    unfulfilled_order.should_refresh_prices = True
+    refreshed_draft_order.status = OrderStatus.DRAFT
+    refreshed_draft_order.should_refresh_prices = False
+    Order.objects.bulk_update(order_list, ["status", "should_refresh_prices"])
+
+    # when
+    recalculate_order_prices_task([str(order.pk) for order in order_list])
+
+    # then
+    mocked_fetch_prices.assert_called_once()
+    orders, _ = mocked_fetch_prices.call_args.args
+    assert list(orders) == [draft_order]
+
+
+@patch("saleor.order.tasks.ORDER_LIST_PROJECTION_BATCH_SIZE", 2)
+@patch("saleor.order.tasks.update_order_list_projections_task.delay")
+def test_update_order_list_projections_task_schedules_next_batch(
+    mocked_delay, order_list
+):
+    # given
+    OrderListProjection.objects.all().delete()
+    first_order, second_order, _ = sorted(order_list, key=lambda order: order.number)
+
+    # when
+    update_order_list_projections_task()
+
+    # then
+    assert set(OrderListProjection.objects.values_list("order_id", flat=True)) == {
+        first_order.pk,
+        second_order.pk,
+    }
+    mocked_delay.assert_called_once_with(from_number=second_order.number)
+
+
+@patch("saleor.order.tasks.ORDER_LIST_PROJECTION_BATCH_SIZE", 2)
+@patch("saleor.order.tasks.update_order_list_projections_task.delay")
+def test_update_order_list_projections_task_last_batch(mocked_delay, order_list):
+    # given
+    OrderListProjection.objects.all().delete()
+    *_, second_order, third_order = sorted(order_list, key=lambda order: order.number)
+
+    # when
+    update_order_list_projections_task(from_number=second_order.number)
+
+    # then
+    assert list(OrderListProjection.objects.values_list("order_id", flat=True)) == [
+        third_order.pk
+    ]
+    mocked_delay.assert_not_called()
@@ -664,16 +664,14 @@ def get_all_shipping_methods_for_order(
 
     all_methods = []
 
-    shipping_methods = (
-        ShippingMethod.objects.using(database_connection_name)
-        .applicable_shipping_methods_for_instance(
-            order,
-            channel_id=order.channel_id,
-            price=order.subtotal.gross,
-            shipping_address=shipping_address,
-            country_code=shipping_address.country.code,
-        )
-        .prefetch_related("channel_listings")
+    shipping_methods = ShippingMethod.objects.using(
+        database_connection_name
+    ).applicable_shipping_methods_for_instance(
+        order,
+        channel_id=order.channel_id,
+        price=order.subtotal.gross,
+        shipping_address=shipping_address,
+        country_code=shipping_address.country.code,
     )
 
     listing_map = {
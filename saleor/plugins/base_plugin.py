@@ -1256,6 +1256,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     product_created: Callable[["Product", Any, None], Any]
 
+    # Trigger when multiple products are created at once.
+    #
+    # Overwrite this method if you need to handle the created products together.
+    # If not implemented, `product_created` is called for each product.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    products_created: Callable[[list["Product"], None, None], Any]
+
     # Trigger when product is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a product is
@@ -1319,6 +1328,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     product_variant_created: Callable[["ProductVariant", Any, None], Any]
 
+    # Trigger when multiple product variants are created at once.
+    #
+    # Overwrite this method if you need to handle the created variants together.
+    # If not implemented, `product_variant_created` is called for each variant.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    product_variants_created: Callable[[list["ProductVariant"], None, None], Any]
+
     # Trigger when product variant is deleted.
     #
     # Overwrite this method if you need to trigger specific logic after a product
@@ -1337,6 +1355,15 @@ class BasePlugin:
     # Webhook-related functionality will be moved from the plugin to core modules.
     product_variant_updated: Callable[["ProductVariant", Any, None], Any]
 
+    # Trigger when multiple product variants are updated at once.
+    #
+    # Overwrite this method if you need to handle the updated variants together.
+    # If not implemented, `product_variant_updated` is called for each variant.
+    #
+    # Note: This method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from the plugin to core modules.
+    product_variants_updated: Callable[[list["ProductVariant"], None, None], Any]
+
     # Trigger when product variant metadata is updated.
     #
     # Overwrite this method if you need to trigger specific logic after a product
@@ -231,6 +231,31 @@ class PluginsManager(PaymentInterface):
             )
         return value
 
+    def __run_bulk_method_on_plugins(
+        self,
+        method_name: str,
+        single_method_name: str,
+        instances: list,
+        **kwargs,
+    ):
+        """Run a method that accepts a list of instances on each active plugin.
+
+        Plugins that don't implement the bulk method get `single_method_name`
+        called for each instance instead.
+        """
+        if not instances:
+            return
+        for plugin in self.get_plugins(channel_slug=None, active_only=True):
+            if getattr(plugin, method_name, NotImplemented) != NotImplemented:
+                self.__run_method_on_single_plugin(
+                    plugin, method_name, None, instances, **kwargs
+                )
+                continue
+            for instance in instances:
+                self.__run_method_on_single_plugin(
+                    plugin, single_method_name, None, instance, **kwargs
+                )
+
     def __run_method_on_single_plugin(
         self,
         plugin: Optional["BasePlugin"],
@@ -782,6 +807,13 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def products_created(self, products: list["Product"], webhooks=None):
+        self.__run_bulk_method_on_plugins(
+            "products_created", "product_created", products, webhooks=webhooks
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def product_updated(self, product: "Product", webhooks=None):
@@ -851,6 +883,18 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def product_variants_created(
+        self, product_variants: list["ProductVariant"], webhooks=None
+    ):
+        self.__run_bulk_method_on_plugins(
+            "product_variants_created",
+            "product_variant_created",
+            product_variants,
+            webhooks=webhooks,
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def product_variant_updated(
@@ -866,6 +910,19 @@ class PluginsManager(PaymentInterface):
             channel_slug=None,
         )
 
+    # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
+    # Webhook-related functionality will be moved from plugin to core modules.
+    def product_variants_updated(
+        self, product_variants: list["ProductVariant"], webhooks=None, **kwargs
+    ):
+        self.__run_bulk_method_on_plugins(
+            "product_variants_updated",
+            "product_variant_updated",
+            product_variants,
+            webhooks=webhooks,
+            **kwargs,
+        )
+
     # Note: this method is deprecated in Saleor 3.20 and will be removed in Saleor 3.21.
     # Webhook-related functionality will be moved from plugin to core modules.
     def product_variant_deleted(self, product_variant: "ProductVariant", webhooks=None):
@@ -42,6 +42,7 @@ from ..tests.sample_plugins import (
     ALL_PLUGINS,
     ActiveDummyPaymentGateway,
     ActivePaymentGateway,
+    ActivePlugin,
     ChannelPluginSample,
     InactivePaymentGateway,
     PluginInactive,
@@ -1627,3 +1628,38 @@ def test_run_plugin_method_until_first_success_for_active_plugins_only(
     # then
     assert result is None
     assert mock_run_method.call_count == calls
+
+
+def test_manager_products_created_runs_bulk_method(product_list):
+    # given
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ActivePlugin"]
+    )
+
+    # when
+    with (
+        patch.object(ActivePlugin, "products_created", create=True) as bulk_mock,
+        patch.object(ActivePlugin, "product_created", create=True) as single_mock,
+    ):
+        manager.products_created(product_list)
+
+    # then
+    bulk_mock.assert_called_once_with(product_list, webhooks=None, previous_value=None)
+    single_mock.assert_not_called()
+
+
+def test_manager_products_created_falls_back_to_single_method(product_list):
+    # given
+    manager = PluginsManager(
+        plugins=["saleor.plugins.tests.sample_plugins.ActivePlugin"]
+    )
+
+    # when
+    with patch.object(ActivePlugin, "product_created", create=True) as single_mock:
+        manager.products_created(product_list)
+
+    # then
+    assert single_mock.call_args_list == [
+        mock.call(product, webhooks=None, previous_value=None)
+        for product in product_list
+    ]
@@ -256,6 +256,29 @@ class WebhookPlugin(BasePlugin):
     def trigger_webhooks_async(self, *args, **kwargs):
         return trigger_webhooks_async(*args, **kwargs, allow_replica=self.allow_replica)  # type: ignore[misc]
 
+    def _trigger_webhooks_async_for_products(
+        self, event_type, webhooks, instances, get_legacy_data_generator, **kwargs
+    ):
+        """Trigger a single bulk delivery creation for the given products or variants.
+
+        `get_legacy_data_generator` returns the legacy payload generator of an instance.
+        """
+        trigger_webhooks_async_for_multiple_objects(
+            event_type,
+            webhooks,
+            webhook_payloads_data=[
+                WebhookPayloadData(
+                    subscribable_object=instance,
+                    legacy_data_generator=get_legacy_data_generator(instance),
+                    data=None,
+                )
+                for instance in instances
+            ],
+            requestor=self.requestor,
+            allow_replica=self.allow_replica,
+            **kwargs,
+        )
+
     def account_confirmed(self, user: "User", previous_value: None) -> None:
         if not self.active:
             return previous_value
@@ -1771,6 +1794,23 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def products_created(
+        self, products: list["Product"], previous_value: None, webhooks=None
+    ) -> None:
+        if not self.active:
+            return previous_value
+        event_type = WebhookEventAsyncType.PRODUCT_CREATED
+        if webhooks := self._get_webhooks_for_event(event_type, webhooks):
+            self._trigger_webhooks_async_for_products(
+                event_type,
+                webhooks,
+                products,
+                lambda product: partial(
+                    generate_product_payload, product, self.requestor
+                ),
+            )
+        return previous_value
+
     def product_updated(
         self, product: "Product", previous_value: None, webhooks=None
     ) -> None:
@@ -1911,6 +1951,26 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def product_variants_created(
+        self,
+        product_variants: list["ProductVariant"],
+        previous_value: None,
+        webhooks=None,
+    ) -> None:
+        if not self.active:
+            return previous_value
+        event_type = WebhookEventAsyncType.PRODUCT_VARIANT_CREATED
+        if webhooks := self._get_webhooks_for_event(event_type, webhooks):
+            self._trigger_webhooks_async_for_products(
+                event_type,
+                webhooks,
+                product_variants,
+                lambda variant: partial(
+                    generate_product_variant_payload, [variant], self.requestor
+                ),
+            )
+        return previous_value
+
     def product_variant_updated(
         self,
         product_variant: "ProductVariant",
@@ -1936,6 +1996,28 @@ class WebhookPlugin(BasePlugin):
             )
         return previous_value
 
+    def product_variants_updated(
+        self,
+        product_variants: list["ProductVariant"],
+        previous_value: None,
+        webhooks=None,
+        **kwargs,
+    ) -> None:
+        if not self.active:
+            return previous_value
+        event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
+        if webhooks := self._get_webhooks_for_event(event_type, webhooks):
+            self._trigger_webhooks_async_for_products(
+                event_type,
+                webhooks,
+                product_variants,
+                lambda variant: partial(
+                    generate_product_variant_payload, [variant], self.requestor
+                ),
+                **kwargs,
+            )
+        return previous_value
+
     def product_variant_deleted(
         self, product_variant: "ProductVariant", previous_value: None, webhooks=None
     ) -> None:
@@ -630,6 +630,74 @@ def test_product_created(
     )
 
 
+@mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async_for_multiple_objects")
+def test_products_created(
+    mocked_webhook_trigger_for_multiple_objects,
+    mocked_get_webhooks_for_event,
+    any_webhook,
+    settings,
+    product_list,
+):
+    # given
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    manager.products_created(product_list)
+
+    # then
+    mocked_webhook_trigger_for_multiple_objects.assert_called_once_with(
+        WebhookEventAsyncType.PRODUCT_CREATED,
+        [any_webhook],
+        webhook_payloads_data=[
+            WebhookPayloadData(
+                subscribable_object=product, legacy_data_generator=ANY, data=None
+            )
+            for product in product_list
+        ],
+        requestor=None,
+        allow_replica=False,
+    )
+    for webhook_payload_data in mocked_webhook_trigger_for_multiple_objects.call_args[
+        1
+    ]["webhook_payloads_data"]:
+        assert isinstance(webhook_payload_data.legacy_data_generator, partial)
+
+
+@mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
+@mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async_for_multiple_objects")
+def test_product_variants_created(
+    mocked_webhook_trigger_for_multiple_objects,
+    mocked_get_webhooks_for_event,
+    any_webhook,
+    settings,
+    product_variant_list,
+):
+    # given
+    mocked_get_webhooks_for_event.return_value = [any_webhook]
+    settings.PLUGINS = ["saleor.plugins.webhook.plugin.WebhookPlugin"]
+    manager = get_plugins_manager(allow_replica=False)
+
+    # when
+    manager.product_variants_created(product_variant_list)
+
+    # then
+    mocked_webhook_trigger_for_multiple_objects.assert_called_once_with(
+        WebhookEventAsyncType.PRODUCT_VARIANT_CREATED,
+        [any_webhook],
+        webhook_payloads_data=[
+            WebhookPayloadData(
+                subscribable_object=variant, legacy_data_generator=ANY, data=None
+            )
+            for variant in product_variant_list
+        ],
+        requestor=None,
+        allow_replica=False,
+    )
+
+
 @mock.patch("saleor.plugins.webhook.plugin.get_webhooks_for_event")
 @mock.patch("saleor.plugins.webhook.plugin.trigger_webhooks_async")
 def test_product_updated(
@@ -0,0 +1,73 @@
+import csv
+import sys
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ....plugins.manager import get_plugins_manager
+from ....warehouse.management import sync_stocks
+
+STOCK_SYNC_COLUMNS = ("sku", "warehouse", "quantity")
+
+
+class Command(BaseCommand):
+    help = (
+        "Sync stock quantities from a CSV file with the `sku`, `warehouse` (slug) and "
+        "`quantity` columns, e.g. a full stock snapshot exported from an ERP. Rows "
+        "are applied in batches, each in its own transaction; only the stocks with "
+        "changed quantities are written and trigger webhooks."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path", help="Path to the CSV file, or `-` to read from the standard input."
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows applied in a single transaction.",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("The batch size must be a positive integer.")
+
+        path = options["path"]
+        if path == "-":
+            self.sync(sys.stdin, options["batch_size"])
+        else:
+            with open(path, newline="") as csv_file:
+                self.sync(csv_file, options["batch_size"])
+
+    def sync(self, csv_file, batch_size):
+        reader = csv.DictReader(csv_file)
+        if missing_columns := set(STOCK_SYNC_COLUMNS) - set(reader.fieldnames or []):
+            raise CommandError(
+                f"Missing columns: {', '.join(sorted(missing_columns))}."
+            )
+
+        manager = get_plugins_manager(allow_replica=False)
+        rows = (self.parse_row(reader.line_num, row) for row in reader)
+        created_count = updated_count = 0
+        while batch := list(islice(rows, batch_size)):
+            result = sync_stocks(batch, manager)
+            created_count += result.created
+            updated_count += result.updated
+            for sku, warehouse_slug in result.not_found:
+                self.stderr.write(
+                    f"Variant {sku} or warehouse {warehouse_slug} not found."
+                )
+
+        self.stdout.write(
+            f"Created {created_count} and updated {updated_count} stocks."
+        )
+
+    def parse_row(self, line_num, row):
+        try:
+            quantity = int(row["quantity"])
+        except (TypeError, ValueError) as e:
+            raise CommandError(f"Invalid quantity in line {line_num}.") from e
+        if quantity < 0:
+            raise CommandError(f"Invalid quantity in line {line_num}.")
+        return row["sku"], row["warehouse"], quantity
@@ -0,0 +1,20 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("product", "0197_productvariantchannellisting_prior_price_amount"),
+    ]
+    atomic = False
+    operations = [
+        AddIndexConcurrently(
+            model_name="productvariant",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["sku"],
+                name="product_variant_sku_gin",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -3,14 +3,35 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING, Union
 
 from django.conf import settings
-from django.contrib.postgres.search import SearchQuery, SearchRank
-from django.db.models import F, Q, Value, prefetch_related_objects
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    TrigramSimilarity,
+)
+from django.db.models import (
+    BooleanField,
+    Case,
+    Exists,
+    F,
+    OuterRef,
+    Q,
+    Value,
+    When,
+    prefetch_related_objects,
+)
 
 from ..attribute import AttributeInputType
-from ..attribute.models import Attribute
+from ..attribute.models import (
+    AssignedProductAttributeValue,
+    AssignedVariantAttribute,
+    AssignedVariantAttributeValue,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+)
 from ..core.postgres import FlatConcatSearchVector, NoValidationSearchVector
 from ..core.utils.editorjs import clean_editor_js
-from ..product.models import Product
+from ..product.models import Product, ProductVariant
 
 if TYPE_CHECKING:
     from django.db.models import QuerySet
@@ -23,18 +44,30 @@ PRODUCT_FIELDS_TO_PREFETCH = [
     "product_type__attributeproduct__attribute",
 ]
 
+# Fields of `AttributeValue` used by `get_search_vectors_for_values`.
+ATTRIBUTE_VALUE_SEARCH_FIELDS = [
+    "id",
+    "attribute_id",
+    "name",
+    "rich_text",
+    "plain_text",
+    "date_time",
+]
+ITERATOR_CHUNK_SIZE = 2000
+
+# Memory usage of a batch depends on the indexed content of its products (names,
+# attribute values and variant SKUs), as the related rows are read with narrow
+# queries streamed in chunks of `ITERATOR_CHUNK_SIZE` rows.
 PRODUCTS_BATCH_SIZE = 100
-# Setting threshold to 100 results in about 766.98MB of memory usage
-# when testing locally with multiple attributes of different types assigned to product
-# and product variants.
 
 
 def _prep_product_search_vector_index(products):
-    prefetch_related_objects(products, *PRODUCT_FIELDS_TO_PREFETCH)
-
+    search_vectors_map = prepare_products_search_vector_values(
+        [product.pk for product in products]
+    )
     for product in products:
         product.search_vector = FlatConcatSearchVector(
-            *prepare_product_search_vector_value(product, already_prefetched=True)
+            *search_vectors_map.get(product.pk, [])
         )
         product.search_index_dirty = False
 
@@ -43,6 +76,185 @@ def _prep_product_search_vector_index(products):
     )
 
 
+def prepare_products_search_vector_values(
+    product_ids: list[int],
+) -> dict[int, list[NoValidationSearchVector]]:
+    """Prepare `search_vector` values for many products using narrow queries.
+
+    Instead of prefetching whole variants, assignments and values for the batch,
+    only the columns used by the search vector are fetched and streamed with
+    `iterator`, so memory usage depends on the indexed content, not on
+    the width of the related models.
+
+    The result is the same as calling `prepare_product_search_vector_value` for
+    each product.
+    """
+    database_connection_name = settings.DATABASE_CONNECTION_REPLICA_NAME
+    products = list(
+        Product.objects.using(database_connection_name)
+        .filter(id__in=product_ids)
+        .only("id", "name", "description_plaintext", "product_type_id")
+    )
+    product_attributes_map = _get_product_type_attributes_map(
+        {product.product_type_id for product in products}, database_connection_name
+    )
+    product_values_map = _get_assigned_product_values_map(
+        product_ids, database_connection_name
+    )
+    variants_map = _get_variants_search_data_map(product_ids, database_connection_name)
+
+    search_vectors_map = {}
+    for product in products:
+        search_vectors = [
+            NoValidationSearchVector(Value(product.name), config="simple", weight="A"),
+            NoValidationSearchVector(
+                Value(product.description_plaintext), config="simple", weight="C"
+            ),
+        ]
+        values_map = product_values_map.get(product.pk, {})
+        for attribute in product_attributes_map.get(product.product_type_id, [])[
+            : settings.PRODUCT_MAX_INDEXED_ATTRIBUTES
+        ]:
+            values = values_map.get(attribute.pk, [])[
+                : settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES
+            ]
+            search_vectors += get_search_vectors_for_values(attribute, values)
+        search_vectors += variants_map.get(product.pk, [])
+        search_vectors_map[product.pk] = search_vectors
+    return search_vectors_map
+
+
+def _get_product_type_attributes_map(
+    product_type_ids: set[int], database_connection_name: str
+) -> dict[int, list[Attribute]]:
+    attributes_map = defaultdict(list)
+    attribute_products = (
+        AttributeProduct.objects.using(database_connection_name)
+        .filter(product_type_id__in=product_type_ids)
+        .select_related("attribute")
+        .only(
+            "product_type_id",
+            "attribute__id",
+            "attribute__input_type",
+            "attribute__unit",
+        )
+    )
+    for attribute_product in attribute_products:
+        attributes_map[attribute_product.product_type_id].append(
+            attribute_product.attribute
+        )
+    return attributes_map
+
+
+def _get_assigned_product_values_map(
+    product_ids: list[int], database_connection_name: str
+) -> dict[int, dict[int, list[AttributeValue]]]:
+    values_map: dict[int, dict[int, list[AttributeValue]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    assigned_values = (
+        AssignedProductAttributeValue.objects.using(database_connection_name)
+        .filter(product_id__in=product_ids)
+        .select_related("value")
+        .only(
+            "product_id",
+            *[f"value__{field}" for field in ATTRIBUTE_VALUE_SEARCH_FIELDS],
+        )
+    )
+    for assigned_value in assigned_values.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        value = assigned_value.value
+        values_map[assigned_value.product_id][value.attribute_id].append(value)
+    return values_map
+
+
+def _get_variants_search_data_map(
+    product_ids: list[int], database_connection_name: str
+) -> dict[int, list[NoValidationSearchVector]]:
+    variants_map = defaultdict(list)
+    variants = (
+        ProductVariant.objects.using(database_connection_name)
+        .filter(product_id__in=product_ids)
+        .only("id", "product_id", "sku", "name")
+    )
+    for variant in variants.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        product_variants = variants_map[variant.product_id]
+        if len(product_variants) < settings.PRODUCT_MAX_INDEXED_VARIANTS:
+            product_variants.append(variant)
+
+    indexed_variants = [
+        variant
+        for product_variants in variants_map.values()
+        for variant in product_variants
+    ]
+    variant_attributes_map = _get_assigned_variant_attributes_map(
+        [variant.pk for variant in indexed_variants], database_connection_name
+    )
+
+    search_vectors_map = {}
+    for product_id, product_variants in variants_map.items():
+        search_vectors = [
+            NoValidationSearchVector(
+                Value(variant.sku), Value(variant.name), config="simple", weight="A"
+            )
+            if variant.sku
+            else NoValidationSearchVector(
+                Value(variant.name), config="simple", weight="A"
+            )
+            for variant in product_variants
+            if variant.sku or variant.name
+        ]
+        if search_vectors:
+            for variant in product_variants:
+                for attribute, values in variant_attributes_map.get(variant.pk, []):
+                    search_vectors += get_search_vectors_for_values(
+                        attribute,
+                        values[: settings.PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES],
+                    )
+        search_vectors_map[product_id] = search_vectors
+    return search_vectors_map
+
+
+def _get_assigned_variant_attributes_map(
+    variant_ids: list[int], database_connection_name: str
+) -> dict[int, list[tuple[Attribute, list[AttributeValue]]]]:
+    assignments = (
+        AssignedVariantAttribute.objects.using(database_connection_name)
+        .filter(variant_id__in=variant_ids)
+        .select_related("assignment__attribute")
+        .only(
+            "variant_id",
+            "assignment__id",
+            "assignment__attribute__id",
+            "assignment__attribute__input_type",
+            "assignment__attribute__unit",
+        )
+        .order_by("pk")
+    )
+    attributes_map = defaultdict(list)
+    values_by_assignment: dict[int, list[AttributeValue]] = {}
+    for assignment in assignments.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        variant_attributes = attributes_map[assignment.variant_id]
+        if len(variant_attributes) >= settings.PRODUCT_MAX_INDEXED_ATTRIBUTES:
+            continue
+        values: list[AttributeValue] = []
+        values_by_assignment[assignment.pk] = values
+        variant_attributes.append((assignment.assignment.attribute, values))
+
+    assigned_values = (
+        AssignedVariantAttributeValue.objects.using(database_connection_name)
+        .filter(assignment_id__in=values_by_assignment.keys())
+        .select_related("value")
+        .only(
+            "assignment_id",
+            *[f"value__{field}" for field in ATTRIBUTE_VALUE_SEARCH_FIELDS],
+        )
+        .order_by("value__sort_order", "value__pk")
+    )
+    for assigned_value in assigned_values.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+        values_by_assignment[assigned_value.assignment_id].append(assigned_value.value)
+    return attributes_map
+
+
 def queryset_in_batches(queryset):
     """Slice a queryset into batches.
 
@@ -225,3 +437,32 @@ def search_products(qs, value):
             search_rank=SearchRank(F("search_vector"), query)
         )
     return qs
+
+
+def autocomplete_products(qs, value: str, limit: int):
+    """Return products for as-you-type lookups by name or variant SKU.
+
+    Names containing the value and SKUs starting with it are matched with `ILIKE`,
+    served by the `product_gin` and `product_variant_sku_gin` trigram indexes.
+    Name and SKU prefix matches are ranked first, then products are ordered by
+    name similarity.
+    """
+    value = value.strip()
+    if not value:
+        return qs.none()
+    matching_variants = ProductVariant.objects.using(qs.db).filter(
+        product_id=OuterRef("pk"), sku__ilike_prefix=value
+    )
+    is_prefix_match = Q(name__ilike_prefix=value) | Q(Exists(matching_variants))
+    return (
+        qs.filter(Q(name__ilike=value) | Q(Exists(matching_variants)))
+        .annotate(
+            autocomplete_prefix_match=Case(
+                When(is_prefix_match, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            autocomplete_rank=TrigramSimilarity("name", value),
+        )
+        .order_by("-autocomplete_prefix_match", "-autocomplete_rank", "pk")[:limit]
+    )
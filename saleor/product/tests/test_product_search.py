@@ -1,5 +1,9 @@
 from ..models import Product
-from ..search import update_products_search_vector
+from ..search import (
+    prepare_product_search_vector_value,
+    prepare_products_search_vector_values,
+    update_products_search_vector,
+)
 
 
 def test_update_products_search_vector(product_list):
@@ -15,3 +19,42 @@ def test_update_products_search_vector(product_list):
     for product in product_list:
         product.refresh_from_db()
         assert product.search_vector
+
+
+def test_prepare_products_search_vector_values_matches_single_product(
+    product_with_variant_with_two_attributes,
+    product_with_multiple_values_attributes,
+    product_with_two_variants,
+):
+    # given
+    products = [
+        product_with_variant_with_two_attributes,
+        product_with_multiple_values_attributes,
+        product_with_two_variants,
+    ]
+
+    # when
+    search_vectors_map = prepare_products_search_vector_values(
+        [product.pk for product in products]
+    )
+
+    # then
+    for product in products:
+        product = Product.objects.get(pk=product.pk)
+        assert search_vectors_map[product.pk] == prepare_product_search_vector_value(
+            product
+        )
+
+
+def test_prepare_products_search_vector_values_query_count(
+    product_list, django_assert_max_num_queries
+):
+    # given
+    product_ids = [product.pk for product in product_list]
+
+    # when
+    with django_assert_max_num_queries(6):
+        search_vectors_map = prepare_products_search_vector_values(product_ids)
+
+    # then
+    assert set(search_vectors_map.keys()) == set(product_ids)
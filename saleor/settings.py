@@ -575,6 +575,12 @@ BEAT_PRICE_RECALCULATION_SCHEDULE = parse(
 )
 BEAT_PRICE_RECALCULATION_SCHEDULE_EXPIRE_AFTER_SEC = BEAT_PRICE_RECALCULATION_SCHEDULE
 
+# Defines how often expired stock reservations are deleted; deleting them
+# frequently keeps the stock availability queries fast.
+BEAT_DELETE_EXPIRED_RESERVATIONS_SCHEDULE = parse(
+    os.environ.get("BEAT_DELETE_EXPIRED_RESERVATIONS_SCHEDULE", "1 minute")
+)
+
 # Defines the Celery beat scheduler entries.
 #
 # Note: if a Celery task triggered by a Celery beat entry has an expiration
@@ -592,7 +598,12 @@ CELERY_BEAT_SCHEDULE = {
     },
     "delete-expired-reservations": {
         "task": "saleor.warehouse.tasks.delete_expired_reservations_task",
-        "schedule": datetime.timedelta(days=1),
+        "schedule": datetime.timedelta(
+            seconds=BEAT_DELETE_EXPIRED_RESERVATIONS_SCHEDULE
+        ),
+        "options": {
+            "expires": BEAT_DELETE_EXPIRED_RESERVATIONS_SCHEDULE,
+        },
     },
     "delete-expired-checkouts": {
         "task": "saleor.checkout.tasks.delete_expired_checkouts",
@@ -841,6 +852,10 @@ if REDIS_URL:
 CACHES = {"default": django_cache_url.config()}
 CACHES["default"]["TIMEOUT"] = parse(os.environ.get("CACHE_TIMEOUT", "7 days"))
 
+# Verified app tokens are cached to skip password hashing on every app request.
+# Token validity is still checked against the database on each request.
+APP_TOKEN_CACHE_TIMEOUT = parse(os.environ.get("APP_TOKEN_CACHE_TIMEOUT", "5 minutes"))
+
 JWT_EXPIRE = True
 JWT_TTL_ACCESS = datetime.timedelta(
     seconds=parse(os.environ.get("JWT_TTL_ACCESS", "5 minutes"))
@@ -853,10 +868,78 @@ JWT_TTL_REFRESH = datetime.timedelta(
 )
 
 
+# Verified access tokens and their user's permissions are cached per process.
+JWT_CACHE_TIMEOUT = parse(os.environ.get("JWT_CACHE_TIMEOUT", "1 minute"))
+
 JWT_TTL_REQUEST_EMAIL_CHANGE = datetime.timedelta(
     seconds=parse(os.environ.get("JWT_TTL_REQUEST_EMAIL_CHANGE", "1 hour")),
 )
 
+# Allocate stocks with conditional updates of the allocated quantity instead of
+# locking all candidate stocks; reduces lock contention on popular variants.
+ALLOCATE_STOCKS_WITH_CONDITIONAL_UPDATES = get_bool_from_env(
+    "ALLOCATE_STOCKS_WITH_CONDITIONAL_UPDATES", False
+)
+
+# Run the search vector update, order events, webhooks and notifications of orders
+# created from checkouts in a background task instead of the checkoutComplete request.
+CHECKOUT_COMPLETE_DEFER_POST_ORDER_ACTIONS = get_bool_from_env(
+    "CHECKOUT_COMPLETE_DEFER_POST_ORDER_ACTIONS", False
+)
+
+# Recalculate prices of orders invalidated by catalogue changes in background tasks,
+# instead of on the first read of each order.
+RECALCULATE_ORDER_PRICES_IN_BACKGROUND = get_bool_from_env(
+    "RECALCULATE_ORDER_PRICES_IN_BACKGROUND", False
+)
+
+# Keep the order list projections up to date when orders change.
+UPDATE_ORDER_LIST_PROJECTIONS = get_bool_from_env(
+    "UPDATE_ORDER_LIST_PROJECTIONS", False
+)
+
+# Sort order lists by customer and payment status using the order list projections.
+# Orders without a projection are left out of these sorts, so enable it only after
+# `UPDATE_ORDER_LIST_PROJECTIONS` is on and the `update_order_list_projections`
+# command has built the projections of the existing orders.
+ORDER_LIST_SORT_BY_PROJECTION = get_bool_from_env(
+    "ORDER_LIST_SORT_BY_PROJECTION", False
+)
+
+# Skip empty values when storing the parameters of order events.
+ORDER_EVENTS_COMPACT_PARAMETERS = get_bool_from_env(
+    "ORDER_EVENTS_COMPACT_PARAMETERS", False
+)
+
+# Resolve shipping methods from the per-process compiled shipping rate tables,
+# instead of querying the database for each checkout and order.
+SHIPPING_METHODS_FROM_RATE_TABLE = get_bool_from_env(
+    "SHIPPING_METHODS_FROM_RATE_TABLE", False
+)
+
+# Skip webhooks and search index updates for variants that
+# `productVariantBulkUpdate` doesn't change.
+PRODUCT_VARIANT_BULK_UPDATE_SKIP_UNCHANGED = get_bool_from_env(
+    "PRODUCT_VARIANT_BULK_UPDATE_SKIP_UNCHANGED", False
+)
+
+# Thumbnail sizes and formats generated in the background right after product media
+# images are uploaded, e.g. "256,512" and "original,webp". Other thumbnails are
+# generated on the first request. Set no sizes to disable the pre-generation.
+THUMBNAIL_PREGENERATE_SIZES = [
+    int(size)
+    for size in get_list(os.environ.get("THUMBNAIL_PREGENERATE_SIZES", ""))
+    if size
+]
+THUMBNAIL_PREGENERATE_FORMATS = get_list(
+    os.environ.get("THUMBNAIL_PREGENERATE_FORMATS", "original,webp")
+)
+
+# Maximum number of pixels decoded to create a thumbnail; larger images are rejected.
+# JPEG images are decoded at a reduced scale, so they are checked after the reduction.
+# Caps the memory used by a single thumbnail generation; 0 disables the limit.
+THUMBNAIL_MAX_IMAGE_PIXELS = int(os.environ.get("THUMBNAIL_MAX_IMAGE_PIXELS", 0))
+
 CHECKOUT_PRICES_TTL = datetime.timedelta(
     seconds=parse(os.environ.get("CHECKOUT_PRICES_TTL", "1 hour"))
 )
@@ -887,6 +970,9 @@ PRODUCT_MAX_INDEXED_ATTRIBUTES = 1000
 PRODUCT_MAX_INDEXED_ATTRIBUTE_VALUES = 100
 PRODUCT_MAX_INDEXED_VARIANTS = 1000
 
+# Maximum number of results returned by autocomplete queries
+AUTOCOMPLETE_MAX_RESULTS = int(os.environ.get("AUTOCOMPLETE_MAX_RESULTS", 20))
+
 
 # Patch SubscriberExecutionContext class from `graphql-core-legacy` package
 # to fix bug causing not returning errors for subscription queries.
@@ -924,6 +1010,9 @@ COLLECTION_PRODUCT_UPDATED_QUEUE_NAME = os.environ.get(
     "COLLECTION_PRODUCT_UPDATED_QUEUE_NAME", None
 )
 
+# Queue name for the thumbnail pre-generation
+THUMBNAIL_CELERY_QUEUE_NAME = os.environ.get("THUMBNAIL_CELERY_QUEUE_NAME", None)
+
 # Queue name for execution of automatic checkout completion
 AUTOMATIC_CHECKOUT_COMPLETION_QUEUE_NAME = os.environ.get(
     "AUTOMATIC_CHECKOUT_COMPLETION_QUEUE_NAME", None
@@ -0,0 +1,51 @@
+from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+class ShippingAppConfig(AppConfig):
+    name = "saleor.shipping"
+
+    def ready(self):
+        from ..tax.models import TaxClass
+        from .models import (
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+            ShippingZone,
+        )
+        from .signals import invalidate_shipping_rate_tables
+
+        # shipping rate tables are cached, see `shipping.rate_table`
+        for sender in [
+            ShippingZone,
+            ShippingMethod,
+            ShippingMethodChannelListing,
+            ShippingMethodPostalCodeRule,
+            TaxClass,
+        ]:
+            model_name = sender._meta.model_name
+            post_save.connect(
+                invalidate_shipping_rate_tables,
+                sender=sender,
+                dispatch_uid=f"invalidate_shipping_rates_on_{model_name}_save",
+            )
+            post_delete.connect(
+                invalidate_shipping_rate_tables,
+                sender=sender,
+                dispatch_uid=f"invalidate_shipping_rates_on_{model_name}_delete",
+            )
+        for sender, dispatch_uid in [
+            (
+                ShippingZone.channels.through,
+                "invalidate_shipping_rates_on_zone_channels_change",
+            ),
+            (
+                ShippingMethod.excluded_products.through,
+                "invalidate_shipping_rates_on_excluded_products_change",
+            ),
+        ]:
+            m2m_changed.connect(
+                invalidate_shipping_rate_tables,
+                sender=sender,
+                dispatch_uid=dispatch_uid,
+            )
@@ -200,6 +200,17 @@ class ShippingMethodQueryset(models.QuerySet["ShippingMethod"]):
         else:
             weight = instance.weight
 
+        if settings.SHIPPING_METHODS_FROM_RATE_TABLE:
+            from .rate_table import get_shipping_rate_table
+
+            return get_shipping_rate_table(channel_id).applicable_shipping_methods(
+                price=price,
+                weight=weight,
+                country_code=country_code,
+                product_ids=instance_product_ids,
+                shipping_address=shipping_address,
+            )
+
         applicable_methods = self.applicable_shipping_methods(
             price=price,
             channel_id=channel_id,
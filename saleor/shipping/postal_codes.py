@@ -1,37 +1,70 @@
 import re
-from typing import Any
+from bisect import bisect_right
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from itertools import accumulate
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
 from . import PostalCodeRuleInclusionType
 
+if TYPE_CHECKING:
+    from .models import ShippingMethod, ShippingMethodPostalCodeRule
 
-def group_values(pattern, *values):
-    result: list[tuple[Any, ...] | None] = []
-    for value in values:
-        try:
-            val = re.match(pattern, value)
-        except TypeError:
-            result.append(None)
-        else:
-            result.append(val.groups() if val else None)
-    return result
 
+UK_POSTAL_CODE_PATTERN = re.compile(r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$")
+IRISH_POSTAL_CODE_PATTERN = re.compile(r"([\dA-Z]{3}) ?([\dA-Z]{4})")
 
-def cast_tuple_index_to_type(index, target_type, *tuples):
-    """Cast tuple index to type.
 
-    Return list of tuples same as received but with index item casted to
-    tagret_type.
+def get_uk_postal_code_key(value: str | None) -> tuple[Any, ...] | None:
+    """Split the UK postal code into comparable sections.
+
+    Example postal codes: BH20 2BC  (UK), IM16 7HF  (Isle of Man).
+    """
+    if not isinstance(value, str):
+        return None
+    match = UK_POSTAL_CODE_PATTERN.match(value)
+    if not match:
+        return None
+    area, district, sub_district, sector = match.groups()
+    return area, int(district), sub_district, sector
+
+
+def get_irish_postal_code_key(value: str | None) -> tuple[Any, ...] | None:
+    """Split the Irish postal code into comparable sections.
+
+    Example postal codes: A65 2F0A, A61 2F0G.
+    """
+    if not isinstance(value, str):
+        return None
+    match = IRISH_POSTAL_CODE_PATTERN.match(value)
+    return match.groups() if match else None
+
+
+def get_any_postal_code_key(value: str | None) -> str | None:
+    """Fallback for any country not present in POSTAL_CODE_KEY_FUNCTIONS.
+
+    The code is compared lexicographically without splitting to sections.
     """
-    result = []
-    for _tuple in tuples:
-        to_result = []
-        try:
-            for i, entry in enumerate(_tuple):
-                to_result.append(entry if i != index else target_type(entry))
-        except TypeError:
-            pass
-        result.append(tuple(to_result))
-    return result
+    return value or None
+
+
+POSTAL_CODE_KEY_FUNCTIONS: dict[str, Callable[[str | None], Any]] = {
+    "GB": get_uk_postal_code_key,  # United Kingdom
+    "IM": get_uk_postal_code_key,  # Isle of Man
+    "GG": get_uk_postal_code_key,  # Guernsey
+    "JE": get_uk_postal_code_key,  # Jersey
+    "IE": get_irish_postal_code_key,  # Ireland
+}
+
+
+def get_postal_code_key_function(country: str) -> Callable[[str | None], Any]:
+    return POSTAL_CODE_KEY_FUNCTIONS.get(country, get_any_postal_code_key)
+
+
+@lru_cache(maxsize=1024)
+def get_postal_code_key(country: str, postal_code: str | None):
+    return get_postal_code_key_function(country)(postal_code)
 
 
 def compare_values(code, start, end):
@@ -43,32 +76,22 @@ def compare_values(code, start, end):
 
 
 def check_uk_postal_code(code, start, end):
-    """Check postal code for uk, split the code by regex.
-
-    Example postal codes: BH20 2BC  (UK), IM16 7HF  (Isle of Man).
-    """
-    pattern = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
-    code, start, end = group_values(pattern, code, start, end)
-    # replace second item of each tuple with it's value casted to int
-    code, start, end = cast_tuple_index_to_type(1, int, code, start, end)
-    return compare_values(code, start, end)
+    return compare_values(
+        get_uk_postal_code_key(code),
+        get_uk_postal_code_key(start),
+        get_uk_postal_code_key(end),
+    )
 
 
 def check_irish_postal_code(code, start, end):
-    """Check postal code for Ireland, split the code by regex.
-
-    Example postal codes: A65 2F0A, A61 2F0G.
-    """
-    pattern = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
-    code, start, end = group_values(pattern, code, start, end)
-    return compare_values(code, start, end)
+    return compare_values(
+        get_irish_postal_code_key(code),
+        get_irish_postal_code_key(start),
+        get_irish_postal_code_key(end),
+    )
 
 
 def check_any_postal_code(code, start, end):
-    """Fallback for any country not present in country_func_map.
-
-    Perform simple lexicographical comparison without splitting to sections.
-    """
     return compare_values(code, start, end)
 
 
@@ -83,35 +106,81 @@ def check_postal_code_in_range(country, code, start, end):
     return country_func_map.get(country, check_any_postal_code)(code, start, end)
 
 
-def check_shipping_method_for_postal_code(customer_shipping_address, method):
-    country = customer_shipping_address.country.code
-    postal_code = customer_shipping_address.postal_code
-    postal_code_rules = method.postal_code_rules.all()
-    return {
-        rule: check_postal_code_in_range(country, postal_code, rule.start, rule.end)
-        for rule in postal_code_rules
-    }
+class PostalCodeRanges:
+    """Postal code ranges sorted by their start, for the lookup of a single code.
+
+    The start and end of each range have to be keys of the same key function.
+    """
+
+    def __init__(self, ranges: Iterable[tuple[Any, Any]]):
+        ranges = [(start, end) for start, end in ranges if start]
+        closed_ranges = sorted(
+            ((start, end) for start, end in ranges if end), key=itemgetter(0)
+        )
+        self.starts = [start for start, _ in closed_ranges]
+        # the highest end of the ranges starting at or before the given index
+        self.max_ends = list(accumulate((end for _, end in closed_ranges), max))
+        self.min_open_start = min(
+            (start for start, end in ranges if not end), default=None
+        )
+
+    def contains(self, code) -> bool:
+        if not code:
+            return False
+        if self.min_open_start is not None and self.min_open_start <= code:
+            return True
+        index = bisect_right(self.starts, code)
+        return index > 0 and self.max_ends[index - 1] >= code
+
+
+class PostalCodeMatcher:
+    """Postal code rules of a shipping method, compiled for fast lookups."""
+
+    def __init__(self, rules: Iterable["ShippingMethodPostalCodeRule"]):
+        rules = list(rules)
+        self.rules = [(rule.start, rule.end) for rule in rules]
+        self.inclusion_types = {rule.inclusion_type for rule in rules}
+        self._ranges: dict[Callable, PostalCodeRanges] = {}
+
+    def _get_ranges(self, key_function: Callable) -> PostalCodeRanges:
+        ranges = self._ranges.get(key_function)
+        if ranges is None:
+            ranges = PostalCodeRanges(
+                (key_function(start), key_function(end)) for start, end in self.rules
+            )
+            self._ranges[key_function] = ranges
+        return ranges
+
+    def is_applicable(self, country: str, postal_code: str | None) -> bool:
+        if not self.inclusion_types:
+            return True
+        if len(self.inclusion_types) > 1:
+            # Shipping methods with complex rules are not supported for now
+            return False
+
+        ranges = self._get_ranges(get_postal_code_key_function(country))
+        matched = ranges.contains(get_postal_code_key(country, postal_code))
+        if PostalCodeRuleInclusionType.INCLUDE in self.inclusion_types:
+            return matched
+        return not matched
+
+
+def get_postal_code_matcher(method: "ShippingMethod") -> PostalCodeMatcher:
+    """Return the postal code matcher of the method, compiled once per instance."""
+    matcher = getattr(method, "_postal_code_matcher", None)
+    if matcher is None:
+        matcher = PostalCodeMatcher(method.postal_code_rules.all())
+        method._postal_code_matcher = matcher  # type: ignore[attr-defined]
+    return matcher
 
 
 def is_shipping_method_applicable_for_postal_code(
     customer_shipping_address, method
 ) -> bool:
     """Return if shipping method is applicable with the postal code rules."""
-    results = check_shipping_method_for_postal_code(customer_shipping_address, method)
-    if not results:
-        return True
-    if all(
-        rule.inclusion_type == PostalCodeRuleInclusionType.INCLUDE
-        for rule in results.keys()
-    ):
-        return any(results.values())
-    if all(
-        rule.inclusion_type == PostalCodeRuleInclusionType.EXCLUDE
-        for rule in results.keys()
-    ):
-        return not any(results.values())
-    # Shipping methods with complex rules are not supported for now
-    return False
+    return get_postal_code_matcher(method).is_applicable(
+        customer_shipping_address.country.code, customer_shipping_address.postal_code
+    )
 
 
 def filter_shipping_methods_by_postal_code_rules(shipping_methods, shipping_address):
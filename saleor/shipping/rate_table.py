@@ -0,0 +1,145 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from measurement.measures import Weight
+from prices import Money
+
+from ..core.db.connection import allow_writer
+from . import ShippingMethodType
+from .models import ShippingMethod, ShippingMethodChannelListing
+from .postal_codes import is_shipping_method_applicable_for_postal_code
+
+if TYPE_CHECKING:
+    from ..account.models import Address
+
+SHIPPING_RATES_VERSION_CACHE_KEY = "shipping_rates_version"
+
+
+@dataclass(frozen=True)
+class CompiledShippingMethod:
+    shipping_method: ShippingMethod
+    listing: ShippingMethodChannelListing
+    excluded_product_ids: frozenset[int]
+
+    def is_applicable(self, price: Money, weight: Weight, product_ids: set[int]):
+        if self.listing.currency != price.currency:
+            return False
+        if not self.excluded_product_ids.isdisjoint(product_ids):
+            return False
+
+        if self.shipping_method.type == ShippingMethodType.PRICE_BASED:
+            min_price = self.listing.minimum_order_price_amount
+            max_price = self.listing.maximum_order_price_amount
+            return (min_price is None or min_price <= price.amount) and (
+                max_price is None or max_price >= price.amount
+            )
+
+        min_weight = self.shipping_method.minimum_order_weight
+        max_weight = self.shipping_method.maximum_order_weight
+        return (min_weight is None or min_weight <= weight) and (
+            max_weight is None or max_weight >= weight
+        )
+
+
+class ShippingRateTable:
+    """Shipping methods of a channel, grouped by the countries of their zones.
+
+    Methods of each country are ordered by their price in the channel.
+    """
+
+    def __init__(self, methods_by_country: dict[str, list[CompiledShippingMethod]]):
+        self.methods_by_country = methods_by_country
+
+    def applicable_shipping_methods(
+        self,
+        price: Money,
+        weight: Weight,
+        country_code: str,
+        product_ids: set[int],
+        shipping_address: "Address",
+    ) -> list[ShippingMethod]:
+        """Return the shipping methods applicable for the given shipment.
+
+        Equivalent of `ShippingMethodQueryset.applicable_shipping_methods_for_instance`
+        that doesn't query the database.
+        """
+        return [
+            compiled_method.shipping_method
+            for compiled_method in self.methods_by_country.get(country_code, [])
+            if compiled_method.is_applicable(price, weight, product_ids)
+            and is_shipping_method_applicable_for_postal_code(
+                shipping_address, compiled_method.shipping_method
+            )
+        ]
+
+
+def compile_shipping_rate_table(channel_id: int) -> ShippingRateTable:
+    listings = list(
+        ShippingMethodChannelListing.objects.filter(
+            channel_id=channel_id,
+            shipping_method__shipping_zone__channels__id=channel_id,
+        )
+        .select_related("shipping_method__shipping_zone", "shipping_method__tax_class")
+        .prefetch_related("shipping_method__postal_code_rules")
+    )
+    excluded_product_ids: defaultdict[int, set[int]] = defaultdict(set)
+    excluded_products = ShippingMethod.excluded_products.through.objects.filter(
+        shippingmethod_id__in=[listing.shipping_method_id for listing in listings]
+    ).values_list("shippingmethod_id", "product_id")
+    for shipping_method_id, product_id in excluded_products:
+        excluded_product_ids[shipping_method_id].add(product_id)
+
+    methods_by_country: defaultdict[str, list[CompiledShippingMethod]] = defaultdict(
+        list
+    )
+    for listing in sorted(
+        listings, key=lambda listing: (listing.price_amount, listing.shipping_method_id)
+    ):
+        shipping_method = listing.shipping_method
+        compiled_method = CompiledShippingMethod(
+            shipping_method=shipping_method,
+            listing=listing,
+            excluded_product_ids=frozenset(excluded_product_ids[shipping_method.pk]),
+        )
+        for country in shipping_method.shipping_zone.countries:
+            methods_by_country[country.code].append(compiled_method)
+    return ShippingRateTable(dict(methods_by_country))
+
+
+_rate_tables: dict[int, tuple[int, ShippingRateTable]] = {}
+
+
+def get_shipping_rates_version() -> int:
+    return cache.get(SHIPPING_RATES_VERSION_CACHE_KEY, 0)
+
+
+def bump_shipping_rates_version():
+    """Make the shipping rate tables stale, in every process."""
+    try:
+        cache.incr(SHIPPING_RATES_VERSION_CACHE_KEY)
+    except ValueError:
+        cache.set(SHIPPING_RATES_VERSION_CACHE_KEY, 1, timeout=None)
+
+
+def get_shipping_rate_table(channel_id: int) -> ShippingRateTable:
+    """Return the rate table of the channel, compiling it if it is missing or stale.
+
+    The tables are compiled from the writer database, as they are invalidated right
+    after the shipping configuration is committed.
+    """
+    version = get_shipping_rates_version()
+    cached = _rate_tables.get(channel_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    with allow_writer():
+        rate_table = compile_shipping_rate_table(channel_id)
+    _rate_tables[channel_id] = (version, rate_table)
+    return rate_table
+
+
+def clear_shipping_rate_tables():
+    """Drop the rate tables compiled in this process."""
+    _rate_tables.clear()
@@ -0,0 +1,9 @@
+from django.db import transaction
+
+from .rate_table import bump_shipping_rates_version
+
+
+def invalidate_shipping_rate_tables(sender, **kwargs):
+    action = kwargs.get("action")
+    if action is None or action.startswith("post_"):
+        transaction.on_commit(bump_shipping_rates_version)
@@ -4,7 +4,9 @@ import pytest
 
 from .. import PostalCodeRuleInclusionType
 from ..postal_codes import (
+    PostalCodeRanges,
     check_postal_code_in_range,
+    get_postal_code_key_function,
     is_shipping_method_applicable_for_postal_code,
 )
 
@@ -83,42 +85,78 @@ def test_check_uk_islands_follow_uk_check(check_uk_mock, country, code, start, e
     check_uk_mock.assert_called_once_with(code, start, end)
 
 
+def _rule(start, end=None, inclusion_type=PostalCodeRuleInclusionType.EXCLUDE):
+    return Mock(start=start, end=end, inclusion_type=inclusion_type)
+
+
 @pytest.mark.parametrize(
-    ("rules_result", "is_applicable"),
+    ("rules", "is_applicable"),
     [
-        ({}, True),
-        ({Mock(inclusion_type=PostalCodeRuleInclusionType.INCLUDE): True}, True),
-        ({Mock(inclusion_type=PostalCodeRuleInclusionType.INCLUDE): False}, False),
-        ({Mock(inclusion_type=PostalCodeRuleInclusionType.EXCLUDE): True}, False),
-        ({Mock(inclusion_type=PostalCodeRuleInclusionType.EXCLUDE): False}, True),
+        ([], True),
+        ([_rule("BH16 7HA", "BH16 7HG", PostalCodeRuleInclusionType.INCLUDE)], True),
+        ([_rule("BH17 7HA", "BH17 7HG", PostalCodeRuleInclusionType.INCLUDE)], False),
+        ([_rule("BH16 7HA", "BH16 7HG")], False),
+        ([_rule("BH17 7HA", "BH17 7HG")], True),
         (
-            {
-                Mock(inclusion_type=PostalCodeRuleInclusionType.INCLUDE): True,
-                Mock(inclusion_type=PostalCodeRuleInclusionType.INCLUDE): False,
-            },
+            [
+                _rule("BH16 7HA", "BH16 7HG", PostalCodeRuleInclusionType.INCLUDE),
+                _rule("BH17 7HA", "BH17 7HG", PostalCodeRuleInclusionType.INCLUDE),
+            ],
             True,
         ),
+        ([_rule("BH16 7HA", "BH16 7HG"), _rule("BH17 7HA", "BH17 7HG")], False),
         (
-            {
-                Mock(inclusion_type=PostalCodeRuleInclusionType.EXCLUDE): True,
-                Mock(inclusion_type=PostalCodeRuleInclusionType.EXCLUDE): False,
-            },
-            False,
-        ),
-        (
-            {
-                Mock(inclusion_type=PostalCodeRuleInclusionType.EXCLUDE): True,
-                Mock(inclusion_type=PostalCodeRuleInclusionType.INCLUDE): True,
-            },
+            [
+                _rule("BH16 7HA", "BH16 7HG"),
+                _rule("BH16 7HA", "BH16 7HG", PostalCodeRuleInclusionType.INCLUDE),
+            ],
             False,
         ),
     ],
 )
-@patch("saleor.shipping.postal_codes.check_shipping_method_for_postal_code")
-def test_is_shipping_method_applicable_for_postal_code(
-    check_shipping_method_mock, rules_result, is_applicable
-):
-    check_shipping_method_mock.return_value = rules_result
-    assert (
-        is_shipping_method_applicable_for_postal_code(Mock(), Mock()) is is_applicable
+def test_is_shipping_method_applicable_for_postal_code(rules, is_applicable):
+    # given
+    address = Mock(country=Mock(code="GB"), postal_code="BH16 7HF")
+    method = Mock(_postal_code_matcher=None)
+    method.postal_code_rules.all.return_value = rules
+
+    # when
+    result = is_shipping_method_applicable_for_postal_code(address, method)
+
+    # then
+    assert result is is_applicable
+
+
+@pytest.mark.parametrize("country", ["GB", "IE", "PL"])
+def test_postal_code_ranges_match_range_checks(country):
+    # given
+    codes = {
+        "GB": ["BH2 1AA", "BH3 2BC", "BH16 7HF", "BH20 2BC", "IM16 7HF", "invalid"],
+        "IE": ["A61 2F0G", "A65 2F0A", "D02 X285", "T12 AB34", "invalid"],
+        "PL": ["00-001", "53-601", "53-700", "99-999", ""],
+    }[country]
+    ranges = [(start, end) for start in codes for end in [*codes, None]]
+    key_function = get_postal_code_key_function(country)
+
+    for start, end in ranges:
+        postal_code_ranges = PostalCodeRanges(
+            [(key_function(start), key_function(end))]
+        )
+        for code in codes:
+            # when
+            contains = postal_code_ranges.contains(key_function(code))
+
+            # then
+            assert contains is check_postal_code_in_range(country, code, start, end)
+
+    # when
+    all_ranges = PostalCodeRanges(
+        (key_function(start), key_function(end)) for start, end in ranges[:7]
     )
+
+    # then
+    for code in codes:
+        assert all_ranges.contains(key_function(code)) is any(
+            check_postal_code_in_range(country, code, start, end)
+            for start, end in ranges[:7]
+        )
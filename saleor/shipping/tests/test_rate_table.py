@@ -0,0 +1,197 @@
+import pytest
+from measurement.measures import Weight
+from prices import Money
+
+from .. import PostalCodeRuleInclusionType
+from ..models import ShippingMethod, ShippingMethodChannelListing, ShippingMethodType
+from ..rate_table import (
+    bump_shipping_rates_version,
+    clear_shipping_rate_tables,
+    get_shipping_rate_table,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_rate_tables():
+    clear_shipping_rate_tables()
+    yield
+    clear_shipping_rate_tables()
+
+
+@pytest.mark.parametrize(
+    ("price", "min_price", "max_price", "shipping_included"),
+    [
+        (10, 10, 20, True),
+        (10, 1, 10, True),
+        (9, 10, 15, False),
+        (10, 1, 9, False),
+        (10000000, 1, None, True),
+    ],
+)
+def test_rate_table_price_based_methods(
+    price, min_price, max_price, shipping_included, shipping_zone, channel_USD, address
+):
+    # given
+    method = shipping_zone.shipping_methods.create(type=ShippingMethodType.PRICE_BASED)
+    ShippingMethodChannelListing.objects.create(
+        currency=channel_USD.currency_code,
+        minimum_order_price_amount=min_price,
+        maximum_order_price_amount=max_price,
+        shipping_method=method,
+        channel=channel_USD,
+    )
+
+    # when
+    result = get_shipping_rate_table(channel_USD.id).applicable_shipping_methods(
+        price=Money(price, "USD"),
+        weight=Weight(kg=0),
+        country_code="PL",
+        product_ids=set(),
+        shipping_address=address,
+    )
+
+    # then
+    assert (method in result) == shipping_included
+
+
+@pytest.mark.parametrize(
+    ("weight", "min_weight", "max_weight", "shipping_included"),
+    [
+        (Weight(kg=1), Weight(kg=1), Weight(kg=2), True),
+        (Weight(kg=10), Weight(kg=1), Weight(kg=10), True),
+        (Weight(kg=5), Weight(kg=8), Weight(kg=15), False),
+        (Weight(kg=10), Weight(kg=1), Weight(kg=9), False),
+        (Weight(kg=10000000), Weight(kg=1), None, True),
+    ],
+)
+def test_rate_table_weight_based_methods(
+    weight,
+    min_weight,
+    max_weight,
+    shipping_included,
+    shipping_zone,
+    channel_USD,
+    address,
+):
+    # given
+    method = shipping_zone.shipping_methods.create(
+        minimum_order_weight=min_weight,
+        maximum_order_weight=max_weight,
+        type=ShippingMethodType.WEIGHT_BASED,
+    )
+    ShippingMethodChannelListing.objects.create(
+        shipping_method=method, channel=channel_USD, currency=channel_USD.currency_code
+    )
+
+    # when
+    result = get_shipping_rate_table(channel_USD.id).applicable_shipping_methods(
+        price=Money("0", "USD"),
+        weight=weight,
+        country_code="PL",
+        product_ids=set(),
+        shipping_address=address,
+    )
+
+    # then
+    assert (method in result) == shipping_included
+
+
+def test_rate_table_excluded_products_and_postal_codes(
+    shipping_zone, channel_USD, product, address
+):
+    # given
+    default_method = shipping_zone.shipping_methods.get()
+    excluded_product_method = shipping_zone.shipping_methods.create(
+        type=ShippingMethodType.PRICE_BASED
+    )
+    excluded_product_method.excluded_products.add(product)
+    excluded_postal_code_method = shipping_zone.shipping_methods.create(
+        type=ShippingMethodType.PRICE_BASED
+    )
+    excluded_postal_code_method.postal_code_rules.create(
+        start="53-600",
+        end="53-700",
+        inclusion_type=PostalCodeRuleInclusionType.EXCLUDE,
+    )
+    for method in [excluded_product_method, excluded_postal_code_method]:
+        ShippingMethodChannelListing.objects.create(
+            shipping_method=method,
+            channel=channel_USD,
+            currency=channel_USD.currency_code,
+        )
+
+    # when
+    result = get_shipping_rate_table(channel_USD.id).applicable_shipping_methods(
+        price=Money("5.0", "USD"),
+        weight=Weight(kg=0),
+        country_code="PL",
+        product_ids={product.id},
+        shipping_address=address,
+    )
+
+    # then
+    assert result == [default_method]
+
+
+def test_get_shipping_rate_table_cached_until_version_bump(
+    shipping_zone, channel_USD, django_assert_num_queries
+):
+    # given
+    rate_table = get_shipping_rate_table(channel_USD.id)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_rate_table = get_shipping_rate_table(channel_USD.id)
+    bump_shipping_rates_version()
+    recompiled_rate_table = get_shipping_rate_table(channel_USD.id)
+
+    # then
+    assert cached_rate_table is rate_table
+    assert recompiled_rate_table is not rate_table
+
+
+def test_applicable_shipping_methods_for_instance_from_rate_table(
+    checkout_with_item, shipping_zone, channel_USD, address, settings
+):
+    # given
+    settings.SHIPPING_METHODS_FROM_RATE_TABLE = True
+    checkout_with_item.shipping_address = address
+    price = Money("10.0", "USD")
+    expected_methods = list(
+        ShippingMethod.objects.applicable_shipping_methods(
+            price=price,
+            channel_id=channel_USD.id,
+            weight=Weight(kg=0),
+            country_code="PL",
+        )
+    )
+
+    # when
+    result = ShippingMethod.objects.applicable_shipping_methods_for_instance(
+        checkout_with_item,
+        channel_id=channel_USD.id,
+        price=price,
+        shipping_address=address,
+    )
+
+    # then
+    assert result == expected_methods
+
+
+def test_shipping_method_change_invalidates_rate_tables(
+    shipping_zone, channel_USD, django_capture_on_commit_callbacks
+):
+    # given
+    rate_table = get_shipping_rate_table(channel_USD.id)
+    method = shipping_zone.shipping_methods.get()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        method.name = "New name"
+        method.save(update_fields=["name"])
+
+    # then
+    recompiled_rate_table = get_shipping_rate_table(channel_USD.id)
+    assert recompiled_rate_table is not rate_table
+    [compiled_method] = recompiled_rate_table.methods_by_country["PL"]
+    assert compiled_method.shipping_method.name == "New name"
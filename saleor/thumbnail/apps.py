@@ -7,10 +7,15 @@ class ThumbnailAppConfig(AppConfig):
 
     def ready(self):
         from .models import Thumbnail
-        from .signals import delete_thumbnail_image
+        from .signals import delete_thumbnail_image, delete_thumbnail_url_from_cache
 
         post_delete.connect(
             delete_thumbnail_image,
             sender=Thumbnail,
             dispatch_uid="delete_thumbnail_image",
         )
+        post_delete.connect(
+            delete_thumbnail_url_from_cache,
+            sender=Thumbnail,
+            dispatch_uid="delete_thumbnail_url_from_cache",
+        )
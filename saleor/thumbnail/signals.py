@@ -1,6 +1,34 @@
+from django.core.cache import cache
+
 from ..core.tasks import delete_from_storage_task
 
 
 def delete_thumbnail_image(sender, instance, **kwargs):
     if image := instance.image:
         delete_from_storage_task.delay(image.name)
+
+
+def delete_thumbnail_url_from_cache(sender, instance, **kwargs):
+    from .views import (
+        TYPE_TO_MODEL_DATA_MAPPING,
+        UUID_IDENTIFIABLE_TYPES,
+        get_thumbnail_url_cache_key,
+    )
+
+    for object_type, model_data in TYPE_TO_MODEL_DATA_MAPPING.items():
+        instance_id = getattr(instance, f"{model_data.thumbnail_field}_id")
+        if instance_id is None:
+            continue
+        if object_type in UUID_IDENTIFIABLE_TYPES:
+            instance_id = (
+                model_data.model.objects.filter(pk=instance_id)  # type: ignore[misc]
+                .values_list("uuid", flat=True)
+                .first()
+            )
+            if instance_id is None:
+                continue
+        cache.delete(
+            get_thumbnail_url_cache_key(
+                object_type, str(instance_id), instance.size, instance.format
+            )
+        )
@@ -0,0 +1,96 @@
+import logging
+
+from django.conf import settings
+
+from ..celeryconf import app
+from ..core.db.connection import allow_writer
+from ..core.utils.events import call_event
+from ..plugins.manager import get_plugins_manager
+from ..product.models import ProductMedia
+from .models import Thumbnail
+from .utils import (
+    ProcessedImage,
+    get_thumbnail_format,
+    get_thumbnail_size,
+    prepare_thumbnail_file_name,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def get_thumbnail_sizes_to_pregenerate() -> list[int]:
+    return sorted(
+        {get_thumbnail_size(size) for size in settings.THUMBNAIL_PREGENERATE_SIZES}
+    )
+
+
+def get_thumbnail_formats_to_pregenerate() -> list[str | None]:
+    return list(
+        dict.fromkeys(
+            get_thumbnail_format(format)
+            for format in settings.THUMBNAIL_PREGENERATE_FORMATS
+        )
+    )
+
+
+def pregenerate_product_media_thumbnails(product_media_ids: list[int]):
+    """Schedule the generation of the configured thumbnails for the given media."""
+    if product_media_ids and settings.THUMBNAIL_PREGENERATE_SIZES:
+        pregenerate_product_media_thumbnails_task.delay(product_media_ids)
+
+
+@app.task(queue=settings.THUMBNAIL_CELERY_QUEUE_NAME)
+@allow_writer()
+def pregenerate_product_media_thumbnails_task(product_media_ids: list[int]):
+    """Generate the configured thumbnail sizes and formats of product media images.
+
+    Every image is decoded once per format and all sizes are downscaled from it;
+    the thumbnails that already exist are skipped.
+    """
+    sizes = get_thumbnail_sizes_to_pregenerate()
+    formats = get_thumbnail_formats_to_pregenerate()
+    media_list = ProductMedia.objects.filter(id__in=product_media_ids).exclude(image="")
+    existing_thumbnails = set(
+        Thumbnail.objects.filter(product_media_id__in=product_media_ids).values_list(
+            "product_media_id", "size", "format"
+        )
+    )
+
+    thumbnails: list[Thumbnail] = []
+    for media in media_list:
+        for format in formats:
+            missing_sizes = [
+                size
+                for size in sizes
+                if (media.pk, size, format) not in existing_thumbnails
+            ]
+            if not missing_sizes:
+                continue
+            try:
+                created_thumbnails = ProcessedImage(
+                    media.image.name, max(missing_sizes), format
+                ).create_thumbnails(missing_sizes)
+            except (FileNotFoundError, ValueError) as error:
+                logger.info(
+                    "Cannot create thumbnails of product media %s: %s",
+                    media.pk,
+                    error,
+                )
+                break
+            for size, thumbnail_file, _ in created_thumbnails:
+                thumbnail = Thumbnail(size=size, format=format, product_media=media)
+                thumbnail.image.save(
+                    prepare_thumbnail_file_name(media.image.name, size, format),
+                    thumbnail_file,
+                    save=False,
+                )
+                thumbnails.append(thumbnail)
+
+    Thumbnail.objects.bulk_create(thumbnails)
+
+    manager = get_plugins_manager(allow_replica=False)
+    for thumbnail in thumbnails:
+        # set additional `instance` attribute, to easily get instance data
+        # for ThumbnailCreated subscription type
+        setattr(thumbnail, "instance", thumbnail.product_media)
+        call_event(manager.thumbnail_created, thumbnail)
@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+from .. import ThumbnailFormat
+from ..models import Thumbnail
+from ..tasks import (
+    pregenerate_product_media_thumbnails,
+    pregenerate_product_media_thumbnails_task,
+)
+
+
+@patch("saleor.plugins.manager.PluginsManager.thumbnail_created")
+def test_pregenerate_product_media_thumbnails_task(
+    thumbnail_created_mock, product_media_image, settings
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = [32, 64]
+    settings.THUMBNAIL_PREGENERATE_FORMATS = [
+        ThumbnailFormat.ORIGINAL,
+        ThumbnailFormat.WEBP,
+    ]
+    Thumbnail.objects.create(
+        product_media=product_media_image,
+        size=64,
+        format=ThumbnailFormat.WEBP,
+        image="thumbnails/existing.webp",
+    )
+
+    # when
+    pregenerate_product_media_thumbnails_task([product_media_image.pk])
+
+    # then
+    assert set(product_media_image.thumbnails.values_list("size", "format")) == {
+        (32, None),
+        (64, None),
+        (32, ThumbnailFormat.WEBP),
+        (64, ThumbnailFormat.WEBP),
+    }
+    assert thumbnail_created_mock.call_count == 3
+
+
+@patch("saleor.thumbnail.tasks.pregenerate_product_media_thumbnails_task.delay")
+def test_pregenerate_product_media_thumbnails_disabled(
+    task_mock, product_media_image, settings
+):
+    # given
+    settings.THUMBNAIL_PREGENERATE_SIZES = []
+
+    # when
+    pregenerate_product_media_thumbnails([product_media_image.pk])
+
+    # then
+    task_mock.assert_not_called()
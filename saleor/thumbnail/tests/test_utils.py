@@ -1,9 +1,11 @@
+from io import BytesIO
 from unittest import mock
 from unittest.mock import MagicMock
 
 import graphene
 import pytest
 from django.core.files import File
+from PIL import Image
 from PIL.JpegImagePlugin import JpegImageFile
 
 from .. import FILE_NAME_MAX_LENGTH, ThumbnailFormat
@@ -138,6 +140,53 @@ def test_processed_image_preprocess_with_exif_corrupted(
     preprocess_mock.assert_called_once()
 
 
+def test_processed_image_create_thumbnails():
+    # given
+    image_data = BytesIO()
+    Image.new("RGB", size=(1000, 500)).save(image_data, format="JPEG")
+    processed_image = ProcessedImage(
+        File(image_data, "image.jpg"), 512, ThumbnailFormat.WEBP
+    )
+
+    # when
+    thumbnails = processed_image.create_thumbnails([128, 512])
+
+    # then
+    assert [(size, format) for size, _, format in thumbnails] == [
+        (512, "WEBP"),
+        (128, "WEBP"),
+    ]
+    assert Image.open(thumbnails[0][1]).size == (512, 256)
+    assert Image.open(thumbnails[1][1]).size == (128, 64)
+
+
+def test_processed_image_create_thumbnail_decodes_jpeg_at_reduced_scale(settings):
+    # given
+    settings.THUMBNAIL_MAX_IMAGE_PIXELS = 1_000_000
+    image_data = BytesIO()
+    Image.new("RGB", size=(2000, 1000)).save(image_data, format="JPEG")
+    processed_image = ProcessedImage(File(image_data, "image.jpg"), 128)
+
+    # when
+    thumbnail_file, format = processed_image.create_thumbnail()
+
+    # then
+    assert format == "JPEG"
+    assert Image.open(thumbnail_file).size == (128, 64)
+
+
+def test_processed_image_create_thumbnail_too_many_pixels(settings):
+    # given
+    settings.THUMBNAIL_MAX_IMAGE_PIXELS = 100_000
+    image_data = BytesIO()
+    Image.new("RGB", size=(2000, 1000)).save(image_data, format="PNG")
+    processed_image = ProcessedImage(File(image_data, "image.png"), 128)
+
+    # when & then
+    with pytest.raises(ValueError, match="too many pixels"):
+        processed_image.create_thumbnail()
+
+
 def test_get_filename_from_url_unique():
     # given
     file_format = "jpg"
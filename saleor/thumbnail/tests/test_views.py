@@ -1,10 +1,21 @@
 from unittest.mock import patch
 
 import graphene
+import pytest
+from django.core.cache import cache
+from django.http import HttpResponseRedirect
 from PIL import Image
 
 from .. import IconThumbnailFormat, ThumbnailFormat
 from ..models import Thumbnail
+from ..views import get_thumbnail_lock_cache_key, get_thumbnail_url_cache_key
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
 
 
 def test_handle_thumbnail_view_with_format(client, category_with_image, settings):
@@ -413,3 +424,109 @@ def test_handle_thumbnail_view_for_app_installation_logo_default_thumbnail_exist
     assert response.status_code == 302
     assert response.url == thumbnail.image.url
     assert Thumbnail.objects.count() == thumbnail_count
+
+
+def test_handle_thumbnail_view_cached_thumbnail_url(
+    client, category, image, media_root, django_assert_num_queries
+):
+    # given
+    size = 64
+    thumbnail = Thumbnail.objects.create(category=category, size=size, image=image)
+    category_id = graphene.Node.to_global_id("Category", category.id)
+    client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # when
+    with django_assert_num_queries(0):
+        response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == thumbnail.image.url
+
+
+def test_handle_thumbnail_view_cached_no_image(
+    client, category, django_assert_num_queries
+):
+    # given
+    size = 60
+    category_id = graphene.Node.to_global_id("Category", category.id)
+    client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # when
+    with django_assert_num_queries(0):
+        response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 404
+    assert (
+        response.content.decode("utf-8") == "There is no image for provided instance."
+    )
+
+
+@pytest.mark.parametrize(
+    "querystring_auth_setting", ["AWS_QUERYSTRING_AUTH", "GS_QUERYSTRING_AUTH"]
+)
+def test_handle_thumbnail_view_signed_thumbnail_url_not_cached(
+    querystring_auth_setting, client, category, image, media_root, settings
+):
+    # given
+    setattr(settings, querystring_auth_setting, True)
+    size = 64
+    thumbnail = Thumbnail.objects.create(category=category, size=size, image=image)
+    category_id = graphene.Node.to_global_id("Category", category.id)
+    cache_key = get_thumbnail_url_cache_key("Category", str(category.id), size, None)
+
+    # when
+    response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == thumbnail.image.url
+    assert cache.get(cache_key) is None
+
+
+@patch("saleor.thumbnail.views.THUMBNAIL_LOCK_POLL_INTERVAL", 0)
+@patch("saleor.thumbnail.views.ProcessedImage")
+def test_handle_thumbnail_view_waits_for_thumbnail_generated_by_other_request(
+    processed_image_mock, client, category_with_image, settings
+):
+    # given
+    size = 64
+    category_id = graphene.Node.to_global_id("Category", category_with_image.id)
+    cache_key = get_thumbnail_url_cache_key(
+        "Category", str(category_with_image.id), size, None
+    )
+    # another request holds the lock and caches the URL once the thumbnail is saved
+    cache.add(get_thumbnail_lock_cache_key(cache_key), 1)
+    url = settings.MEDIA_URL + "thumbnails/generated_by_other_request.png"
+
+    # when
+    with patch(
+        "saleor.thumbnail.views._get_cached_response",
+        side_effect=[None, HttpResponseRedirect(url)],
+    ):
+        response = client.get(f"/thumbnail/{category_id}/{size}/")
+
+    # then
+    assert response.status_code == 302
+    assert response.url == url
+    processed_image_mock.assert_not_called()
+    assert not Thumbnail.objects.exists()
+
+
+def test_delete_thumbnail_removes_cached_thumbnail_url(
+    client, category, image, media_root
+):
+    # given
+    size = 64
+    thumbnail = Thumbnail.objects.create(category=category, size=size, image=image)
+    category_id = graphene.Node.to_global_id("Category", category.id)
+    client.get(f"/thumbnail/{category_id}/{size}/")
+    cache_key = get_thumbnail_url_cache_key("Category", str(category.id), size, None)
+    assert cache.get(cache_key) == thumbnail.image.url
+
+    # when
+    Thumbnail.objects.filter(category_id=category.id).delete()
+
+    # then
+    assert cache.get(cache_key) is None
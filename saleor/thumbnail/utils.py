@@ -1,10 +1,11 @@
 import os
 import secrets
-from io import BytesIO
+from tempfile import SpooledTemporaryFile
 from typing import TYPE_CHECKING, Optional
 
 import graphene
 import magic
+from django.conf import settings
 from django.core.files import File
 from django.core.files.storage import default_storage
 from django.urls import reverse
@@ -87,6 +88,9 @@ def prepare_thumbnail_file_name(file_name: str, size: int, format: str | None) -
 
 class ProcessedImage:
     EXIF_ORIENTATION_KEY = 274
+    # Thumbnails larger than this number of bytes are spooled to a temporary file
+    # instead of being kept in memory until they are uploaded.
+    SPOOLED_FILE_MAX_SIZE = 1024 * 1024
     # Whether to create progressive JPEGs. Read more about progressive JPEGs
     # here: https://optimus.io/support/progressive-jpeg/
     PROGRESSIVE_JPEG = False
@@ -115,7 +119,7 @@ class ProcessedImage:
         self.storage = storage
 
     def create_thumbnail(self):
-        image, image_format = self.retrieve_image()
+        image, image_format = self.load_image(self.size)
         image, save_kwargs = self.preprocess(image, image_format)
         image_file, thumbnail_format = self.process_image(
             image=image,
@@ -123,6 +127,65 @@ class ProcessedImage:
         )
         return image_file, thumbnail_format
 
+    def create_thumbnails(
+        self, sizes: list[int]
+    ) -> list[tuple[int, SpooledTemporaryFile, str]]:
+        """Create thumbnails in all given sizes from the image decoded once.
+
+        Thumbnails are created from the largest to the smallest size, each one
+        downscaled from the previous one.
+        """
+        image, image_format = self.load_image(max(sizes))
+        image, save_kwargs = self.preprocess(image, image_format)
+        thumbnails = []
+        for size in sorted(sizes, reverse=True):
+            image_file, thumbnail_format = self.process_image(
+                image=image, save_kwargs=save_kwargs, size=size
+            )
+            thumbnails.append((size, image_file, thumbnail_format))
+        return thumbnails
+
+    def load_image(self, size: int):
+        """Return the decoded image downscaled to fit in the given size.
+
+        JPEG images are decoded at the lowest scale that fits twice the size, so
+        large photos are never fully loaded into memory. Images that still have more
+        than `THUMBNAIL_MAX_IMAGE_PIXELS` pixels to decode are rejected.
+
+        The image is downscaled before preprocessing, so the rotation and mode
+        conversion don't copy the full resolution image.
+        """
+        image, image_format = self.retrieve_image()
+        try:
+            self.draft(image, image_format, size)
+            self.validate_pixel_count(image)
+            image.thumbnail((size, size))
+        finally:
+            # close the file opened from the storage, the image is already loaded
+            if isinstance(self.image_source, str) and image.fp:
+                image.fp.close()
+        return image, image_format
+
+    @staticmethod
+    def draft(image, image_format, size):
+        """Decode a JPEG image at the lowest scale that fits twice the given size.
+
+        The margin keeps the quality of `Image.thumbnail`, which resamples from
+        an image at least twice as large as the result.
+        """
+        if image_format == "JPEG":
+            image.draft(image.mode, (size * 2, size * 2))
+
+    @staticmethod
+    def validate_pixel_count(image):
+        max_pixels = settings.THUMBNAIL_MAX_IMAGE_PIXELS
+        width, height = image.size
+        if max_pixels and width * height > max_pixels:
+            raise ValueError(
+                f"Image has too many pixels to decode: {width}x{height}, "
+                f"the limit is {max_pixels}."
+            )
+
     def retrieve_image(self):
         """Return a PIL Image instance stored at `image_source`."""
         image = self.image_source
@@ -234,14 +297,16 @@ class ProcessedImage:
 
         return (image, save_kwargs)
 
-    def process_image(self, image, save_kwargs):
-        """Return a BytesIO instance of `image` that fits in a bounding box.
+    def process_image(self, image, save_kwargs, size: int | None = None):
+        """Return a file with `image` that fits in a bounding box.
 
-        Bounding box dimensions are `width`x`height`.
+        Bounding box dimensions are `width`x`height`. The file is kept in memory up
+        to `SPOOLED_FILE_MAX_SIZE` bytes and rolled over to the disk above it.
         """
-        image_file = BytesIO()
+        size = size or self.size
+        image_file = SpooledTemporaryFile(max_size=self.SPOOLED_FILE_MAX_SIZE)
         image.thumbnail(
-            (self.size, self.size),
+            (size, size),
         )
         image.save(image_file, **save_kwargs)
         image_file.seek(0)
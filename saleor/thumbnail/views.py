@@ -1,7 +1,9 @@
 import logging
+import time
 from typing import NamedTuple
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import (
     HttpResponseBadRequest,
@@ -50,12 +52,84 @@ TYPE_TO_MODEL_DATA_MAPPING = {
 }
 UUID_IDENTIFIABLE_TYPES = ["User", "App", "AppInstallation"]
 
+THUMBNAIL_URL_CACHE_TIMEOUT = 60 * 60
+# Missing instances and images are cached only briefly, as they can be added anytime.
+THUMBNAIL_NEGATIVE_CACHE_TIMEOUT = 30
+THUMBNAIL_LOCK_TIMEOUT = 30
+THUMBNAIL_LOCK_WAIT_TIMEOUT = 5
+THUMBNAIL_LOCK_POLL_INTERVAL = 0.1
+
+
+def get_thumbnail_url_cache_key(
+    object_type: str, instance_id: str, size: int, format: str | None
+) -> str:
+    return f"thumbnail_url:{object_type}:{instance_id}:{size}:{format or ''}"
+
+
+def get_thumbnail_lock_cache_key(thumbnail_url_cache_key: str) -> str:
+    return f"{thumbnail_url_cache_key}:lock"
+
+
+def _get_cached_response(cache_key: str):
+    """Return the response cached for the thumbnail, if any.
+
+    The cache holds either the URL of the existing thumbnail or, for a short time,
+    the status and message of the error response returned for it.
+    """
+    cached = cache.get(cache_key)
+    if cached is None:
+        return None
+    if isinstance(cached, str):
+        return HttpResponseRedirect(cached)
+    status, message = cached
+    if status == HttpResponseBadRequest.status_code:
+        return HttpResponseBadRequest(message)
+    return HttpResponseNotFound(message)
+
+
+def _cache_thumbnail_url(cache_key: str, url: str) -> HttpResponseRedirect:
+    # URLs signed with the query string expire, so they must not outlive the
+    # signature in the cache
+    if not (settings.AWS_QUERYSTRING_AUTH or settings.GS_QUERYSTRING_AUTH):
+        cache.set(cache_key, url, timeout=THUMBNAIL_URL_CACHE_TIMEOUT)
+    return HttpResponseRedirect(url)
+
+
+def _cache_error_response(
+    cache_key: str,
+    response_class: type[HttpResponseNotFound | HttpResponseBadRequest],
+    message: str,
+):
+    cache.set(
+        cache_key,
+        (response_class.status_code, message),
+        timeout=THUMBNAIL_NEGATIVE_CACHE_TIMEOUT,
+    )
+    return response_class(message)
+
+
+def _wait_for_cached_response(cache_key: str):
+    """Wait for the thumbnail being generated by another request."""
+    deadline = time.monotonic() + THUMBNAIL_LOCK_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(THUMBNAIL_LOCK_POLL_INTERVAL)
+        if (response := _get_cached_response(cache_key)) is not None:
+            return response
+        if cache.get(get_thumbnail_lock_cache_key(cache_key)) is None:
+            break
+    return _get_cached_response(cache_key)
+
 
 def handle_thumbnail(request, instance_id: str, size: str, format: str | None = None):
     """Create and return thumbnail for given instance in provided size and format.
 
     If the provided size is not in the available resolution list, the thumbnail with
     the closest available size is created and returned, if it does not exist.
+
+    Thumbnail URLs, unless they are signed with the query string, and, for a short
+    time, missing instances and images are cached, so the subsequent requests don't
+    hit the database. Only one request at a time
+    generates the given thumbnail; the concurrent ones wait for its result.
     """
     # try to find corresponding instance based on given instance_id
     try:
@@ -79,6 +153,26 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
     except ValueError:
         return HttpResponseNotFound("Invalid size.")
 
+    cache_key = get_thumbnail_url_cache_key(object_type, pk, size_px, format)
+    if (response := _get_cached_response(cache_key)) is not None:
+        return response
+
+    lock_key = get_thumbnail_lock_cache_key(cache_key)
+    if not cache.add(lock_key, 1, timeout=THUMBNAIL_LOCK_TIMEOUT):
+        if (response := _wait_for_cached_response(cache_key)) is not None:
+            return response
+        # The thumbnail wasn't generated in time; proceed without the lock.
+        return _handle_thumbnail(object_type, pk, size_px, format, cache_key)
+
+    try:
+        return _handle_thumbnail(object_type, pk, size_px, format, cache_key)
+    finally:
+        cache.delete(lock_key)
+
+
+def _handle_thumbnail(
+    object_type: str, pk: str, size_px: int, format: str | None, cache_key: str
+):
     # return the thumbnail if it's already exist
     model_data = TYPE_TO_MODEL_DATA_MAPPING[object_type]
     if object_type in UUID_IDENTIFIABLE_TYPES:
@@ -91,7 +185,7 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
         .filter(format=format, size=size_px, **{instance_id_lookup: pk})
         .first()
     ):
-        return HttpResponseRedirect(thumbnail.image.url)
+        return _cache_thumbnail_url(cache_key, thumbnail.image.url)
 
     try:
         if object_type in UUID_IDENTIFIABLE_TYPES:
@@ -103,11 +197,26 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
                 settings.DATABASE_CONNECTION_REPLICA_NAME
             ).get(id=pk)
     except ObjectDoesNotExist:
-        return HttpResponseNotFound("Instance with the given id cannot be found.")
+        return _cache_error_response(
+            cache_key,
+            HttpResponseNotFound,
+            "Instance with the given id cannot be found.",
+        )
 
     image = getattr(instance, model_data.image_field)
     if not bool(image):
-        return HttpResponseNotFound("There is no image for provided instance.")
+        return _cache_error_response(
+            cache_key, HttpResponseNotFound, "There is no image for provided instance."
+        )
+
+    # the thumbnail might have been just created by a request that held the lock,
+    # and might not be available on the replica yet
+    with allow_writer():
+        thumbnail = Thumbnail.objects.filter(
+            format=format, size=size_px, **{instance_id_lookup: pk}
+        ).first()
+    if thumbnail:
+        return _cache_thumbnail_url(cache_key, thumbnail.image.url)
 
     # prepare thumbnail
     if object_type in ICON_TYPE_TO_MODEL_DATA_MAPPING:
@@ -120,10 +229,14 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
         thumbnail_file, _ = processed_image.create_thumbnail()
     except FileNotFoundError as error:
         logger.info(str(error))
-        return HttpResponseNotFound("Cannot found image file.")
+        return _cache_error_response(
+            cache_key, HttpResponseNotFound, "Cannot found image file."
+        )
     except ValueError as error:
         logger.info(str(error))
-        return HttpResponseBadRequest("Invalid image.")
+        return _cache_error_response(
+            cache_key, HttpResponseBadRequest, "Invalid image."
+        )
 
     thumbnail_file_name = prepare_thumbnail_file_name(image.name, size_px, format)
 
@@ -141,4 +254,4 @@ def handle_thumbnail(request, instance_id: str, size: str, format: str | None =
         manager = get_plugins_manager(allow_replica=False)
         call_event(manager.thumbnail_created, thumbnail)
 
-    return HttpResponseRedirect(thumbnail.image.url)
+    return _cache_thumbnail_url(cache_key, thumbnail.image.url)
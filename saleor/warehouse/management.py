@@ -1,10 +1,13 @@
 import math
 from collections import defaultdict
 from collections.abc import Iterable
+from functools import partial
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
 from uuid import UUID
 
-from django.db import transaction
+from django.conf import settings
+from django.db import connection, transaction
 from django.db.models import F, Sum
 from django.db.models.expressions import Exists, OuterRef
 from django.db.models.functions import Coalesce
@@ -43,6 +46,13 @@ class StockData(NamedTuple):
     quantity: int
 
 
+class StockSyncResult(NamedTuple):
+    created: int
+    updated: int
+    # SKU and warehouse slug pairs that don't match any variant or warehouse.
+    not_found: list[tuple[str, str]]
+
+
 def stock_select_for_update_for_existing_qs(qs):
     return qs.order_by("pk").select_for_update(of=(["self"]))
 
@@ -71,6 +81,92 @@ def stock_bulk_update(stocks: list[Stock], fields_to_update: list[str]):
         Stock.objects.bulk_update(stocks, fields_to_update)
 
 
+@traced_atomic_transaction()
+def sync_stocks(
+    stock_quantities: Iterable[tuple[str, str, int]], manager: PluginsManager
+) -> StockSyncResult:
+    """Set the quantities of stocks given as (variant SKU, warehouse slug, quantity).
+
+    Missing stocks are created and stocks with an unchanged quantity are skipped,
+    so syncing a full snapshot writes only the differences. Back in stock and out of
+    stock events are triggered only for stocks whose available quantity crosses zero.
+    """
+    quantities = {
+        (sku, warehouse_slug): quantity
+        for sku, warehouse_slug, quantity in stock_quantities
+    }
+    variant_ids = dict(
+        ProductVariant.objects.filter(
+            sku__in={sku for sku, _ in quantities}
+        ).values_list("sku", "id")
+    )
+    warehouse_ids = dict(
+        Warehouse.objects.filter(
+            slug__in={warehouse_slug for _, warehouse_slug in quantities}
+        ).values_list("slug", "id")
+    )
+    stocks = {
+        (stock.product_variant_id, stock.warehouse_id): stock
+        for stock in stock_qs_select_for_update().filter(
+            product_variant_id__in=variant_ids.values(),
+            warehouse_id__in=warehouse_ids.values(),
+        )
+    }
+
+    not_found = []
+    stocks_to_create = []
+    stocks_to_update = []
+    back_in_stock = []
+    out_of_stock = []
+    for (sku, warehouse_slug), quantity in quantities.items():
+        variant_id = variant_ids.get(sku)
+        warehouse_id = warehouse_ids.get(warehouse_slug)
+        if variant_id is None or warehouse_id is None:
+            not_found.append((sku, warehouse_slug))
+            continue
+
+        stock = stocks.get((variant_id, warehouse_id))
+        if stock is None:
+            stock = Stock(
+                product_variant_id=variant_id,
+                warehouse_id=warehouse_id,
+                quantity=quantity,
+            )
+            stocks_to_create.append(stock)
+            if quantity > 0:
+                back_in_stock.append(stock)
+            continue
+
+        if stock.quantity == quantity:
+            continue
+        was_available = stock.quantity - stock.quantity_allocated > 0
+        is_available = quantity - stock.quantity_allocated > 0
+        stock.quantity = quantity
+        stocks_to_update.append(stock)
+        if is_available and not was_available:
+            back_in_stock.append(stock)
+        elif was_available and not is_available:
+            out_of_stock.append(stock)
+
+    Stock.objects.bulk_create(stocks_to_create)
+    Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+
+    if changed_stocks := stocks_to_create + stocks_to_update:
+        transaction.on_commit(
+            lambda: manager.product_variant_stocks_updated(changed_stocks)
+        )
+    for stock in back_in_stock:
+        transaction.on_commit(partial(manager.product_variant_back_in_stock, stock))
+    for stock in out_of_stock:
+        transaction.on_commit(partial(manager.product_variant_out_of_stock, stock))
+
+    return StockSyncResult(
+        created=len(stocks_to_create),
+        updated=len(stocks_to_update),
+        not_found=not_found,
+    )
+
+
 def allocation_with_stock_qs_select_for_update():
     return (
         Allocation.objects.select_related("stock")
@@ -136,6 +232,18 @@ def allocate_stocks(
         else Stock.objects.for_channel_and_country(channel_slug, country_code)
     )
 
+    if settings.ALLOCATE_STOCKS_WITH_CONDITIONAL_UPDATES:
+        _allocate_stocks_with_conditional_updates(
+            order_lines_info,
+            stocks.filter(**filter_lookup),
+            channel,
+            manager,
+            collection_point_pk,
+            check_reservations,
+            checkout_lines,
+        )
+        return
+
     stocks = list(
         stock_select_for_update_for_existing_qs(stocks)
         .filter(**filter_lookup)
@@ -214,6 +322,210 @@ def allocate_stocks(
                 )
 
 
+# How many times a single stock is re-read after losing a race for its quantity.
+CONDITIONAL_ALLOCATION_MAX_RETRIES = 5
+
+
+def _allocate_stocks_with_conditional_updates(
+    order_lines_info: list["OrderLineInfo"],
+    stocks_qs,
+    channel: "Channel",
+    manager: PluginsManager,
+    collection_point_pk: UUID | None,
+    check_reservations: bool,
+    checkout_lines: Iterable["CheckoutLine"] | None,
+):
+    """Allocate stocks without locking all candidate stocks upfront.
+
+    Stocks are read without locks and `Stock.quantity_allocated` is used as
+    the allocated sum, so no `Allocation` rows are aggregated. Each allocation is
+    applied with a conditional update that only succeeds if the stock still has
+    enough quantity; only stocks that are actually allocated from get locked,
+    in the pk order.
+    When the update loses a race, the stock is re-read and the allocation is
+    retried with the quantity that is left.
+    """
+    stocks = list(
+        stocks_qs.order_by("pk").values(
+            "pk", "product_variant", "quantity", "quantity_allocated", "warehouse_id"
+        )
+    )
+    quantity_reservation_for_stocks = _prepare_stock_to_reserved_quantity_map(
+        checkout_lines, check_reservations, [stock["pk"] for stock in stocks]
+    )
+    quantity_allocation_for_stocks = {
+        stock["pk"]: stock.pop("quantity_allocated") for stock in stocks
+    }
+    stocks = sort_stocks(
+        channel.allocation_strategy,
+        stocks,
+        channel,
+        quantity_allocation_for_stocks,
+        collection_point_pk,
+    )
+    variant_to_stocks: dict[int, list[StockData]] = defaultdict(list)
+    for stock_data in stocks:
+        variant = stock_data.pop("product_variant")
+        variant_to_stocks[variant].append(StockData(**stock_data))
+
+    insufficient_stock: list[InsufficientStockData] = []
+    allocations: list[Allocation] = []
+    out_of_stock_pks: set[int] = set()
+    # Lines of the same variant are allocated together, and stocks are updated in
+    # the pk order, so concurrent allocations lock the stocks in the same order
+    # and can't deadlock.
+    for line_info in sorted(
+        order_lines_info,
+        key=lambda line_info: cast(ProductVariant, line_info.variant).pk,
+    ):
+        variant = cast(ProductVariant, line_info.variant)
+        variant_stocks = variant_to_stocks[variant.pk]
+        planned_quantities = _plan_stock_allocations(
+            variant_stocks,
+            line_info.quantity,
+            quantity_allocation_for_stocks,
+            quantity_reservation_for_stocks,
+        )
+        # The quantity that couldn't be allocated from a stock, e.g. because of
+        # a concurrent allocation, is allocated from the following ones.
+        quantity_to_allocate = line_info.quantity - sum(planned_quantities.values())
+        line_allocations = []
+        for stock_data in sorted(variant_stocks, key=attrgetter("pk")):
+            quantity_to_allocate += planned_quantities.get(stock_data.pk, 0)
+            if quantity_to_allocate == 0:
+                continue
+            allocated, is_out_of_stock = _allocate_from_stock(
+                stock_data,
+                quantity_to_allocate,
+                quantity_allocation_for_stocks,
+                quantity_reservation_for_stocks.get(stock_data.pk, 0),
+            )
+            if allocated:
+                line_allocations.append(
+                    Allocation(
+                        order_line=line_info.line,
+                        stock_id=stock_data.pk,
+                        quantity_allocated=allocated,
+                    )
+                )
+                quantity_to_allocate -= allocated
+            if is_out_of_stock:
+                out_of_stock_pks.add(stock_data.pk)
+        if quantity_to_allocate:
+            insufficient_stock.append(
+                InsufficientStockData(
+                    variant=variant,
+                    order_line=line_info.line,
+                    # everything that was left in the stocks got allocated
+                    available_quantity=line_info.quantity - quantity_to_allocate,
+                )
+            )
+        allocations.extend(line_allocations)
+
+    if insufficient_stock:
+        # quantities already allocated are rolled back with the transaction
+        raise InsufficientStock(insufficient_stock)
+
+    Allocation.objects.bulk_create(allocations)
+
+    if out_of_stock_pks:
+
+        def send_out_of_stock_events():
+            for stock in Stock.objects.filter(pk__in=out_of_stock_pks):
+                manager.product_variant_out_of_stock(stock)
+
+        transaction.on_commit(send_out_of_stock_events)
+
+
+def _plan_stock_allocations(
+    stocks: list[StockData],
+    quantity: int,
+    quantity_allocation_for_stocks: dict[int, int],
+    quantity_reservation_for_stocks: dict[int, int],
+) -> dict[int, int]:
+    """Return the quantities to allocate from the stocks, in the stocks order.
+
+    The quantities are based on the stocks read without locks.
+    """
+    planned_quantities = {}
+    for stock_data in stocks:
+        if quantity == 0:
+            break
+        quantity_available = (
+            stock_data.quantity
+            - quantity_allocation_for_stocks.get(stock_data.pk, 0)
+            - quantity_reservation_for_stocks.get(stock_data.pk, 0)
+        )
+        quantity_to_allocate = min(quantity, quantity_available)
+        if quantity_to_allocate > 0:
+            planned_quantities[stock_data.pk] = quantity_to_allocate
+            quantity -= quantity_to_allocate
+    return planned_quantities
+
+
+def _allocate_from_stock(
+    stock_data: StockData,
+    quantity: int,
+    quantity_allocation_for_stocks: dict[int, int],
+    quantity_reserved: int,
+) -> tuple[int, bool]:
+    """Allocate up to `quantity` from the stock.
+
+    Return the allocated quantity and whether the stock is out of stock after
+    the allocation.
+    """
+    quantity_in_stock = stock_data.quantity
+    for _ in range(CONDITIONAL_ALLOCATION_MAX_RETRIES):
+        quantity_available = (
+            quantity_in_stock
+            - quantity_allocation_for_stocks.get(stock_data.pk, 0)
+            - quantity_reserved
+        )
+        quantity_to_allocate = min(quantity, quantity_available)
+        if quantity_to_allocate <= 0:
+            return 0, False
+        result = _increase_quantity_allocated_if_available(
+            stock_data.pk, quantity_to_allocate, quantity_reserved
+        )
+        if result is not None:
+            quantity_in_stock, quantity_allocated = result
+            quantity_allocation_for_stocks[stock_data.pk] = quantity_allocated
+            return quantity_to_allocate, quantity_in_stock - quantity_allocated <= 0
+        # Another transaction allocated from this stock in the meantime.
+        current = (
+            Stock.objects.filter(pk=stock_data.pk)
+            .values_list("quantity", "quantity_allocated")
+            .first()
+        )
+        if current is None:
+            return 0, False
+        quantity_in_stock, quantity_allocation_for_stocks[stock_data.pk] = current
+    return 0, False
+
+
+def _increase_quantity_allocated_if_available(
+    stock_pk: int, quantity: int, quantity_reserved: int
+) -> tuple[int, int] | None:
+    """Increase `quantity_allocated` only if the stock has enough quantity left.
+
+    Return the stock's quantity and allocated quantity after the update, or None
+    if there was not enough quantity to allocate.
+    """
+    table = Stock._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            UPDATE {table}
+            SET quantity_allocated = quantity_allocated + %(quantity)s
+            WHERE id = %(stock_pk)s
+                AND quantity - quantity_allocated - %(reserved)s >= %(quantity)s
+            RETURNING quantity, quantity_allocated
+            """,
+            {"stock_pk": stock_pk, "quantity": quantity, "reserved": quantity_reserved},
+        )
+        return cursor.fetchone()
+
+
 def _prepare_stock_to_reserved_quantity_map(
     checkout_lines, check_reservations, stocks_id
 ):
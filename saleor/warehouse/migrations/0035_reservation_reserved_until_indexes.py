@@ -0,0 +1,34 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("warehouse", "0034_warehouse_click_and_collect_option_idx"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="reservation",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["stock", "reserved_until"],
+                include=["quantity_reserved"],
+                name="reservation_stock_until_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="reservation",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["reserved_until"], name="reservation_until_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="preorderreservation",
+            index=django.contrib.postgres.indexes.BTreeIndex(
+                fields=["reserved_until"], name="preorder_res_until_idx"
+            ),
+        ),
+    ]
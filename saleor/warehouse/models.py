@@ -606,6 +606,8 @@ class PreorderReservation(models.Model):
         unique_together = [["checkout_line", "product_variant_channel_listing"]]
         indexes = [
             models.Index(fields=["checkout_line", "reserved_until"]),
+            # used by the expired reservations sweeper
+            BTreeIndex(fields=["reserved_until"], name="preorder_res_until_idx"),
         ]
         ordering = ("pk",)
 
@@ -634,5 +636,14 @@ class Reservation(models.Model):
         unique_together = [["checkout_line", "stock"]]
         indexes = [
             models.Index(fields=["checkout_line", "reserved_until"]),
+            # used by the stock availability queries, which sum active reservations
+            # per stock without visiting the expired ones
+            BTreeIndex(
+                fields=["stock", "reserved_until"],
+                include=["quantity_reserved"],
+                name="reservation_stock_until_idx",
+            ),
+            # used by the expired reservations sweeper
+            BTreeIndex(fields=["reserved_until"], name="reservation_until_idx"),
         ]
         ordering = ("pk",)
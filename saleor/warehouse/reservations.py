@@ -4,7 +4,7 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING, NamedTuple
 
 from django.conf import settings
-from django.db.models import F, Sum
+from django.db.models import F, Q, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
@@ -175,8 +175,38 @@ def reserve_stocks(
 
     if reservations:
         if replace:
-            Reservation.objects.filter(checkout_line__in=checkout_lines).delete()
-        Reservation.objects.bulk_create(reservations)
+            _delete_stale_reservations(
+                Reservation.objects.filter(checkout_line__in=checkout_lines),
+                reservations,
+                "stock_id",
+            )
+        Reservation.objects.bulk_create(
+            reservations,
+            update_conflicts=True,
+            unique_fields=["checkout_line", "stock"],
+            update_fields=["quantity_reserved", "reserved_until"],
+        )
+
+
+def _delete_stale_reservations(
+    reservations_qs, new_reservations: list, target_field: str
+):
+    """Delete reservations of the lines that are not going to be upserted.
+
+    Reservations are upserted by the line and the reserved target, so only rows for
+    targets that are no longer reserved for the line need to be deleted.
+    """
+    line_to_targets: dict[int, list[int]] = defaultdict(list)
+    for reservation in new_reservations:
+        line_to_targets[reservation.checkout_line_id].append(
+            getattr(reservation, target_field)
+        )
+    lookup = Q()
+    for line_id, target_ids in line_to_targets.items():
+        lookup |= Q(checkout_line_id=line_id) & ~Q(
+            **{f"{target_field}__in": target_ids}
+        )
+    reservations_qs.filter(lookup).delete()
 
 
 def _create_stock_reservations(
@@ -311,12 +341,21 @@ def reserve_preorders(
     if insufficient_stocks:
         raise InsufficientStock(insufficient_stocks)
 
-    if reservation:
+    if reservations:
         if replace:
-            PreorderReservation.objects.filter(
-                checkout_line__in=checkout_lines_to_reserve
-            ).delete()
-        PreorderReservation.objects.bulk_create(reservations)
+            _delete_stale_reservations(
+                PreorderReservation.objects.filter(
+                    checkout_line__in=checkout_lines_to_reserve
+                ),
+                reservations,
+                "product_variant_channel_listing_id",
+            )
+        PreorderReservation.objects.bulk_create(
+            reservations,
+            update_conflicts=True,
+            unique_fields=["checkout_line", "product_variant_channel_listing"],
+            update_fields=["quantity_reserved", "reserved_until"],
+        )
 
 
 def _create_preorder_reservation(
@@ -10,6 +10,8 @@ from .models import Allocation, PreorderReservation, Reservation, Stock
 
 task_logger = get_task_logger(__name__)
 
+EXPIRED_RESERVATIONS_BATCH_SIZE = 1000
+
 
 @app.task
 @allow_writer()
@@ -22,15 +24,31 @@ def delete_empty_allocations_task():
         task_logger.debug("Removed %s allocations", count)
 
 
+def _delete_expired_reservations_batch(model, now) -> int:
+    """Delete the oldest batch of reservations expired before `now`."""
+    ids = list(
+        model.objects.filter(reserved_until__lt=now)
+        .order_by("reserved_until")
+        .values_list("pk", flat=True)[:EXPIRED_RESERVATIONS_BATCH_SIZE]
+    )
+    if not ids:
+        return 0
+    qs = model.objects.filter(pk__in=ids)
+    return qs._raw_delete(qs.db)  # type: ignore[attr-defined] # raw access # noqa: E501
+
+
 @app.task
 @allow_writer()
 def delete_expired_reservations_task():
-    stock_reservations, _ = Reservation.objects.filter(
-        reserved_until__lt=timezone.now()
-    ).delete()
-    preorder_reservations, _ = PreorderReservation.objects.filter(
-        reserved_until__lt=timezone.now()
-    ).delete()
+    """Delete expired reservations in batches, oldest first.
+
+    Expired reservations are skipped by the availability queries anyway; deleting
+    them frequently keeps those queries from scanning through the expired rows.
+    The task re-enqueues itself until no expired reservations are left.
+    """
+    now = timezone.now()
+    stock_reservations = _delete_expired_reservations_batch(Reservation, now)
+    preorder_reservations = _delete_expired_reservations_batch(PreorderReservation, now)
 
     if stock_reservations or preorder_reservations:
         task_logger.debug(
@@ -38,6 +56,11 @@ def delete_expired_reservations_task():
             stock_reservations,
             preorder_reservations,
         )
+    if (
+        stock_reservations == EXPIRED_RESERVATIONS_BATCH_SIZE
+        or preorder_reservations == EXPIRED_RESERVATIONS_BATCH_SIZE
+    ):
+        delete_expired_reservations_task.delay()
 
 
 @app.task
@@ -0,0 +1,78 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+from django.db import connections
+from django.db.models import Sum
+
+from ...core.exceptions import InsufficientStock
+from ...order.fetch import OrderLineInfo
+from ...order.models import OrderLine
+from ...plugins.manager import get_plugins_manager
+from ..management import allocate_stocks
+from ..models import Allocation
+
+COUNTRY_CODE = "US"
+HOT_VARIANT_QUANTITY = 20
+CONCURRENT_CHECKOUTS = 60
+WORKERS = 12
+
+
+def _allocate_single_item(line, channel):
+    try:
+        allocate_stocks(
+            [OrderLineInfo(line=line, variant=line.variant, quantity=1)],
+            COUNTRY_CODE,
+            channel,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+    except InsufficientStock:
+        return False
+    finally:
+        connections.close_all()
+    return True
+
+
+@pytest.mark.parametrize("conditional_updates", [False, True])
+@pytest.mark.django_db(transaction=True)
+def test_allocate_stocks_hot_variant_drop(
+    conditional_updates, order_line, stock, channel_USD, settings, record_property
+):
+    """Simulate a drop: many concurrent checkouts allocating the same variant.
+
+    The elapsed time is recorded as a test property to compare both allocation
+    modes, e.g. with `--junitxml`.
+    """
+    # given
+    settings.ALLOCATE_STOCKS_WITH_CONDITIONAL_UPDATES = conditional_updates
+    stock.quantity = HOT_VARIANT_QUANTITY
+    stock.quantity_allocated = 0
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    lines = [order_line]
+    for _ in range(CONCURRENT_CHECKOUTS - 1):
+        line = OrderLine.objects.get(pk=order_line.pk)
+        line.pk = None
+        line.save()
+        lines.append(line)
+
+    # when
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=WORKERS) as executor:
+        results = list(
+            executor.map(partial(_allocate_single_item, channel=channel_USD), lines)
+        )
+    elapsed = time.monotonic() - start
+    record_property("allocations_per_second", CONCURRENT_CHECKOUTS / elapsed)
+
+    # then
+    assert results.count(True) == HOT_VARIANT_QUANTITY
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == HOT_VARIANT_QUANTITY
+    assert (
+        Allocation.objects.filter(stock=stock).aggregate(
+            total=Sum("quantity_allocated")
+        )["total"]
+        == HOT_VARIANT_QUANTITY
+    )
@@ -1,7 +1,8 @@
 from unittest import mock
 
 import pytest
-from django.db.models import Sum
+from django.core.management import call_command
+from django.db.models import F, Sum
 from django.db.models.functions import Coalesce
 
 from ...channel import AllocationStrategy
@@ -9,8 +10,11 @@ from ...core.exceptions import InsufficientStock
 from ...order.fetch import OrderLineInfo
 from ...order.models import OrderLine
 from ...plugins.manager import get_plugins_manager
+from ...product.models import ProductVariant
+from ...tests import race_condition
 from ...warehouse.models import Stock
 from ..management import (
+    _increase_quantity_allocated_if_available,
     allocate_preorders,
     allocate_stocks,
     deallocate_stock,
@@ -18,6 +22,7 @@ from ..management import (
     decrease_stock,
     increase_allocations,
     increase_stock,
+    sync_stocks,
 )
 from ..models import Allocation, ChannelWarehouse, PreorderAllocation
 
@@ -474,6 +479,141 @@ def test_allocate_stock_insufficient_stocks_for_multiple_lines(
     ).exists()
 
 
+def test_allocate_stocks_with_conditional_updates(
+    order_line, stock, channel_USD, settings
+):
+    # given
+    settings.ALLOCATE_STOCKS_WITH_CONDITIONAL_UPDATES = True
+    stock.quantity = 100
+    stock.quantity_allocated = 10
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD,
+        manager=get_plugins_manager(allow_replica=False),
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 60
+    allocation = Allocation.objects.get(order_line=order_line, stock=stock)
+    assert allocation.quantity_allocated == 50
+
+
+def test_allocate_stocks_with_conditional_updates_insufficient_stock(
+    order_line, stock, channel_USD, settings
+):
+    # given
+    settings.ALLOCATE_STOCKS_WITH_CONDITIONAL_UPDATES = True
+    stock.quantity = 100
+    stock.quantity_allocated = 60
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    with pytest.raises(InsufficientStock) as exc:
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    [insufficient_stock_data] = exc.value.items
+    assert insufficient_stock_data.available_quantity == 40
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 60
+    assert not Allocation.objects.filter(order_line=order_line).exists()
+
+
+def test_allocate_stocks_with_conditional_updates_locks_stocks_in_pk_order(
+    order_line, variant_with_many_stocks, channel_USD, settings
+):
+    # given
+    settings.ALLOCATE_STOCKS_WITH_CONDITIONAL_UPDATES = True
+    channel_USD.allocation_strategy = AllocationStrategy.PRIORITIZE_HIGH_STOCK
+    channel_USD.save(update_fields=["allocation_strategy"])
+    stock_1, stock_2 = variant_with_many_stocks.stocks.order_by("pk")
+    stock_2.quantity = 10
+    stock_2.save(update_fields=["quantity"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=12)
+
+    # when
+    with mock.patch(
+        "saleor.warehouse.management._increase_quantity_allocated_if_available",
+        wraps=_increase_quantity_allocated_if_available,
+    ) as increase_quantity_allocated_mock:
+        allocate_stocks(
+            [line_data],
+            COUNTRY_CODE,
+            channel_USD,
+            manager=get_plugins_manager(allow_replica=False),
+        )
+
+    # then
+    assert [
+        call.args[0] for call in increase_quantity_allocated_mock.call_args_list
+    ] == [stock_1.pk, stock_2.pk]
+    allocations = Allocation.objects.filter(order_line=order_line)
+    assert {
+        allocation.stock_id: allocation.quantity_allocated for allocation in allocations
+    } == {stock_1.pk: 2, stock_2.pk: 10}
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_with_conditional_updates_stock_allocated_in_meantime(
+    mocked_out_of_stock,
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    settings.ALLOCATE_STOCKS_WITH_CONDITIONAL_UPDATES = True
+    stock_1, stock_2 = variant_with_many_stocks.stocks.order_by("-quantity")
+    assert (stock_1.quantity, stock_2.quantity) == (4, 3)
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=5)
+
+    def allocate_in_meantime(*args, **kwargs):
+        Stock.objects.filter(pk=stock_1.pk).update(
+            quantity_allocated=F("quantity_allocated") + 2
+        )
+
+    # when
+    with race_condition.RunBefore(
+        "saleor.warehouse.management._increase_quantity_allocated_if_available",
+        allocate_in_meantime,
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            allocate_stocks(
+                [line_data],
+                COUNTRY_CODE,
+                channel_USD,
+                manager=get_plugins_manager(allow_replica=False),
+            )
+
+    # then
+    stock_1.refresh_from_db()
+    stock_2.refresh_from_db()
+    assert stock_1.quantity_allocated == 4
+    assert stock_2.quantity_allocated == 3
+    allocations = Allocation.objects.filter(order_line=order_line)
+    assert {
+        allocation.stock_id: allocation.quantity_allocated for allocation in allocations
+    } == {stock_1.pk: 2, stock_2.pk: 3}
+    assert mocked_out_of_stock.call_count == 2
+
+
 def test_deallocate_stock(allocation):
     stock = allocation.stock
     stock.quantity = 100
@@ -1248,3 +1388,92 @@ def test_allocate_preorders_with_global_reservations(
         check_reservations=True,
         checkout_lines=[checkout_line_with_reserved_preorder_item],
     )
+
+
+def test_sync_stocks(
+    variant_with_many_stocks,
+    warehouses_with_shipping_zone,
+    django_capture_on_commit_callbacks,
+):
+    # given
+    variant = variant_with_many_stocks
+    warehouse_1, warehouse_2 = warehouses_with_shipping_zone
+    stock_1 = variant.stocks.get(warehouse=warehouse_1)
+    stock_2 = variant.stocks.get(warehouse=warehouse_2)
+    stock_2.quantity_allocated = stock_2.quantity
+    stock_2.save(update_fields=["quantity_allocated"])
+    new_variant = ProductVariant.objects.create(product=variant.product, sku="NEW_SKU")
+    manager = mock.Mock()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True):
+        result = sync_stocks(
+            [
+                (variant.sku, warehouse_1.slug, 0),
+                (variant.sku, warehouse_2.slug, 5),
+                (new_variant.sku, warehouse_1.slug, 10),
+                (new_variant.sku, warehouse_2.slug, 0),
+                ("MISSING_SKU", warehouse_1.slug, 1),
+            ],
+            manager,
+        )
+
+    # then
+    assert result.created == 2
+    assert result.updated == 2
+    assert result.not_found == [("MISSING_SKU", warehouse_1.slug)]
+    stock_1.refresh_from_db()
+    stock_2.refresh_from_db()
+    assert stock_1.quantity == 0
+    assert stock_2.quantity == 5
+    new_stock_1 = new_variant.stocks.get(warehouse=warehouse_1)
+    assert new_stock_1.quantity == 10
+    assert new_variant.stocks.get(warehouse=warehouse_2).quantity == 0
+
+    manager.product_variant_stocks_updated.assert_called_once()
+    assert len(manager.product_variant_stocks_updated.call_args.args[0]) == 4
+    assert {
+        stock.pk for (stock,), _ in manager.product_variant_back_in_stock.call_args_list
+    } == {stock_2.pk, new_stock_1.pk}
+    manager.product_variant_out_of_stock.assert_called_once_with(stock_1)
+
+
+def test_sync_stocks_unchanged_snapshot(
+    variant_with_many_stocks, django_capture_on_commit_callbacks
+):
+    # given
+    snapshot = [
+        (stock.product_variant.sku, stock.warehouse.slug, stock.quantity)
+        for stock in variant_with_many_stocks.stocks.select_related(
+            "product_variant", "warehouse"
+        )
+    ]
+    manager = mock.Mock()
+
+    # when
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        result = sync_stocks(snapshot, manager)
+
+    # then
+    assert result.created == 0
+    assert result.updated == 0
+    assert not callbacks
+    manager.product_variant_stocks_updated.assert_not_called()
+
+
+def test_sync_stocks_command(variant_with_many_stocks, tmp_path):
+    # given
+    stock = variant_with_many_stocks.stocks.first()
+    new_quantity = stock.quantity + 1
+    path = tmp_path / "stocks.csv"
+    path.write_text(
+        "sku,warehouse,quantity\n"
+        f"{variant_with_many_stocks.sku},{stock.warehouse.slug},{new_quantity}\n"
+    )
+
+    # when
+    call_command("sync_stocks", str(path))
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity == new_quantity
@@ -177,9 +177,10 @@ def test_multiple_stocks_reserved_if_single_stock_is_not_enough_sorting_order_st
     assert reservation.reserved_until > timezone.now() + datetime.timedelta(minutes=1)
 
 
-def test_stocks_reservation_removes_previous_reservations_for_checkout(
+def test_stocks_reservation_updates_previous_reservations_for_checkout(
     checkout_line, channel_USD
 ):
+    # given
     checkout_line.quantity = 5
     checkout_line.save()
 
@@ -190,10 +191,57 @@ def test_stocks_reservation_removes_previous_reservations_for_checkout(
     previous_reservation = Reservation.objects.create(
         checkout_line=checkout_line,
         stock=stock,
+        quantity_reserved=3,
+        reserved_until=timezone.now() + datetime.timedelta(hours=1),
+    )
+    reserved_until = timezone.now() + datetime.timedelta(minutes=RESERVATION_LENGTH)
+
+    # when
+    reserve_stocks(
+        [checkout_line],
+        [checkout_line.variant],
+        COUNTRY_CODE,
+        channel_USD,
+        reserved_until,
+    )
+
+    # then
+    reservation = Reservation.objects.get(checkout_line=checkout_line)
+    assert reservation.pk == previous_reservation.pk
+    assert reservation.quantity_reserved == 5
+    assert reservation.reserved_until == reserved_until
+
+
+def test_stocks_reservation_removes_previous_reservations_in_other_stocks(
+    checkout_line, warehouse, channel_USD
+):
+    # given
+    checkout_line.quantity = 5
+    checkout_line.save()
+
+    stock = Stock.objects.get(product_variant=checkout_line.variant)
+    stock.quantity = 10
+    stock.save(update_fields=["quantity"])
+
+    secondary_warehouse = Warehouse.objects.create(
+        address=warehouse.address,
+        name="Warehouse 2",
+        slug="warehouse-2",
+        email=warehouse.email,
+    )
+    secondary_stock = Stock.objects.create(
+        warehouse=secondary_warehouse,
+        product_variant=checkout_line.variant,
+        quantity=0,
+    )
+    previous_reservation = Reservation.objects.create(
+        checkout_line=checkout_line,
+        stock=secondary_stock,
         quantity_reserved=5,
         reserved_until=timezone.now() + datetime.timedelta(hours=1),
     )
 
+    # when
     reserve_stocks(
         [checkout_line],
         [checkout_line.variant],
@@ -202,8 +250,12 @@ def test_stocks_reservation_removes_previous_reservations_for_checkout(
         timezone.now() + datetime.timedelta(minutes=RESERVATION_LENGTH),
     )
 
+    # then
     with pytest.raises(Reservation.DoesNotExist):
         previous_reservation.refresh_from_db()
+    reservation = Reservation.objects.get(checkout_line=checkout_line)
+    assert reservation.stock == stock
+    assert reservation.quantity_reserved == 5
 
 
 def test_stock_reservation_fails_if_there_is_not_enough_stock_available(
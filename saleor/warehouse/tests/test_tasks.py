@@ -1,4 +1,5 @@
 import datetime
+from unittest.mock import patch
 
 import pytest
 from django.utils import timezone
@@ -35,6 +36,27 @@ def test_delete_expired_reservations_task_deletes_expired_stock_reservations(
     assert not Reservation.objects.exists()
 
 
+@patch("saleor.warehouse.tasks.delete_expired_reservations_task.delay")
+@patch("saleor.warehouse.tasks.EXPIRED_RESERVATIONS_BATCH_SIZE", 1)
+def test_delete_expired_reservations_task_deletes_in_batches(
+    mocked_delay,
+    checkout_line_with_reservation_in_many_stocks,
+):
+    # given
+    reservations_count = Reservation.objects.count()
+    assert reservations_count > 1
+    Reservation.objects.update(
+        reserved_until=timezone.now() - datetime.timedelta(seconds=1)
+    )
+
+    # when
+    delete_expired_reservations_task()
+
+    # then
+    assert Reservation.objects.count() == reservations_count - 1
+    mocked_delay.assert_called_once_with()
+
+
 def test_delete_expired_reservations_task_skips_active_stock_reservations(
     checkout_line_with_reservation_in_many_stocks,
 ):
@@ -4,7 +4,9 @@ from unittest import mock
 import graphene
 from django.test import override_settings
 
-from .....graphql.webhook.subscription_payload import generate_payload_from_subscription
+from .....graphql.webhook.subscription_payload import (
+    generate_payload_promise_from_subscription,
+)
 from .....webhook.event_types import WebhookEventAsyncType
 from .....webhook.models import Webhook
 from ..transport import (
@@ -115,11 +117,12 @@ def test_create_deliveries_no_payload_changes_limiting_disabled(webhook_app, var
 
 @override_settings(ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS=True)
 @mock.patch(
-    "saleor.webhook.transport.asynchronous.transport.generate_payload_from_subscription",
-    wraps=generate_payload_from_subscription,
+    "saleor.graphql.webhook.subscription_payload."
+    "generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
 )
 def test_create_deliveries_reuse_request_for_webhooks(
-    mock_generate_payload_from_subscription, webhook_app, variant
+    mock_generate_payload_promise_from_subscription, webhook_app, variant
 ):
     # given
     event_type = WebhookEventAsyncType.PRODUCT_VARIANT_UPDATED
@@ -153,12 +156,41 @@ def test_create_deliveries_reuse_request_for_webhooks(
 
     # then
     assert len(event_deliveries) == 2
-    assert mock_generate_payload_from_subscription.call_count == 2
+    assert mock_generate_payload_promise_from_subscription.call_count == 2
 
-    request_1 = mock_generate_payload_from_subscription.call_args_list[0][1]["request"]
-    request_2 = mock_generate_payload_from_subscription.call_args_list[1][1]["request"]
+    call_args_list = mock_generate_payload_promise_from_subscription.call_args_list
+    request_1 = call_args_list[0].kwargs["request"]
+    request_2 = call_args_list[1].kwargs["request"]
     assert request_1 is request_2
-    assert request_1.dataloaders is request_2.dataloaders
+
+
+@mock.patch(
+    "saleor.graphql.webhook.subscription_payload."
+    "generate_payload_promise_from_subscription",
+    wraps=generate_payload_promise_from_subscription,
+)
+def test_create_deliveries_for_multiple_subscription_objects_share_request(
+    mock_generate_payload_promise_from_subscription,
+    subscription_product_updated_webhook,
+    product_list,
+):
+    # given
+    webhooks = [subscription_product_updated_webhook]
+    event_type = WebhookEventAsyncType.PRODUCT_UPDATED
+
+    # when
+    deliveries = create_deliveries_for_multiple_subscription_objects(
+        event_type, product_list, webhooks
+    )
+
+    # then
+    assert len(deliveries) == len(product_list)
+    call_args_list = mock_generate_payload_promise_from_subscription.call_args_list
+    assert [call.kwargs["subscribable_object"] for call in call_args_list] == list(
+        product_list
+    )
+    requests = {id(call.kwargs["request"]) for call in call_args_list}
+    assert len(requests) == 1
 
 
 def test_create_deliveries_for_multiple_subscription_objects(
@@ -20,10 +20,9 @@ from ....core.models import EventDelivery, EventPayload
 from ....core.tracing import webhooks_opentracing_trace
 from ....core.utils import get_domain
 from ....core.utils.url import sanitize_url_for_logging
-from ....graphql.core.dataloaders import DataLoader
 from ....graphql.webhook.subscription_payload import (
-    generate_payload_from_subscription,
     generate_payload_promise_from_subscription,
+    generate_payloads_from_subscription,
     get_pre_save_payload_key,
     initialize_request,
 )
@@ -100,79 +99,64 @@ def create_deliveries_for_multiple_subscription_objects(
     event_deliveries = []
     event_deliveries_for_bulk_update = []
 
-    for subscribable_object in subscribable_objects:
-        # Dataloaders are shared between calls to generate_payload_from_subscription to
-        # reuse their cache. This avoids unnecessary DB queries when different webhooks
-        # need to resolve the same data.
-        dataloaders: dict[str, type[DataLoader]] = {}
-
-        request = initialize_request(
-            requestor,
-            event_type in WebhookEventSyncType.ALL,
-            event_type=event_type,
-            allow_replica=allow_replica,
-            request_time=request_time,
-            dataloaders=dataloaders,
-        )
-
-        for webhook in webhooks:
-            data = generate_payload_from_subscription(
-                event_type=event_type,
-                subscribable_object=subscribable_object,
-                subscription_query=webhook.subscription_query,
-                request=request,
-                app=webhook.app,
+    payloads = generate_payloads_from_subscription(
+        event_type=event_type,
+        subscribable_objects=subscribable_objects,
+        webhooks=webhooks,
+        requestor=requestor,
+        allow_replica=allow_replica,
+        request_time=request_time,
+    )
+    for subscribable_object, webhook, data in payloads:
+        if not data:
+            logger.info(
+                "No payload was generated with subscription for event: %s",
+                event_type,
             )
+            continue
 
-            if not data:
+        if (
+            settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
+            and pre_save_payloads
+        ):
+            key = get_pre_save_payload_key(webhook, subscribable_object)
+            pre_save_payload = pre_save_payloads.get(key)
+            if pre_save_payload and pre_save_payload == data:
                 logger.info(
-                    "No payload was generated with subscription for event: %s",
+                    "[Webhook ID:%r] No data changes for event %r, skip delivery to %r",
+                    webhook.id,
                     event_type,
+                    sanitize_url_for_logging(webhook.target_url),
                 )
                 continue
 
-            if (
-                settings.ENABLE_LIMITING_WEBHOOKS_FOR_IDENTICAL_PAYLOADS
-                and pre_save_payloads
-            ):
-                key = get_pre_save_payload_key(webhook, subscribable_object)
-                pre_save_payload = pre_save_payloads.get(key)
-                if pre_save_payload and pre_save_payload == data:
-                    logger.info(
-                        "[Webhook ID:%r] No data changes for event %r, skip delivery to %r",
-                        webhook.id,
-                        event_type,
-                        sanitize_url_for_logging(webhook.target_url),
-                    )
-                    continue
+        payload_data = json.dumps({**data})
+        event_payloads_data.append(payload_data)
+        event_payload = EventPayload()
+        event_payloads.append(event_payload)
+        event_delivery = EventDelivery(
+            status=EventDeliveryStatus.PENDING,
+            event_type=event_type,
+            payload=event_payload,
+            webhook=webhook,
+        )
+        event_deliveries_for_bulk_update.append(event_delivery)
 
-            payload_data = json.dumps({**data})
-            event_payloads_data.append(payload_data)
-            event_payload = EventPayload()
-            event_payloads.append(event_payload)
-            event_delivery = EventDelivery(
-                status=EventDeliveryStatus.PENDING,
-                event_type=event_type,
-                payload=event_payload,
-                webhook=webhook,
-            )
-            event_deliveries_for_bulk_update.append(event_delivery)
-
-            if len(event_deliveries_for_bulk_update) > MAX_WEBHOOK_EVENTS_IN_DB_BULK:
-                with allow_writer():
-                    # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.
-                    with transaction.atomic():
-                        EventPayload.objects.bulk_create_with_payload_files(
-                            event_payloads, event_payloads_data
-                        )
-                        event_deliveries.extend(
-                            EventDelivery.objects.bulk_create(
-                                event_deliveries_for_bulk_update
-                            )
+        if len(event_deliveries_for_bulk_update) > MAX_WEBHOOK_EVENTS_IN_DB_BULK:
+            with allow_writer():
+                # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.
+                with transaction.atomic():
+                    EventPayload.objects.bulk_create_with_payload_files(
+                        event_payloads, event_payloads_data
+                    )
+                    event_deliveries.extend(
+                        EventDelivery.objects.bulk_create(
+                            event_deliveries_for_bulk_update
                         )
-                event_payloads = []
-                event_payloads_data = []
-                event_deliveries_for_bulk_update = []
+                    )
+            event_payloads = []
+            event_payloads_data = []
+            event_deliveries_for_bulk_update = []
 
     with allow_writer():
         # Use transaction to ensure EventPayload and EventDelivery are created together, preventing inconsistent DB state.